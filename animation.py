@@ -0,0 +1,105 @@
+"""
+Bıyık Bey'in Çilesi - Animasyon Klipleri
+Kare listeleri bir kez yüklenip isimle paylaşılır; kare seçimi simülasyon saatinden hesaplanır
+
+    - AnimationClip değiştirilemez: kareler (tuple), kare süresi (saniye), döngü veya tek seferlik
+    - Nesneler sadece klip adını ve başlangıç zamanını tutar; kare = (şimdi - başlangıç) / kare süresi
+    - Saat simülasyon adımı sayar (tamsayı); animasyon hızı adım/çizim frekansından bağımsızdır
+      ve farklar tamsayı olduğundan oyunun kaçıncı adımında olunduğu sonucu etkilemez
+
+Kullanım:
+    clip = load_clip('bomb_tick', [f'assets/game/bomb_tick_{i}.png' for i in range(1, 8)], 0.8, 1 / 6)
+    start = clock.ticks
+    image = clip.frame(clock.elapsed(start))
+"""
+
+from engine import Assets
+from settings import SIMULATION_HZ
+
+
+# Sınır karesine tam denk gelen zamanlarda kayan nokta hatası bir önceki kareyi seçtirmesin
+FRAME_EPSILON = 1e-9
+
+
+class AnimationClip:
+    """Değiştirilemez animasyon klibi - tüm nesneler aynı klibi paylaşır"""
+    
+    __slots__ = ('name', 'frames', 'frame_time', 'loop', 'fps', 'duration')
+    
+    def __init__(self, name, frames, frame_time, loop=True):
+        """
+        Parametreler:
+            name: Klip adı (kayıt anahtarı)
+            frames: Kareler (Surface listesi)
+            frame_time: Kare başına süre (saniye)
+            loop: True = sürekli döner, False = son karede kalır
+        """
+        for key, value in (('name', name), ('frames', tuple(frames)), ('frame_time', float(frame_time)),
+                           ('loop', loop), ('fps', 1.0 / frame_time),
+                           ('duration', len(frames) * frame_time)):
+            object.__setattr__(self, key, value)
+    
+    def __setattr__(self, key, value):
+        raise AttributeError(f"AnimationClip değiştirilemez: {self.name}")
+    
+    def __len__(self):
+        return len(self.frames)
+    
+    def frame_index(self, elapsed):
+        """Başlangıçtan `elapsed` saniye sonraki kare numarası"""
+        index = int(elapsed * self.fps + FRAME_EPSILON)
+        if self.loop:
+            return index % len(self.frames)
+        return min(index, len(self.frames) - 1)
+    
+    def frame(self, elapsed):
+        """Başlangıçtan `elapsed` saniye sonraki kare"""
+        return self.frames[self.frame_index(elapsed)]
+    
+    def finished(self, elapsed):
+        """Tek seferlik klip bitti mi (döngülü klip hiç bitmez)"""
+        return not self.loop and elapsed * self.fps + FRAME_EPSILON >= len(self.frames)
+
+
+class SimulationClock:
+    """Simülasyon adım sayacı - PlayingState her adımda bir ilerletir"""
+    
+    def __init__(self, step_seconds):
+        self.step_seconds = step_seconds
+        self.ticks = 0
+    
+    def advance(self, step_seconds):
+        """Bir adım ilerle (step_seconds: adım süresi, replay farklı frekansta olabilir)"""
+        self.step_seconds = step_seconds
+        self.ticks += 1
+    
+    def elapsed(self, start):
+        """`start` adımından bu yana geçen simülasyon süresi (saniye)"""
+        return (self.ticks - start) * self.step_seconds
+
+
+# Oyunun simülasyon saati
+clock = SimulationClock(1.0 / SIMULATION_HZ)
+
+# Klip adı -> AnimationClip
+_clips = {}
+
+
+def register_clip(name, frames, frame_time, loop=True):
+    """Klibi kaydet (aynı isimle kayıtlı klip varsa o döndürülür)"""
+    clip = _clips.get(name)
+    if clip is None:
+        clip = _clips[name] = AnimationClip(name, frames, frame_time, loop)
+    return clip
+
+
+def load_clip(name, paths, scale, frame_time, loop=True):
+    """Kareleri bir kez yükleyip klibi kaydet (kayıtlıysa dosyalara dokunulmaz)"""
+    clip = _clips.get(name)
+    if clip is None:
+        clip = register_clip(name, [Assets.load_scaled(path, scale) for path in paths], frame_time, loop)
+    return clip
+
+
+def get_clip(name):
+    return _clips[name]
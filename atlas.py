@@ -0,0 +1,123 @@
+"""
+Bıyık Bey'in Çilesi - Sprite Atlas Oluşturucu
+Oyun sırasında kullanılan tüm kareleri son ölçekleriyle birkaç atlas sayfasında toplar
+
+Çıktı (settings.ATLAS_DIR, git'e eklenmez):
+    atlas_0.png, atlas_1.png ...  - Atlas sayfaları
+    atlas.json                    - Sprite konumları ve kaynak dosya zamanları
+
+Assets.load_scaled atlas'ta bulunan görselleri subsurface olarak verir;
+atlas yoksa veya kaynaklardan eskiyse tek tek dosya yüklemeye döner.
+
+Kullanım:
+    python atlas.py
+"""
+
+import os
+import json
+import pygame
+from settings import *
+
+
+def _load_frames(sprites):
+    """(yol, ölçek) listesini Assets.load_scaled ile aynı şekilde ölçekleyerek yükle"""
+    frames = {}
+    for path, scale in sprites:
+        key = f"{path}_x{scale}"  # Assets.load_scaled ile aynı anahtar
+        if key in frames:
+            continue
+        img = pygame.image.load(path).convert_alpha()
+        w, h = int(img.get_width() * scale), int(img.get_height() * scale)
+        frames[key] = pygame.transform.scale(img, (w, h))
+    return frames
+
+
+def pack(sizes, page_size=ATLAS_PAGE_SIZE, padding=ATLAS_PADDING):
+    """
+    Raf (shelf) yöntemiyle dikdörtgenleri sayfalara yerleştir
+    
+    Parametreler:
+        sizes: {anahtar: (genişlik, yükseklik)}
+    
+    Döndürür:
+        ({anahtar: (sayfa, x, y)}, [(sayfa genişliği, sayfa yüksekliği), ...])
+    """
+    placements = {}
+    pages = []
+    page = -1
+    x = y = shelf_height = page_width = 0
+    
+    # Uzundan kısaya - raflar daha az boşluk bırakır
+    for key in sorted(sizes, key=lambda k: (-sizes[k][1], -sizes[k][0], k)):
+        w, h = sizes[key]
+        if w + padding > page_size or h + padding > page_size:
+            raise ValueError(f"Sprite atlas sayfasına sığmıyor: {key} ({w}x{h})")
+        
+        if page >= 0 and x + w + padding > page_size:
+            # Yeni raf
+            y += shelf_height
+            x = shelf_height = 0
+        if page < 0 or y + h + padding > page_size:
+            # Yeni sayfa
+            if page >= 0:
+                pages.append((page_width, y + shelf_height))
+            page += 1
+            x = y = shelf_height = page_width = 0
+        
+        placements[key] = (page, x, y)
+        x += w + padding
+        shelf_height = max(shelf_height, h + padding)
+        page_width = max(page_width, x)
+    
+    if page >= 0:
+        pages.append((page_width, y + shelf_height))
+    return placements, pages
+
+
+def build_atlas(out_dir=ATLAS_DIR):
+    """Atlas sayfalarını ve indeksi yaz, indeksi döndür"""
+    from engine import Assets
+    
+    sprites = Assets.game_sprites()
+    frames = _load_frames(sprites)
+    placements, page_sizes = pack({key: surf.get_size() for key, surf in frames.items()})
+    
+    pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+    index = {
+        'version': ATLAS_VERSION,
+        'pages': [],
+        'sprites': {},
+        'sources': {path: os.path.getmtime(path) for path, _ in sprites},
+    }
+    
+    for key, (page, x, y) in placements.items():
+        surf = frames[key]
+        pages[page].blit(surf, (x, y))
+        index['sprites'][key] = [page, x, y, surf.get_width(), surf.get_height()]
+    
+    os.makedirs(out_dir, exist_ok=True)
+    for i, page in enumerate(pages):
+        name = f"atlas_{i}.png"
+        pygame.image.save(page, os.path.join(out_dir, name))
+        index['pages'].append(name)
+    
+    with open(os.path.join(out_dir, ATLAS_INDEX_FILE), 'w') as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    return index
+
+
+def main():
+    # Ekran açmadan convert_alpha kullanabilmek için - sadece komut satırından çalışınca
+    # (modül import edildiğinde oyunun video sürücüsü değişmesin)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    
+    index = build_atlas()
+    print(f"{len(index['sprites'])} sprite, {len(index['pages'])} sayfa -> {ATLAS_DIR}")
+    
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Bıyık Bey'in Çilesi - Ses Gecikmesi Ölçümü
+Her buffer boyutu için ses cihazını açar; çal isteğinden sesin çıkışa ulaşmasına kadar geçen
+süreyi ve buffer'ın zamanında doldurulamadığı (underrun) durumları ölçer
+
+Ölçüm:
+    - Ana thread rastgele aralıklarla "çal" isteği bırakır (oyundaki play_sound gibi)
+    - İstek, cihazın bir sonraki buffer isteğinde karşılanır; o buffer, çalmakta olan buffer
+      bittikten sonra duyulur. Gecikme = isteğin beklediği süre + bir buffer süresi
+    - Cihaz iki buffer isteği arasında buffer süresinin UNDERRUN_FACTOR katından fazla beklerse
+      çıkış boşalmış sayılır (underrun)
+
+Sınırlar:
+    - Ölçüm pygame.mixer üzerinden değil, pygame._sdl2.audio (pygame'in özel, belgelenmemiş
+      modülü) ile ayrıca açılan bir SDL ses cihazında yapılır. Mixer'ın kendi karıştırma işi ve
+      kanal kuyruğu ölçüme girmez; sonuç aynı buffer boyutunda cihazın alt sınırıdır
+    - Ölçüm sırasında mixer açık olmamalıdır (aynı cihazı iki kez açmak sürücüye bağlıdır)
+
+Kullanım:
+    python audio_latency.py                          # AUDIO_LATENCY_BUFFERS boyutları
+    python audio_latency.py --buffers 256,512 --seconds 5 --output gecikme.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import pygame
+from pygame._sdl2 import audio as sdl2_audio
+from pygame._sdl2 import sdl2
+from settings import *
+
+
+# İki buffer isteği arası bu kat aşılırsa underrun sayılır
+UNDERRUN_FACTOR = 1.5
+
+
+def _percentile(ordered, p):
+    index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class LatencyProbe:
+    """Tek buffer boyutu için cihaz callback zamanlarını kaydeder"""
+    
+    def __init__(self, buffer, frequency, channels, device=None):
+        self.requested_buffer = buffer
+        self.callbacks = []
+        self.latencies = []
+        self._request_time = None
+        
+        if device is None:
+            names = sdl2_audio.get_audio_device_names(False)
+            device = names[0] if names else ''
+        self.device = sdl2_audio.AudioDevice(device, False, frequency, sdl2_audio.AUDIO_S16,
+                                             channels, buffer, 0, self._callback)
+        # Cihaz farklı değerlerle açılabilir (allowed_changes=0 olsa da sürücüye bağlı)
+        self.frequency = self.device.frequency
+        self.buffer = self.device.chunksize
+        self.buffer_seconds = self.buffer / self.frequency
+    
+    def _callback(self, device, memory):
+        """Ses thread'i: buffer istendi - sessizlikle doldur, bekleyen isteği karşıla"""
+        now = time.perf_counter()
+        self.callbacks.append(now)
+        if self._request_time is not None:
+            self.latencies.append(now - self._request_time + self.buffer_seconds)
+            self._request_time = None
+        memory[:] = bytes(len(memory))
+    
+    def run(self, seconds, rng):
+        """Cihazı `seconds` saniye çalıştır, bu sırada rastgele çal istekleri bırak"""
+        self.device.pause(0)
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            if self._request_time is None:
+                self._request_time = time.perf_counter()
+            time.sleep(rng.uniform(0.005, 0.03))
+        self.device.pause(1)
+        self.device.close()
+    
+    def result(self):
+        intervals = [b - a for a, b in zip(self.callbacks, self.callbacks[1:])]
+        underruns = sum(1 for gap in intervals if gap > self.buffer_seconds * UNDERRUN_FACTOR)
+        latencies = sorted(latency * 1000 for latency in self.latencies)
+        result = {
+            'buffer': self.buffer,
+            'requested_buffer': self.requested_buffer,
+            'frequency': self.frequency,
+            'buffer_ms': self.buffer_seconds * 1000,
+            'callbacks': len(self.callbacks),
+            'underruns': underruns,
+            'max_callback_gap_ms': max(intervals) * 1000 if intervals else None,
+            'latency_ms': None,
+        }
+        if latencies:
+            result['latency_ms'] = {
+                'p50': _percentile(latencies, 50),
+                'p95': _percentile(latencies, 95),
+                'max': latencies[-1],
+            }
+        return result
+
+
+def measure(buffers, seconds=AUDIO_LATENCY_SECONDS, frequency=44100, channels=2, seed=0):
+    """Her buffer boyutunu sırayla ölç, sonuç listesini döndür"""
+    sdl2.init_subsystem(sdl2.INIT_AUDIO)
+    rng = random.Random(seed)
+    results = []
+    for buffer in buffers:
+        probe = LatencyProbe(buffer, frequency, channels)
+        probe.run(seconds, rng)
+        results.append(probe.result())
+    return results
+
+
+def smallest_stable(results):
+    """Underrun olmayan en küçük buffer (yoksa None)"""
+    stable = [r for r in results if r['underruns'] == 0 and r['callbacks'] > 1]
+    return min(stable, key=lambda r: r['buffer'])['buffer'] if stable else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Buffer boyutu başına ses gecikmesi ve underrun ölçümü")
+    parser.add_argument('--buffers', default=','.join(str(b) for b in AUDIO_LATENCY_BUFFERS),
+                        help="Virgülle ayrılmış buffer boyutları (örnek sayısı)")
+    parser.add_argument('--seconds', type=float, default=AUDIO_LATENCY_SECONDS,
+                        help="Buffer başına ölçüm süresi (saniye)")
+    parser.add_argument('--frequency', type=int, default=44100, help="Örnekleme frekansı")
+    parser.add_argument('--channels', type=int, default=2, help="Kanal sayısı (1 = mono, 2 = stereo)")
+    parser.add_argument('--output', help="JSON sonucun yazılacağı dosya")
+    args = parser.parse_args()
+    
+    buffers = [int(b) for b in args.buffers.split(',') if b.strip()]
+    try:
+        results = measure(buffers, args.seconds, args.frequency, args.channels)
+    except (pygame.error, sdl2.error) as e:
+        print(f"Ses cihazı açılamadı: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    print("Not: ayrı açılan SDL ses cihazında ölçüldü (pygame._sdl2.audio), mixer kanalı ölçüme dahil değil")
+    print(f"{'buffer':>7} {'süre':>7} {'p50':>7} {'p95':>7} {'maks':>7} {'underrun':>9}")
+    for r in results:
+        latency = r['latency_ms'] or {'p50': 0, 'p95': 0, 'max': 0}
+        print(f"{r['buffer']:>7} {r['buffer_ms']:>6.1f}  {latency['p50']:>6.1f}  {latency['p95']:>6.1f}  "
+              f"{latency['max']:>6.1f}  {r['underruns']:>8}")
+    
+    best = smallest_stable(results)
+    if best is None:
+        print("Hiçbir buffer boyutu underrun'sız çalışmadı")
+    else:
+        print(f"En küçük kararlı buffer: {best} (settings.AUDIO_PROFILES içinde kullanın)")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'results': results, 'smallest_stable_buffer': best,
+                       'method': 'sdl2_audio_device'}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
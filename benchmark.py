@@ -0,0 +1,234 @@
+"""
+Bıyık Bey'in Çilesi - Benchmark
+Belirli sayıda nesne içeren sahnelerde update, çarpışma ve çizim maliyetini ölçer
+
+Kullanım:
+    python benchmark.py                                   # Varsayılan senaryolar (10, 100, 1000, 10000)
+    python benchmark.py --counts 100,1000 --output sonuc.json
+    python benchmark.py --baseline onceki.json            # Yavaşlama varsa çıkış kodu 1
+"""
+
+import os
+
+# SDL sürücüleri pygame import edilmeden önce seçilmeli
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import pygame
+from headless import HeadlessEngine
+from settings import *
+
+
+def _stats(samples):
+    """Milisaniye cinsinden örneklerin özeti"""
+    ordered = sorted(samples)
+    
+    def percentile(p):
+        index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+        return ordered[index]
+    
+    return {
+        'mean': sum(ordered) / len(ordered),
+        'p50': percentile(50),
+        'p95': percentile(95),
+        'max': ordered[-1],
+    }
+
+
+class BenchmarkScene:
+    """PlayingState ile aynı yapıda, nesne sayısı sabit tutulan test sahnesi"""
+    
+    TYPES = ('bomb', 'jilet', 'terlik', 'buff')
+    
+    def __init__(self, engine, entity_count, seed=0):
+        """
+        Parametreler:
+            engine: HeadlessEngine
+            entity_count: Toplam nesne sayısı (türler arasında eşit bölünür)
+            seed: Konumlar için seed
+        """
+        from states import PlayingState
+        
+        self.engine = engine
+        self.width = engine.screen_width
+        self.height = engine.screen_height
+        self.rng = random.Random(seed)
+        
+        self.state = PlayingState(engine, 1, seed)
+        self.state.waiting_for_start = False
+        self.state.player.god_mode = True  # Çarpışmalar nesneleri silmesin
+        self.buffs = []  # (tür, buff)
+        
+        # Türlere eşit dağıt (kalan ilk türlere)
+        base, extra = divmod(entity_count, len(self.TYPES))
+        self.targets = {
+            kind: base + (1 if i < extra else 0)
+            for i, kind in enumerate(self.TYPES)
+        }
+        self.refill()
+    
+    def _random_point(self):
+        return (self.rng.randint(0, self.width), self.rng.randint(0, self.height))
+    
+    def _make_bomb(self):
+        fuse = self.rng.uniform(MIN_BOMB_FUSE_TIME, BOMB_FUSE_TIME)
+        bomb = self.state.spawn_manager.bomb_pool.acquire(*self._random_point(), fuse)
+        bomb.elapsed = self.rng.uniform(0, fuse)  # Patlamalar aynı karede toplanmasın
+        return bomb
+    
+    def _make_buff(self):
+        buff_type = self.rng.choice(('tea', 'speed_buff', 'speed_debuff'))
+        return buff_type, self.state.spawn_manager.buff_pools[buff_type].acquire(*self._random_point(), self.rng)
+    
+    def refill(self):
+        """Patlayan/ekrandan çıkan nesnelerin yerine yenilerini koy (ölçüm dışı)"""
+        state = self.state
+        while len(state.bombs) < self.targets['bomb']:
+            state.bombs.add(self._make_bomb())
+        while len(state.jilets) < self.targets['jilet']:
+            state.jilets.spawn(*self._random_point())
+        while len(state.terliks) < self.targets['terlik']:
+            state.terliks.launch(state.player.rect.center, TERLIK_SPEED, self.rng)
+        while len(self.buffs) < self.targets['buff']:
+            self.buffs.append(self._make_buff())
+    
+    def frame(self):
+        """Bir kare çalıştır ve (update, çarpışma, çizim) sürelerini ms olarak döndür"""
+        state = self.state
+        screen = self.engine.screen
+        dt = self.engine.sim_dt
+        player_rect = state.player.get_collision_rect()
+        
+        t0 = time.perf_counter()
+        state._update_objects(dt)
+        for buff_type, buff in list(self.buffs):
+            if not buff.update(self.width, self.height, player_rect, dt):
+                self.buffs.remove((buff_type, buff))
+                state.spawn_manager.release_buff(buff_type, buff)
+        
+        t1 = time.perf_counter()
+        state._check_collisions()
+        
+        t2 = time.perf_counter()
+        state.draw(screen)
+        for _, buff in self.buffs:
+            buff.draw(screen)
+        
+        t3 = time.perf_counter()
+        self.refill()
+        
+        return (t1 - t0) * 1000, (t2 - t1) * 1000, (t3 - t2) * 1000
+
+
+def run_scenario(engine, entity_count, frames=BENCHMARK_FRAMES, warmup=BENCHMARK_WARMUP_FRAMES, seed=0):
+    """Tek senaryoyu çalıştır ve sonuç sözlüğünü döndür"""
+    scene = BenchmarkScene(engine, entity_count, seed)
+    
+    for _ in range(warmup):
+        scene.frame()
+    
+    update, collisions, draw, total = [], [], [], []
+    for _ in range(frames):
+        u, c, d = scene.frame()
+        update.append(u)
+        collisions.append(c)
+        draw.append(d)
+        total.append(u + c + d)
+        # Olay kuyruğu dolmasın
+        pygame.event.clear()
+    
+    frame_stats = _stats(total)
+    return {
+        'entities': entity_count,
+        'counts': dict(scene.targets),
+        'update_ms': _stats(update),
+        'collisions_ms': _stats(collisions),
+        'draw_ms': _stats(draw),
+        'frame_ms': frame_stats,
+        'within_budget': frame_stats['p95'] <= FRAME_BUDGET_MS,
+    }
+
+
+def compare_with_baseline(results, baseline, tolerance=BENCHMARK_REGRESSION_TOLERANCE):
+    """
+    Ortalama kare süresini baseline ile karşılaştır
+    
+    Döndürür:
+        Yavaşlayan senaryoların listesi [(nesne sayısı, eski ms, yeni ms), ...]
+    """
+    previous = {s['entities']: s for s in baseline['scenarios']}
+    regressions = []
+    for scenario in results['scenarios']:
+        old = previous.get(scenario['entities'])
+        if old is None:
+            continue
+        old_ms = old['frame_ms']['mean']
+        new_ms = scenario['frame_ms']['mean']
+        if new_ms > old_ms * (1 + tolerance):
+            regressions.append((scenario['entities'], old_ms, new_ms))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Update/çarpışma/çizim benchmark'ı")
+    parser.add_argument('--counts', default=','.join(str(c) for c in BENCHMARK_ENTITY_COUNTS),
+                        help="Virgülle ayrılmış toplam nesne sayıları")
+    parser.add_argument('--frames', type=int, default=BENCHMARK_FRAMES, help="Ölçülen kare sayısı")
+    parser.add_argument('--warmup', type=int, default=BENCHMARK_WARMUP_FRAMES, help="Isınma kare sayısı")
+    parser.add_argument('--seed', type=int, default=0, help="Sahne seed'i")
+    parser.add_argument('--output', help="JSON sonucun yazılacağı dosya (verilmezse stdout)")
+    parser.add_argument('--baseline', help="Karşılaştırılacak önceki JSON sonuç")
+    parser.add_argument('--tolerance', type=float, default=BENCHMARK_REGRESSION_TOLERANCE,
+                        help="İzin verilen yavaşlama oranı (0.15 = %%15)")
+    args = parser.parse_args()
+    
+    counts = [int(c) for c in args.counts.split(',') if c.strip()]
+    
+    engine = HeadlessEngine()
+    results = {
+        'screen': [engine.screen_width, engine.screen_height],
+        'frames': args.frames,
+        'budget_ms': FRAME_BUDGET_MS,
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'scenarios': [],
+    }
+    
+    for count in counts:
+        scenario = run_scenario(engine, count, args.frames, args.warmup, args.seed)
+        results['scenarios'].append(scenario)
+        print(f"{count:>6} nesne: update {scenario['update_ms']['mean']:.2f} ms, "
+              f"çarpışma {scenario['collisions_ms']['mean']:.2f} ms, "
+              f"çizim {scenario['draw_ms']['mean']:.2f} ms, "
+              f"p95 kare {scenario['frame_ms']['p95']:.2f} ms", file=sys.stderr)
+    
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+    
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        for entities, old_ms, new_ms in regressions:
+            print(f"YAVAŞLAMA: {entities} nesne - {old_ms:.2f} ms -> {new_ms:.2f} ms", file=sys.stderr)
+        if regressions:
+            exit_code = 1
+    
+    pygame.quit()
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Bıyık Bey'in Çilesi - Toplu Çarpışma Kontrolü
+Oyuncunun çarpışma rect'ine karşı tüm şekilleri tek NumPy geçişinde test eder
+
+    - Rect'ler Rect.colliderect kuralıyla (kenar teması çarpışma değil, boş rect çarpışmaz)
+    - Daireler oyuncu merkezinin daireye uzaklığıyla (uzaklık <= yarıçap, Vector2.distance_to gibi)
+    - İki şekil aynı satır dizilerinde tutulur; sonuç grup başına isabet eden satır numaraları
+    - COLLISION_BATCH_MIN_SHAPES'ten az şekil varsa NumPy'nin sabit maliyeti baskın olduğu için
+      şekiller tek tek (Rect.colliderect ile) test edilir; sonuçlar aynıdır
+
+Kullanım:
+    batch = CollisionBatch()
+    batch.add_rects('jilet', left, top, width, height)
+    batch.add_circles('bomb', center_x, center_y, radius)
+    hits = batch.test(player_rect)     # {'jilet': array([...]), 'bomb': array([...])}
+"""
+
+import math
+from types import MappingProxyType
+import numpy as np
+from settings import COLLISION_BATCH_MIN_SHAPES
+
+
+class CollisionBatch:
+    """
+    Bir karelik şekil listesi - gruplar eklenir, test bir kez yapılır
+    
+    Gruplar eklendikleri haliyle tutulur; test vektörel yapılacaksa büyüyen ortak dizilere
+    yazılır (kare başına dizi oluşturulmaz).
+    Rect satırları: a, b = sol üst, c, d = genişlik, yükseklik
+    Daire satırları: a, b = merkez, c = d = yarıçap
+    """
+    
+    def __init__(self, capacity=64, min_shapes=COLLISION_BATCH_MIN_SHAPES):
+        """
+        Parametreler:
+            capacity: Başlangıç satır kapasitesi
+            min_shapes: Bu sayıdan az şekil tek tek test edilir (0 = her zaman vektörel)
+        """
+        self.min_shapes = min_shapes
+        self._rows = np.zeros((4, capacity))        # a, b, c, d
+        self._circle = np.zeros(capacity, bool)
+        self._groups = []                           # (anahtar, daire mi, a, b, c, d, ilk satır, son satır)
+        self.count = 0
+    
+    # Boş grupların sonucu (test sadece isabet olan grupları doldurur) - salt okunur, paylaşılır
+    _no_hits = MappingProxyType({})
+    
+    def clear(self):
+        self._groups.clear()
+        self.count = 0
+    
+    def _append(self, key, circle, a, b, c, d):
+        n = len(a)
+        if not n:
+            return
+        self._groups.append((key, circle, a, b, c, d, self.count, self.count + n))
+        self.count += n
+    
+    def add_rects(self, key, left, top, width, height):
+        """
+        Rect grubu ekle
+        
+        Parametreler:
+            left, top: Sol üst köşeler (dizi)
+            width, height: Boyutlar (dizi veya tüm grup için tek değer)
+        """
+        self._append(key, False, left, top, width, height)
+    
+    def add_circles(self, key, center_x, center_y, radius):
+        """
+        Daire grubu ekle
+        
+        Parametreler:
+            center_x, center_y: Merkezler (dizi)
+            radius: Yarıçaplar (dizi veya tüm grup için tek değer)
+        """
+        self._append(key, True, center_x, center_y, radius, radius)
+    
+    def test(self, rect):
+        """
+        Tüm grupları rect'e karşı test et
+        
+        Döndürür:
+            {anahtar: isabet eden satır numaraları (grup içindeki sırayla)} - isabeti olmayan
+            grup (ve boş grup) sözlükte olmayabilir, hits.get(anahtar, ()) ile okunmalı
+        """
+        n = self.count
+        if not n:
+            return self._no_hits
+        if n < self.min_shapes:
+            return self._test_each(rect)
+        a, b, c, d = self._fill(n)
+        
+        # Rect: Rect.colliderect (kenar teması çarpışma değil)
+        overlap = a < rect.right
+        overlap &= a + c > rect.left
+        overlap &= b < rect.bottom
+        overlap &= b + d > rect.top
+        if rect.width <= 0 or rect.height <= 0:
+            overlap[:] = False
+        
+        # Daire: rect merkezinin uzaklığı <= yarıçap
+        dx = a - rect.centerx
+        dx *= dx
+        dy = b - rect.centery
+        dy *= dy
+        dx += dy
+        np.sqrt(dx, out=dx)
+        hit = np.where(self._circle[:n], dx <= c, overlap)
+        
+        # İsabet yoksa (neredeyse her kare) grupları tek tek taramaya gerek yok
+        rows = np.flatnonzero(hit)
+        if not len(rows):
+            return self._no_hits
+        hits = {}
+        for key, *_, start, end in self._groups:
+            hits[key] = rows[(rows >= start) & (rows < end)] - start
+        return hits
+    
+    def _fill(self, n):
+        """Grupları ortak dizilere yaz (gerekirse büyüt), a, b, c, d satırlarını döndür"""
+        if n > len(self._circle):
+            capacity = max(n, len(self._circle) * 2)
+            self._rows = np.zeros((4, capacity))
+            self._circle = np.zeros(capacity, bool)
+        rows = self._rows
+        for key, circle, a, b, c, d, start, end in self._groups:
+            rows[0, start:end] = a
+            rows[1, start:end] = b
+            rows[2, start:end] = c
+            rows[3, start:end] = d
+            self._circle[start:end] = circle
+        return rows[:, :n]
+    
+    def _test_each(self, rect):
+        """Az şekil için tek tek test (vektörel yolla aynı kurallar)"""
+        center_x, center_y = rect.center
+        hits = {}
+        for key, circle, a, b, c, d, start, end in self._groups:
+            n = end - start
+            rows = zip(_values(a, n), _values(b, n), _values(c, n), _values(d, n))
+            if circle:
+                found = [i for i, (x, y, radius, _) in enumerate(rows)
+                         if math.sqrt((x - center_x) ** 2 + (y - center_y) ** 2) <= radius]
+            else:
+                found = [i for i, shape in enumerate(rows) if rect.colliderect(shape)]
+            if found:
+                hits[key] = found
+        return hits or self._no_hits
+
+
+def _values(column, n):
+    """Dizi, liste veya tüm grup için tek değer -> n elemanlı Python listesi"""
+    if isinstance(column, np.ndarray):
+        return column.tolist()
+    if isinstance(column, (list, tuple)):
+        return column
+    return [column] * n
@@ -0,0 +1,9 @@
+"""
+Bıyık Bey'in Çilesi - Test Ayarları
+Testler ekransız ve sessiz sürücülerle çalışır (pygame pencere/ses cihazı açmaz)
+"""
+
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
@@ -5,9 +5,26 @@ Tüm temel oyun sistemleri burada
 
 import pygame
 import sys
+import time
+import weakref
+from collections import OrderedDict
+import surface_cache
+import surface_format
+from sound_bank import SoundBank
+from voices import VoiceManager
+from music import MusicController
+from profiler import FrameProfiler
+from highscore import highscores
 from settings import *
 
 
+def interpolated_rect(rect, prev_pos, pos, alpha):
+    """Önceki ve mevcut simülasyon konumu arasındaki çizim rect'ini döndür"""
+    offset_x = (prev_pos.x - pos.x) * (1.0 - alpha)
+    offset_y = (prev_pos.y - pos.y) * (1.0 - alpha)
+    return rect.move(round(offset_x), round(offset_y))
+
+
 # =============================================================================
 # GAME STATE - Oyun Durumu Temel Sınıfı
 # =============================================================================
@@ -33,11 +50,16 @@ class GameState:
         pass
     
     def update(self, dt):
-        """Güncelle (dt = delta time)"""
+        """Bir simülasyon adımı ilerle (dt = sabit adım süresi, saniye)"""
         pass
     
     def draw(self, screen):
-        """Ekrana çiz"""
+        """
+        Ekrana çiz
+        
+        Döndürür:
+            Değişen bölgelerin listesi (display.update) veya None (tüm ekran, display.flip)
+        """
         pass
 
 
@@ -45,106 +67,468 @@ class GameState:
 # ASSET MANAGER - Görsel/Ses Yöneticisi
 # =============================================================================
 
+class AssetCache:
+    """
+    Bayt bütçeli LRU önbellek
+    
+    Bütçe aşılınca en uzun süredir kullanılmayan, sabitlenmemiş (pin) kayıtlar atılır.
+    Atılan görsel hâlâ bir nesne tarafından kullanılıyorsa bellekte kalır; sadece
+    önbellek onu tutmayı bırakır ve bir sonraki istekte yeniden üretilir.
+    """
+    
+    def __init__(self, budget_bytes=None):
+        """
+        Parametreler:
+            budget_bytes: Bellek üst sınırı (None = sınırsız)
+        """
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # anahtar -> (değer, bayt)
+        self._pinned = set()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def size_of(value):
+        """
+        Değerin tuttuğu piksel belleği (fontlar için 0, listelerde toplam)
+        
+        Subsurface'ler 0 sayılır: belleği üst yüzeye aittir ve üst yüzey (ör. atlas sayfası)
+        kendi kaydıyla bir kez sayılır.
+        """
+        if isinstance(value, list):
+            return sum(AssetCache.size_of(item) for item in value)
+        if not isinstance(value, pygame.Surface) or value.get_parent() is not None:
+            return 0
+        return value.get_bytesize() * value.get_width() * value.get_height()
+    
+    def __contains__(self, key):
+        return key in self._entries
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def get(self, key):
+        """Kayıt varsa döndür ve en yeni kullanılan yap, yoksa None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+    
+    def put(self, key, value):
+        """Kaydı ekle, gerekirse bütçeye inene kadar eski kayıtları at"""
+        if key in self._entries:
+            self.bytes -= self._entries.pop(key)[1]
+        size = self.size_of(value)
+        self._entries[key] = (value, size)
+        self.bytes += size
+        self._evict()
+    
+    def pin(self, key):
+        """Kaydı (henüz yüklenmemiş olsa da) atılmaz yap"""
+        self._pinned.add(key)
+    
+    def unpin(self, key):
+        self._pinned.discard(key)
+        self._evict()
+    
+    def _evict(self):
+        if self.budget_bytes is None or self.bytes <= self.budget_bytes:
+            return
+        for key in list(self._entries):
+            if self.bytes <= self.budget_bytes:
+                break
+            if key in self._pinned:
+                continue
+            self.bytes -= self._entries.pop(key)[1]
+            self.evictions += 1
+    
+    def stats(self):
+        """Önbellek istatistikleri"""
+        pinned_bytes = sum(size for key, (_, size) in self._entries.items() if key in self._pinned)
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'budget_bytes': self.budget_bytes,
+            'pinned_entries': sum(1 for key in self._entries if key in self._pinned),
+            'pinned_bytes': pinned_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
 class Assets:
     """Görselleri ve sesleri önbellekte tutar"""
     
-    _cache = {}
-    _preloaded = False
+    _cache = AssetCache(ASSET_CACHE_BUDGET_MB * 1024 * 1024 if ASSET_CACHE_BUDGET_MB else None)
+    _atlas = None  # Atlas'taki sprite'lar {anahtar: subsurface} (atlas.py ile üretilir)
+    _decoded = {}  # Ön yüklemede thread'lerde çözülmüş, henüz işlenmemiş kaynaklar {yol: Surface}
+    
+    # Kaynak (çözülmüş, ölçeklenmemiş) görseller - aynı dosyanın her boyutu için tekrar çözülmesin
+    _sources = {}  # yol -> (Surface, son kullanma zamanı) - SOURCE_CACHE_TTL boyunca güçlü referans
+    _weak_sources = weakref.WeakValueDictionary()  # Süresi dolmuş ama başka yerde hâlâ kullanılanlar
+    _next_source_expiry = None  # En erken son kullanma zamanı (None = tutulan kaynak yok)
+    _source_decodes = 0
+    _source_hits = 0
+    
+    # Render edilmiş yazılar - (font, yazı, renk, antialias[, gölge]) -> Surface
+    _text_cache = AssetCache(TEXT_CACHE_BUDGET_MB * 1024 * 1024 if TEXT_CACHE_BUDGET_MB else None)
+    
+    # load_* metotlarının önbellek anahtarı ekleri
+    _KEY_SUFFIXES = {
+        'load_image': '_',
+        'load_scaled': '_x',
+        'load_to_height': '_h',
+        'load_to_width': '_w',
+        'load_smooth': '_s',
+    }
     
     @classmethod
-    def preload_game_assets(cls, screen_width, screen_height):
-        """Oyun asset'lerini önceden yükle - kasma önleme"""
-        if cls._preloaded:
-            return
+    def cache_key(cls, method, path, arg=None, *extra):
+        """load_* metodunun (ad, yol, boyut/ölçek, ...) için kullandığı önbellek anahtarı"""
+        return f"{path}{cls._KEY_SUFFIXES[method]}{arg}" + ''.join(f"+{e}" for e in extra)
+    
+    @classmethod
+    def is_cached(cls, key):
+        """Anahtar bellekteki önbellekte mi (cache_key ile üretilmiş)"""
+        return key in cls._cache
+    
+    @classmethod
+    def store_decoded(cls, path, surface):
+        """Başka yerde çözülmüş kaynağı ver - dosyanın sonraki yüklemesi tekrar çözmez"""
+        cls._decoded[path] = surface
+    
+    @classmethod
+    def clear_decoded(cls):
+        """store_decoded ile verilen kaynakları bırak"""
+        cls._decoded.clear()
+    
+    @classmethod
+    def pin(cls, method, path, arg=None, *extra):
+        """Görseli önbellekte kalıcı yap (bellek bütçesi aşılsa da atılmaz)"""
+        cls._cache.pin(cls.cache_key(method, path, arg, *extra))
+    
+    @classmethod
+    def unpin(cls, method, path, arg=None, *extra):
+        cls._cache.unpin(cls.cache_key(method, path, arg, *extra))
+    
+    @classmethod
+    def pin_game_sprites(cls):
+        """Oyun kareleri sürekli kullanılır - bellek bütçesi dolsa da atılmasın"""
+        for path, scale in cls.game_sprites():
+            cls.pin('load_scaled', path, scale)
+    
+    @classmethod
+    def cache_stats(cls):
+        """Önbellek istatistikleri (kayıt, bayt, isabet/ıska, atılan kayıt sayısı)"""
+        stats = cls._cache.stats()
+        stats['source_entries'] = len(cls._sources)
+        stats['source_bytes'] = sum(AssetCache.size_of(img) for img, _ in cls._sources.values())
+        stats['source_decodes'] = cls._source_decodes
+        stats['source_hits'] = cls._source_hits
+        stats['text'] = cls._text_cache.stats()
+        return stats
+    
+    @classmethod
+    def format_report(cls):
+        """Yüklenen görseller için seçilen Surface formatları [(anahtar, format, boyut), ...]"""
+        return surface_format.report()
+    
+    @classmethod
+    def load_spec(cls, spec):
+        """('load_scaled', yol, ölçek) gibi bir tanımı yükle"""
+        method, *args = spec
+        return getattr(cls, method)(*args)
+    
+    @classmethod
+    def _source_image(cls, path):
+        """
+        Kaynak görseli ekran formatında döndür
         
-        # Oyuncu animasyonları
-        scale = 1.3
-        cls.load_scaled('assets/player/idle_stand.png', scale)
-        for dir in ['down', 'up', 'left', 'right']:
-            cls.load_scaled(f'assets/player/walk_{dir}_1.png', scale)
-            cls.load_scaled(f'assets/player/walk_{dir}_2.png', scale)
+        Aynı dosyadan farklı boyutlar istendiğinde dosya bir kez çözülür. Kaynak
+        SOURCE_CACHE_TTL saniye tutulur, sonra sadece başka bir yerde kullanılıyorsa kalır.
+        """
+        now = time.monotonic()
+        cls.expire_sources(now)
+        
+        img = cls._weak_sources.get(path)
+        if img is not None:
+            cls._source_hits += 1
+        else:
+            # Ön yüklemede çözülmüşse tekrar çözme
+            img = cls._decoded.get(path)
+            if img is None:
+                img = pygame.image.load(path)
+            img = img.convert_alpha()
+            cls._weak_sources[path] = img
+            cls._source_decodes += 1
+        
+        expires = now + SOURCE_CACHE_TTL
+        cls._sources[path] = (img, expires)
+        if cls._next_source_expiry is None or expires < cls._next_source_expiry:
+            cls._next_source_expiry = expires
+        return img
+    
+    @classmethod
+    def expire_sources(cls, now=None):
+        """
+        Süresi dolan kaynakların güçlü referansını bırak
         
-        # Oyun arka planı
-        cls.load_image('assets/game_bg.png', (screen_width, screen_height))
+        GameEngine her karede çağırır; yükleme bittikten sonra da kaynaklar SOURCE_CACHE_TTL
+        sonunda bırakılır. Süresi dolan kaynak yoksa sadece tek karşılaştırma yapılır.
+        """
+        if now is None:
+            now = time.monotonic()
+        if cls._next_source_expiry is None or now < cls._next_source_expiry:
+            return
+        for path in [path for path, (_, expires) in cls._sources.items() if expires < now]:
+            del cls._sources[path]
+        cls._next_source_expiry = min((expires for _, expires in cls._sources.values()), default=None)
+    
+    @classmethod
+    def _store(cls, key, surface):
+        """İşlenmiş görseli en hızlı çizilen formata çevirip önbelleğe al"""
+        if SURFACE_FORMAT_OPTIMIZE:
+            surface = surface_format.optimize(surface, key)
+        cls._cache.put(key, surface)
+        return surface
+    
+    @staticmethod
+    def game_sprites():
+        """Oyun sırasında load_scaled ile kullanılan (yol, ölçek) çiftleri - preload ve atlas.py için"""
+        # Oyuncu animasyonları (player.py ile aynı ölçek)
+        player_scale = 1.3
+        sprites = [('assets/player/idle_stand.png', player_scale)]
+        for dir in ['down', 'up', 'left', 'right']:
+            sprites.append((f'assets/player/walk_{dir}_1.png', player_scale))
+            sprites.append((f'assets/player/walk_{dir}_2.png', player_scale))
         
         # Çay
-        cls.load_scaled('assets/game/tea.png', 1.2)
+        sprites.append(('assets/game/tea.png', TEA_SCALE))
         
         # Bomba animasyonları
-        for i in range(1, 8):
-            cls.load_scaled(f'assets/game/bomb_tick_{i}.png', 1.3)
-        for i in range(1, 6):
-            cls.load_scaled(f'assets/game/explosion_{i}.png', 1.3 * 2)
+        sprites += [(f'assets/game/bomb_tick_{i}.png', BOMB_SCALE) for i in range(1, 8)]
+        sprites += [(f'assets/game/explosion_{i}.png', BOMB_SCALE * 2) for i in range(1, 6)]
         
         # Jilet animasyonları
-        for i in range(1, 9):
-            cls.load_scaled(f'assets/game/sinsi_jilet_{i}.png', 1.2)
+        sprites += [(f'assets/game/sinsi_jilet_{i}.png', JILET_SCALE) for i in range(1, 9)]
         
         # Terlik animasyonları
-        for i in range(1, 9):
-            cls.load_scaled(f'assets/game/ucan_terlik_{i}.png', 1.0)
+        sprites += [(f'assets/game/ucan_terlik_{i}.png', TERLIK_SCALE) for i in range(1, 9)]
         
-        # Buff/Debuff
-        cls.load_scaled('assets/game/speed_buff.png', 1.0)
-        cls.load_scaled('assets/game/speed_debuff.png', 1.0)
-        cls.load_scaled('assets/game/speed_buff.png', 0.6)
-        cls.load_scaled('assets/game/speed_debuff.png', 0.6)
+        # Buff/Debuff (haritada ve buff göstergesinde)
+        for name in ['speed_buff', 'speed_debuff']:
+            sprites.append((f'assets/game/{name}.png', BUFF_SCALE))
+            sprites.append((f'assets/game/{name}.png', 0.7))
         
         # Can göstergesi (küçültülmüş)
-        cls.load_scaled('assets/game/heart.png', 0.45)
-        cls.load_scaled('assets/game/heart_broken.png', 0.45)
+        sprites.append(('assets/game/heart.png', HEALTH_UI_HEART_SCALE))
+        sprites.append(('assets/game/heart_broken.png', HEALTH_UI_HEART_SCALE))
+        return sprites
+    
+    @classmethod
+    def _load_atlas(cls):
+        """
+        Atlas'ı bir kez yükle (atlas.py çıktısı)
+        
+        Atlas yoksa, bozuksa veya kaynak dosyalardan eskiyse boş döner;
+        bu durumda görseller tek tek dosyalardan yüklenir.
+        """
+        if cls._atlas is not None:
+            return cls._atlas
         
-        cls._preloaded = True
-        print("Oyun asset'leri önceden yüklendi!")
+        import os
+        import json
+        cls._atlas = {}
+        index_path = os.path.join(ATLAS_DIR, ATLAS_INDEX_FILE)
+        if not os.path.exists(index_path):
+            return cls._atlas
+        
+        try:
+            with open(index_path, 'r') as f:
+                index = json.load(f)
+            if index['version'] != ATLAS_VERSION:
+                return cls._atlas
+            for path, mtime in index['sources'].items():
+                if not os.path.exists(path) or os.path.getmtime(path) > mtime:
+                    print("Atlas kaynak dosyalardan eski, atlas kullanılmıyor (python atlas.py)")
+                    return cls._atlas
+            
+            pages = [pygame.image.load(os.path.join(ATLAS_DIR, name)).convert_alpha()
+                     for name in index['pages']]
+            sprites = {}
+            for key, (page, x, y, w, h) in index['sprites'].items():
+                sprites[key] = pages[page].subsurface((x, y, w, h))
+            cls._atlas = sprites
+            
+            # Subsurface'ler 0 bayt sayılır; sayfalar bütçeye bir kez, atılmaz olarak yazılır
+            # (sprite'lar sayfayı zaten bellekte tutar)
+            for name, page in zip(index['pages'], pages):
+                key = f"atlas:{name}"
+                cls._cache.pin(key)
+                cls._cache.put(key, page)
+        except (OSError, ValueError, KeyError, IndexError, pygame.error) as e:
+            print(f"Atlas yüklenemedi: {e}")
+        return cls._atlas
     
     @classmethod
     def load_image(cls, path, size=None):
         """Görsel yükle ve ölçekle"""
-        key = f"{path}_{size}"
-        if key not in cls._cache:
-            img = pygame.image.load(path).convert_alpha()
-            if size:
-                img = pygame.transform.scale(img, size)
-            cls._cache[key] = img
-        return cls._cache[key]
+        key = cls.cache_key('load_image', path, size)
+        surface = cls._cache.get(key)
+        if surface is None:
+            def process():
+                img = cls._source_image(path)
+                if size:
+                    img = pygame.transform.scale(img, size)
+                return img
+            surface = cls._store(key, surface_cache.load(path, key, process))
+        return surface
     
     @classmethod
     def load_scaled(cls, path, scale=1.0):
-        """Görseli çarpanla ölçekle"""
-        key = f"{path}_x{scale}"
-        if key not in cls._cache:
-            img = pygame.image.load(path).convert_alpha()
-            w, h = int(img.get_width() * scale), int(img.get_height() * scale)
-            cls._cache[key] = pygame.transform.scale(img, (w, h))
-        return cls._cache[key]
+        """Görseli çarpanla ölçekle (atlas'ta varsa oradan)"""
+        key = cls.cache_key('load_scaled', path, scale)
+        surface = cls._cache.get(key)
+        if surface is None:
+            # Atlas sayfaları piksel başına alfalı - subsurface'ler olduğu gibi kullanılır
+            surface = cls._load_atlas().get(key)
+            if surface is not None:
+                cls._cache.put(key, surface)
+            else:
+                def process():
+                    img = cls._source_image(path)
+                    w, h = int(img.get_width() * scale), int(img.get_height() * scale)
+                    return pygame.transform.scale(img, (w, h))
+                surface = cls._store(key, surface_cache.load(path, key, process))
+        return surface
     
     @classmethod
     def load_to_height(cls, path, height):
         """Görseli yüksekliğe göre ölçekle (oranı koru)"""
-        key = f"{path}_h{height}"
-        if key not in cls._cache:
-            img = pygame.image.load(path).convert_alpha()
-            ratio = img.get_width() / img.get_height()
-            cls._cache[key] = pygame.transform.scale(img, (int(height * ratio), height))
-        return cls._cache[key]
+        key = cls.cache_key('load_to_height', path, height)
+        surface = cls._cache.get(key)
+        if surface is None:
+            def process():
+                img = cls._source_image(path)
+                ratio = img.get_width() / img.get_height()
+                return pygame.transform.scale(img, (int(height * ratio), height))
+            surface = cls._store(key, surface_cache.load(path, key, process))
+        return surface
     
     @classmethod
     def load_to_width(cls, path, width):
         """Görseli genişliğe göre ölçekle (oranı koru)"""
-        key = f"{path}_w{width}"
-        if key not in cls._cache:
-            img = pygame.image.load(path).convert_alpha()
-            ratio = img.get_width() / img.get_height()
-            cls._cache[key] = pygame.transform.scale(img, (width, int(width / ratio)))
-        return cls._cache[key]
+        key = cls.cache_key('load_to_width', path, width)
+        surface = cls._cache.get(key)
+        if surface is None:
+            def process():
+                img = cls._source_image(path)
+                ratio = img.get_width() / img.get_height()
+                return pygame.transform.scale(img, (width, int(width / ratio)))
+            surface = cls._store(key, surface_cache.load(path, key, process))
+        return surface
+    
+    @classmethod
+    def load_smooth(cls, path, height, grow=0):
+        """
+        Görseli yüksekliğe göre smoothscale ile ölçekle (oranı koru)
+        
+        grow: Genişlik ve yüksekliğe eklenecek piksel (hover görselleri için)
+        
+        Kaynaktan ölçeklenir; format seçimi ölçeklemeden sonra yapıldığı için
+        kenarlar colorkey rengiyle karışmaz.
+        """
+        key = cls.cache_key('load_smooth', path, height, grow)
+        surface = cls._cache.get(key)
+        if surface is None:
+            def process():
+                img = cls._source_image(path)
+                ratio = img.get_width() / img.get_height()
+                return pygame.transform.smoothscale(img, (int(height * ratio) + grow, height + grow))
+            surface = cls._store(key, surface_cache.load(path, key, process))
+        return surface
     
     @classmethod
     def get_font(cls, size, name=None):
         """Font al"""
         key = f"font_{name}_{size}"
-        if key not in cls._cache:
-            cls._cache[key] = pygame.font.Font(name, size)
-        return cls._cache[key]
+        font = cls._cache.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            cls._cache.pin(key)  # Fontlar küçük ve her karede kullanılıyor
+            cls._cache.put(key, font)
+        return font
+    
+    @classmethod
+    def get_overlay(cls, size, alpha, color=BLACK):
+        """
+        Tam ekran karartma yüzeyi - boyut/alfa/renk başına bir kez oluşturulur
+        
+        Yüzey paylaşılır; çizen taraf üzerine çizmemeli veya alfasını değiştirmemeli.
+        """
+        key = f"overlay_{size[0]}x{size[1]}_{alpha}_{color}"
+        overlay = cls._cache.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(size)
+            overlay.fill(color)
+            overlay.set_alpha(alpha)
+            cls._cache.put(key, overlay)
+        return overlay
+    
+    @classmethod
+    def get_circle_ramp(cls, radius, color, max_alpha, steps):
+        """
+        Yarı saydam dolu daire kareleri (sönme efektleri için)
+        
+        i. karenin alfası max_alpha * (i + 1) / steps. Kareler piksel başına alfalı kalır
+        (colorkey + yüzey alfası bu boyutta ~12 kat yavaş çiziliyor).
+        """
+        key = f"circle_{radius}_{color}_{max_alpha}_{steps}"
+        frames = cls._cache.get(key)
+        if frames is None:
+            frames = []
+            for i in range(steps):
+                surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                alpha = round(max_alpha * (i + 1) / steps)
+                pygame.draw.circle(surface, (*color, alpha), (radius, radius), radius)
+                frames.append(surface)
+            cls._cache.put(key, frames)
+        return frames
+    
+    @classmethod
+    def render_text(cls, font, text, color, antialias=True):
+        """Font.render sonucu (önbellekli) - değişmeyen yazı her karede tekrar render edilmez"""
+        key = (font, text, tuple(color), antialias)
+        surface = cls._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, antialias, color)
+            cls._text_cache.put(key, surface)
+        return surface
+    
+    @classmethod
+    def render_shadowed(cls, font, text, color, shadow_color=BLACK, offset=2, antialias=True):
+        """
+        Gölgeli yazı: gölge (offset, offset) kaymış, yazı (0, 0)'da tek yüzeyde (önbellekli)
+        
+        Yüzey yazıdan `offset` kadar geniş/uzundur; ortalarken genişlikten offset çıkarılmalı.
+        """
+        key = (font, text, tuple(color), antialias, tuple(shadow_color), offset)
+        surface = cls._text_cache.get(key)
+        if surface is None:
+            text_surf = font.render(text, antialias, color)
+            shadow = font.render(text, antialias, shadow_color)
+            width, height = text_surf.get_size()
+            surface = pygame.Surface((width + offset, height + offset), pygame.SRCALPHA)
+            surface.blit(shadow, (offset, offset))
+            surface.blit(text_surf, (0, 0))
+            cls._text_cache.put(key, surface)
+        return surface
 
 
 # =============================================================================
@@ -155,24 +539,29 @@ class Audio:
     """Müzik ve ses efektlerini yönetir"""
     
     _volume_index = DEFAULT_VOLUME_INDEX
-    _music_state = None
-    MUSIC_END = pygame.USEREVENT + 1
-    
-    # Ses efektleri cache'i
-    _sound_cache = {}
-    _loop_sounds = {}  # Sürekli çalan sesler için
-    _active_sound_channels = {}  # Çalan seslerin kanallarını takip et
-    
-    # Çakışmaması gereken sesler (aynı anda sadece bir örnek çalabilir)
-    NON_OVERLAPPING_SOUNDS = {
-        'button_click',
-        'jilet_hit',
-        'terlik_hit',
-        'buff_tea',
-        'buff_speed_apply',
-        'debuff_speed_apply',
-        'level_complete',
-        'game_over',
+    profile = None  # Seçilen gecikme profili (pre_init)
+    MUSIC_END = pygame.USEREVENT + 1  # Müzik kanalı bitti (event.code = kanal)
+    VOICE_END = pygame.USEREVENT + 2  # Ses efekti kanalı bitti (event.code = kanal)
+    
+    # Ses efektleri arka planda çözülür, kanallar VoiceManager'dan alınır (init ile başlar)
+    _bank = None
+    _voices = None
+    _music = None
+    
+    # Ses başına (kategori, öncelik, aynı anda en fazla örnek)
+    # Tek örnekli sesler tekrar çalınınca baştan başlar (çakışmaz)
+    SOUND_VOICES = {
+        'button_click': ('ui', 1, 1),
+        'bomb_explosion': ('effects', 1, 4),
+        'jilet_hit': ('player', 2, 1),
+        'terlik_hit': ('player', 2, 1),
+        'buff_tea': ('player', 1, 1),
+        'buff_speed_apply': ('player', 1, 1),
+        'debuff_speed_apply': ('player', 1, 1),
+        'level_complete': ('critical', 3, 1),
+        'game_over': ('critical', 3, 1),
+        'buff_speed_loop': ('loop', 1, 1),
+        'debuff_speed_loop': ('loop', 1, 1),
     }
     
     # Ses dosyası yolları
@@ -191,13 +580,53 @@ class Audio:
         'debuff_speed_loop': 'assets/music/debuff_speed_loop.mp3',
     }
     
+    # Müzik parçaları
+    MUSIC_PATHS = {
+        'menu_intro': 'assets/music/menu_music_intro.mp3',
+        'menu_loop': 'assets/music/menu_music_loop.mp3',
+        'game': 'assets/music/game_music.mp3',
+    }
+    
+    @classmethod
+    def pre_init(cls, profile=AUDIO_PROFILE):
+        """Mixer ayarlarını seç (pygame.init'ten önce çağrılmalı) - settings.AUDIO_PROFILES"""
+        config = AUDIO_PROFILES[profile]
+        pygame.mixer.pre_init(config['frequency'], config['size'], config['channels'], config['buffer'])
+        cls.profile = profile
+    
     @classmethod
     def init(cls):
         """Ses sistemini başlat"""
         pygame.mixer.init()
-        pygame.mixer.music.set_endevent(cls.MUSIC_END)
-        # Ses efektleri için yeterli kanal ayarla
-        pygame.mixer.set_num_channels(16)
+        # Ses efektleri için kategorilere ayrılmış kanallar
+        cls._voices = VoiceManager(VOICE_CHANNELS, cls.VOICE_END)
+        
+        # Müzik - ses efektlerinden sonraki iki kanal, sadece kullanılan parçalar çözülür
+        tracks = ['menu_intro', 'menu_loop'] + ([GAME_MUSIC] if GAME_MUSIC else [])
+        cls._music = MusicController({name: cls.MUSIC_PATHS[name] for name in tracks},
+                                     len(cls._voices.channels), cls.MUSIC_END)
+        
+        # Ses efektlerini arka planda çöz - oyun sırasında ilk çalışta takılma olmasın
+        cls._bank = SoundBank(cls.SOUND_PATHS)
+        cls._bank.start()
+    
+    @classmethod
+    def sounds_ready(cls):
+        """Tüm ses efektleri ve müzik parçaları yüklendi mi"""
+        return all(bank.ready for bank in cls._banks())
+    
+    @classmethod
+    def sound_progress(cls):
+        """(yüklenen, toplam) ses efekti + müzik parçası sayısı"""
+        banks = cls._banks()
+        return sum(bank.done for bank in banks), sum(bank.total for bank in banks)
+    
+    @classmethod
+    def _banks(cls):
+        banks = [cls._bank] if cls._bank else []
+        if cls._music:
+            banks.append(cls._music.bank)
+        return banks
     
     @classmethod
     def get_volume(cls):
@@ -209,144 +638,196 @@ class Audio:
         """Ses seviyesini değiştir (döngüsel)"""
         cls._volume_index = (cls._volume_index + 1) % len(VOLUME_LEVELS)
         volume = cls.get_volume()
-        pygame.mixer.music.set_volume(volume)
-        # Tüm ses efektlerinin ses seviyesini güncelle
-        for sound in cls._sound_cache.values():
-            if sound:
-                sound.set_volume(volume)
+        if cls._music:
+            cls._music.set_volume(volume)
+        # Ses seviyesi kanal başına verilir - sadece çalmakta olan kanallar güncellenir
+        if cls._voices:
+            cls._voices.set_volume(volume)
         return volume
     
     @classmethod
-    def _load_sound(cls, sound_name):
-        """Ses efektini yükle ve cache'le"""
-        if sound_name not in cls._sound_cache:
-            if sound_name in cls.SOUND_PATHS:
-                import os
-                sound_path = cls.SOUND_PATHS[sound_name]
-                # Dosya yoksa sessizce None döndür (opsiyonel sesler için)
-                if not os.path.exists(sound_path):
-                    cls._sound_cache[sound_name] = None
-                    return None
-                try:
-                    sound = pygame.mixer.Sound(sound_path)
-                    sound.set_volume(cls.get_volume())
-                    cls._sound_cache[sound_name] = sound
-                except Exception as e:
-                    print(f"Ses yüklenemedi: {sound_name} - {e}")
-                    cls._sound_cache[sound_name] = None
-            else:
-                print(f"Bilinmeyen ses: {sound_name}")
-                cls._sound_cache[sound_name] = None
-        return cls._sound_cache[sound_name]
+    def handle_voice_end(cls, event):
+        """Ses efekti kanalı bitiş olayını işle (GameEngine döngüsünden)"""
+        if cls._voices:
+            cls._voices.handle_end(event)
     
     @classmethod
-    def _cleanup_finished_channels(cls):
-        """Tamamlanan ses kanallarını temizle"""
-        finished = []
-        for sound_name, channel in cls._active_sound_channels.items():
-            if channel is None or not channel.get_busy():
-                finished.append(sound_name)
-        for sound_name in finished:
-            del cls._active_sound_channels[sound_name]
+    def voice_stats(cls):
+        """Kanal kullanım istatistikleri (kategori başına aktif/en yüksek, susturulan/atlanan sesler)"""
+        return cls._voices.stats() if cls._voices else None
     
     @classmethod
-    def play_sound(cls, sound_name):
-        """Tek seferlik ses çal - çakışmayı önle"""
+    def _load_sound(cls, sound_name):
+        """Ses bankasından hazır sesi al (henüz çözülmediyse veya dosya yoksa None)"""
+        if sound_name not in cls.SOUND_PATHS:
+            print(f"Bilinmeyen ses: {sound_name}")
+            return None
+        if cls._bank is None:
+            return None
+        return cls._bank.get(sound_name)
+    
+    @classmethod
+    def _play(cls, sound_name, loops=0):
+        """Sesi kendi kategorisinin kanalında çal"""
         sound = cls._load_sound(sound_name)
-        if sound:
+        if sound and cls._voices:
+            category, priority, max_voices = cls.SOUND_VOICES.get(sound_name, ('effects', 0, 1))
             try:
-                # Tamamlanan kanalları temizle
-                cls._cleanup_finished_channels()
-                
-                # Eğer bu ses çakışmaması gereken bir ses ise, önceki örneği durdur
-                if sound_name in cls.NON_OVERLAPPING_SOUNDS:
-                    if sound_name in cls._active_sound_channels:
-                        channel = cls._active_sound_channels[sound_name]
-                        if channel and channel.get_busy():
-                            channel.stop()
-                
-                # Yeni kanalda çal
-                channel = sound.play()
-                
-                # Çakışmaması gereken sesler için kanalı takip et
-                if sound_name in cls.NON_OVERLAPPING_SOUNDS:
-                    cls._active_sound_channels[sound_name] = channel
-                # Çakışabilen sesler için kanalı takip etme (çoklu örnekler olabilir)
-            except Exception as e:
+                cls._voices.play(sound_name, sound, category, priority, max_voices, loops, cls.get_volume())
+            except pygame.error as e:
                 print(f"Ses çalınamadı: {sound_name} - {e}")
     
+    @classmethod
+    def play_sound(cls, sound_name):
+        """Tek seferlik ses çal - tek örnekli sesler baştan başlar"""
+        cls._play(sound_name)
+    
     @classmethod
     def play_sound_loop(cls, sound_name):
-        """Sürekli çalan ses başlat"""
-        sound = cls._load_sound(sound_name)
-        if sound:
-            try:
-                # Eğer zaten çalıyorsa durdur
-                if sound_name in cls._loop_sounds:
-                    cls.stop_sound_loop(sound_name)
-                # Yeni kanalda çal
-                channel = sound.play(loops=-1)
-                cls._loop_sounds[sound_name] = channel
-            except Exception as e:
-                print(f"Loop ses çalınamadı: {sound_name} - {e}")
+        """Sürekli çalan ses başlat (zaten çalıyorsa baştan başlar)"""
+        cls._play(sound_name, loops=-1)
     
     @classmethod
     def stop_sound_loop(cls, sound_name):
         """Sürekli çalan sesi durdur"""
-        if sound_name in cls._loop_sounds:
-            channel = cls._loop_sounds[sound_name]
-            if channel:
-                channel.stop()
-            del cls._loop_sounds[sound_name]
+        if cls._voices:
+            cls._voices.stop_sound(sound_name)
     
     @classmethod
     def stop_all_sounds(cls):
         """Tüm ses efektlerini durdur"""
-        for sound_name in list(cls._loop_sounds.keys()):
-            cls.stop_sound_loop(sound_name)
-        # Aktif ses kanallarını temizle
-        for sound_name in list(cls._active_sound_channels.keys()):
-            channel = cls._active_sound_channels[sound_name]
-            if channel and channel.get_busy():
-                channel.stop()
-        cls._active_sound_channels.clear()
+        if cls._voices:
+            cls._voices.stop_all()
+    
+    @classmethod
+    def play_music(cls, name, fade_ms=0):
+        """Müzik parçasını sürekli çal (fade_ms: önceki parçadan geçiş süresi)"""
+        if cls._music:
+            cls._music.play(name, fade_ms)
     
     @classmethod
-    def play_music(cls, path, loops=-1):
-        """Müzik çal"""
-        pygame.mixer.music.load(path)
-        pygame.mixer.music.set_volume(cls.get_volume())
-        pygame.mixer.music.play(loops)
+    def play_with_intro(cls, intro, loop, fade_ms=0):
+        """Intro + loop müzik çal - loop mixer kuyruğundan boşluksuz başlar"""
+        if cls._music:
+            cls._music.play_with_intro(intro, loop, fade_ms)
     
     @classmethod
-    def play_with_intro(cls, intro_path, loop_path):
-        """Intro + loop müzik çal"""
-        cls._music_state = {'state': 'intro', 'loop': loop_path}
-        pygame.mixer.music.load(intro_path)
-        pygame.mixer.music.set_volume(cls.get_volume())
-        pygame.mixer.music.play()
+    def fade_out_music(cls, fade_ms=MUSIC_CROSSFADE_MS):
+        """Müziği kısarak durdur (sonraki parça bu sırada başlarsa geçişli olur)"""
+        if cls._music:
+            cls._music.fade_out(fade_ms)
     
     @classmethod
     def handle_music_end(cls, event):
-        """Müzik bitişini işle"""
-        if event.type != cls.MUSIC_END:
+        """Müzik kanalı bitiş olayını işle (GameEngine döngüsünden)"""
+        if cls._music:
+            cls._music.handle_end(event)
+    
+    @classmethod
+    def handle_event(cls, event):
+        """
+        Ses/müzik kanalı bitiş olaylarını işle (GameEngine ve headless döngülerinden)
+        
+        Döndürür:
+            Olay ses sistemine aitse True
+        """
+        if event.type == cls.VOICE_END:
+            cls.handle_voice_end(event)
+        elif event.type == cls.MUSIC_END:
+            cls.handle_music_end(event)
+        else:
             return False
-        if cls._music_state and cls._music_state['state'] == 'intro':
-            cls._music_state['state'] = 'loop'
-            pygame.mixer.music.load(cls._music_state['loop'])
-            pygame.mixer.music.set_volume(cls.get_volume())
-            pygame.mixer.music.play(-1)
-            return True
-        return False
+        return True
     
     @classmethod
     def stop(cls):
-        """Müziği durdur"""
-        pygame.mixer.music.stop()
-        cls._music_state = None
+        """Müziği ve ses efektlerini durdur"""
+        if cls._music:
+            cls._music.stop()
         cls.stop_all_sounds()
 
 
+# =============================================================================
+# DIRTY RECT - Sadece değişen bölgeleri çizme
+# =============================================================================
+
+class DirtyRectTracker:
+    """
+    Ekrana yapılan blit'lerin bölgelerini takip eder
+    
+    Her karede arka plan sadece bir önceki karede çizilen bölgelerin altına
+    geri yüklenir ve ekranda sadece eski + yeni bölgeler güncellenir.
+    begin() ile alınan nesne Surface gibi kullanılır (blit ve fill kaydedilir).
+    """
+    
+    def __init__(self, screen):
+        self.screen = screen
+        self.valid = False  # False ise sonraki kare tam çizilir
+        self._full_redraw = False
+        self._previous = []  # Önceki karede çizilen bölgeler
+        self._current = []
+    
+    def __getattr__(self, name):
+        # blit/fill dışındaki her şey ekran yüzeyine
+        return getattr(self.screen, name)
+    
+    def invalidate(self):
+        """Sonraki karede tüm ekranı yeniden çiz (durum değişimi, tam ekran overlay vb.)"""
+        self.valid = False
+    
+    def begin(self, background):
+        """
+        Kareye başla: önceki bölgelerin altına arka planı geri yükle
+        
+        Döndürür:
+            Çizimlerin yapılacağı takip eden yüzey (self)
+        """
+        self._current = []
+        self._full_redraw = not self.valid
+        if self._full_redraw:
+            self.screen.blit(background, (0, 0))
+        else:
+            for rect in self._previous:
+                self.screen.blit(background, rect, rect)
+        return self
+    
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = self.screen.blit(source, dest, area, special_flags)
+        self._current.append(rect)
+        return rect
+    
+    def blits(self, blit_sequence, doreturn=1):
+        rects = self.screen.blits(blit_sequence)
+        self._current.extend(rects)
+        return rects
+    
+    def fill(self, color, rect=None, special_flags=0):
+        rect = self.screen.fill(color, rect, special_flags)
+        self._current.append(rect)
+        return rect
+    
+    def end(self):
+        """
+        Kareyi bitir
+        
+        Döndürür:
+            display.update için bölge listesi, tam çizim yapıldıysa None (display.flip)
+        """
+        dirty = None
+        if not self._full_redraw:
+            # Yerinden oynamayan elemanların bölgesi iki kez güncellenmesin
+            previous = {tuple(rect) for rect in self._previous}
+            dirty = self._previous + [rect for rect in self._current if tuple(rect) not in previous]
+        self._previous = self._current
+        self._current = []
+        self.valid = True
+        return dirty
+    
+    def mark(self, rect):
+        """Takip dışı çizilen bölgeyi (profiler göstergesi vb.) sonraki karede temizlenecek say"""
+        self._previous.append(rect)
+
+
 # =============================================================================
 # GAME ENGINE - Ana Oyun Motoru
 # =============================================================================
@@ -354,12 +835,28 @@ class Audio:
 class GameEngine:
     """Ana oyun motoru - Oyunu başlatır ve yönetir"""
     
-    def __init__(self):
+    def __init__(self, screen_size=None, audio_profile=AUDIO_PROFILE):
+        """
+        Motoru başlat
+        
+        Parametreler:
+            screen_size: (genişlik, yükseklik) verilirse pencere modunda açılır,
+                         None ise tam ekran (RENDER_RESOLUTION veya native çözünürlük)
+            audio_profile: Ses gecikme profili (settings.AUDIO_PROFILES)
+        """
+        Audio.pre_init(audio_profile)
         pygame.init()
         Audio.init()
         
-        # Tam ekran
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        if screen_size:
+            self.screen = pygame.display.set_mode(screen_size)
+        elif RENDER_RESOLUTION:
+            # Tam ekran, sabit iç çözünürlük - SDL ekrana ölçekler (oran korunur, kenarlar siyah).
+            # SCALED'da display.update(rects) de tüm dokuyu gönderir (bkz. DIRTY_RECT_RENDERING)
+            self.screen = pygame.display.set_mode(RENDER_RESOLUTION, pygame.FULLSCREEN | pygame.SCALED)
+        else:
+            # Tam ekran (native çözünürlük)
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
         pygame.display.set_caption("Bıyık Bey'in Çilesi")
         
         self.screen_width = self.screen.get_width()
@@ -367,6 +864,18 @@ class GameEngine:
         self.clock = pygame.time.Clock()
         self.running = False
         
+        # Sabit adımlı simülasyon
+        self.sim_dt = 1.0 / SIMULATION_HZ
+        self._accumulator = 0.0
+        self.alpha = 1.0  # Çizim için iki simülasyon adımı arasındaki oran (0-1)
+        
+        # Dirty rect çizimi (None ise her kare tam ekran çizilir)
+        self.dirty_rects = DirtyRectTracker(self.screen) if DIRTY_RECT_RENDERING else None
+        
+        # Kare süresi profiler'ı (PROFILER_TOGGLE_KEY ile gösterilir)
+        self.profiler = FrameProfiler()
+        self._profiler_key = pygame.key.key_code(PROFILER_TOGGLE_KEY)
+        
         # Durum yığını
         self._states = []
         
@@ -381,11 +890,13 @@ class GameEngine:
         """Yeni durum ekle"""
         self._states.append(state)
         state.enter()
+        self._invalidate_screen()
     
     def pop_state(self):
         """Mevcut durumu çıkar"""
         if self._states:
             self._states.pop().exit()
+        self._invalidate_screen()
     
     def change_state(self, state):
         """Durumu değiştir"""
@@ -393,31 +904,85 @@ class GameEngine:
             self._states.pop().exit()
         self._states.append(state)
         state.enter()
-    
-    def run(self):
-        """Ana oyun döngüsü"""
-        from states import MenuState
-        self.push_state(MenuState(self))
+        self._invalidate_screen()
+    
+    def _invalidate_screen(self):
+        """Yeni durumun ilk karesi tam ekran çizilsin"""
+        if self.dirty_rects:
+            self.dirty_rects.invalidate()
+    
+    def run(self, initial_state=None):
+        """Ana oyun döngüsü (initial_state verilmezse yükleme ekranı ve ana menüyle başlar)"""
+        if initial_state is None:
+            from states import LoadingState
+            initial_state = LoadingState(self)
+        self.push_state(initial_state)
         
         self.running = True
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+            frame_time = self.clock.tick(FPS) / 1000.0
             
+            events_start = time.perf_counter()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.KEYDOWN and event.key == self._profiler_key:
+                    self.profiler.toggle()
+                elif Audio.handle_event(event):
+                    pass
                 elif self.current_state:
                     self.current_state.handle_event(event)
             
+            update_start = time.perf_counter()
+            self._advance_simulation(frame_time)
+            Assets.expire_sources()
+            
+            draw_start = time.perf_counter()
+            # Durum değişen bölgeleri döndürebilir (None = tüm ekran)
+            dirty = None
             if self.current_state:
-                self.current_state.update(dt)
-                self.current_state.draw(self.screen)
+                dirty = self.current_state.draw(self.screen)
+            draw_end = time.perf_counter()
+            
+            # Gösterge kendi ölçümüne dahil edilmez
+            if self.profiler.visible:
+                panel_rect = self.profiler.draw(self.screen)
+                if dirty is not None:
+                    dirty.append(panel_rect)
+                    self.dirty_rects.mark(panel_rect)
             
-            pygame.display.flip()
+            flip_start = time.perf_counter()
+            if dirty is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)
+            flip_end = time.perf_counter()
+            
+            self.profiler.record(update_start - events_start, draw_start - update_start,
+                                 draw_end - draw_start, flip_end - flip_start)
         
+        highscores.flush()  # Son rekor diske yazılmadan çıkılmasın
         pygame.quit()
         sys.exit()
     
+    def _advance_simulation(self, frame_time):
+        """Geçen süreyi sabit uzunlukta simülasyon adımlarıyla tüket"""
+        self._accumulator += frame_time
+        
+        steps = 0
+        while self._accumulator >= self.sim_dt:
+            # Çok geride kaldıysak telafiyi sınırla (yavaş çekim / kilitlenme önleme)
+            if steps >= MAX_SIMULATION_STEPS:
+                self._accumulator %= self.sim_dt
+                break
+            if self.current_state:
+                self.current_state.update(self.sim_dt)
+            self._accumulator -= self.sim_dt
+            steps += 1
+        
+        # Kalan süre çizimde ara konum (interpolasyon) için kullanılır
+        self.alpha = self._accumulator / self.sim_dt
+    
     def quit(self):
         """Oyundan çık"""
         self.running = False
@@ -0,0 +1,193 @@
+"""
+Bıyık Bey'in Çilesi - Dizi Tabanlı Nesne Deposu
+Aynı türden çok sayıda nesnenin durumunu NumPy sütunlarında tutar (structure of arrays)
+
+    - Her alan (konum, yön, zamanlayıcı, animasyon karesi...) tek bir dizidir; nesne = satır
+    - Güncelleme tür başına tek vektörel geçiştir; nesne başına Python döngüsü ve Vector2 yok
+    - Silme eklenme sırasını korur (çizim sırası ve replay checksum'ı aynı kalır)
+    - Kapasite dolunca diziler iki katına büyür, silinen satırlar yeniden kullanılır
+    - Yakınlık sorguları (within) kalabalık depolarda konum ızgarasından yapılır (spatial.py)
+
+Alt sınıflar COLUMNS içinde alanlarını tanımlar, spawn ve update'i yazar (game_objects.py).
+"""
+
+import numpy as np
+from spatial import SpatialGrid
+from animation import clock, get_clip, FRAME_EPSILON
+from settings import SPATIAL_GRID_CELL_SIZE, SPATIAL_GRID_MIN_ENTITIES
+
+
+def round_half_away(values):
+    """Float koordinatları pygame.Rect gibi yuvarla (.5 sıfırdan uzağa)"""
+    return np.trunc(values + np.copysign(0.5, values)).astype(np.int64)
+
+
+class EntityStore:
+    """
+    Sütun dizilerinde tutulan nesne grubu
+    
+    Her nesnenin çarpışma rect'i ilk klibin ilk karesinin boyutunda ve konuma ortalıdır;
+    kareler rect'in sol üst köşesine çizilir (sprite sürümleriyle aynı).
+    Satırlar sadece klip numarasını (clips listesinde) ve klibin başladığı saat adımını tutar.
+    """
+    
+    # Alan adı -> sütun sayısı (1 = tek değer); tipi DTYPES'ta yoksa float64
+    COLUMNS = {'pos': 2, 'prev_pos': 2, 'clip': 1, 'anim_start': 1}
+    DTYPES = {'clip': np.intp, 'anim_start': np.int64}
+    
+    def __init__(self, clips, screen_w, screen_h, capacity=64):
+        """
+        Parametreler:
+            clips: Kullanılan animasyon kliplerinin adları (satırın klip numarası bu listede)
+            screen_w, screen_h: Ekran boyutu (sınırlar ve ekran dışı kontrolü için)
+            capacity: Başlangıç kapasitesi (satır sayısı)
+        """
+        clips = [get_clip(name) for name in clips]
+        self.width, self.height = clips[0].frames[0].get_size()
+        
+        # Klip tabloları - tüm kliplerin kareleri tek listede, klip numarasıyla dizilerden okunur
+        self._frames = [frame for clip in clips for frame in clip.frames]
+        lengths = [len(clip) for clip in clips]
+        self._clip_offset = np.cumsum([0] + lengths[:-1])
+        self._clip_length = np.array(lengths)
+        self._clip_fps = np.array([clip.fps for clip in clips])
+        self._clip_loop = np.array([clip.loop for clip in clips])
+        self.screen_w = screen_w
+        self.screen_h = screen_h
+        self.count = 0
+        self.capacity = 0
+        self.high_water = 0  # Aynı anda en fazla canlı nesne
+        self._reserve(capacity)
+        
+        # Konum ızgarası - sorgu anında, konumlar değiştiyse yeniden kurulur
+        self._grid = SpatialGrid(SPATIAL_GRID_CELL_SIZE)
+        self._grid_dirty = True
+    
+    def __len__(self):
+        return self.count
+    
+    def prewarm(self, count):
+        """En az `count` nesnelik yer ayır (level başında; dalga ortasında dizi büyütülmesin)"""
+        self._reserve(count)
+    
+    def stats(self):
+        """Havuz istatistikleri - canlı, boş satır, aynı anda en fazla canlı"""
+        return {'live': self.count, 'free': self.capacity - self.count, 'high_water': self.high_water}
+    
+    def _reserve(self, capacity):
+        """Dizileri en az `capacity` satıra büyüt (canlı satırlar korunur)"""
+        if capacity <= self.capacity:
+            return
+        for name, width in self.COLUMNS.items():
+            shape = (capacity, width) if width > 1 else (capacity,)
+            array = np.zeros(shape, self.DTYPES.get(name, np.float64))
+            if self.capacity:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+    
+    def _add(self, **values):
+        """Yeni satır ekle, numarasını döndür"""
+        if self.count == self.capacity:
+            self._reserve(self.capacity * 2)
+        index = self.count
+        for name, value in values.items():
+            getattr(self, name)[index] = value
+        self.count += 1
+        self._grid_dirty = True
+        self.high_water = max(self.high_water, self.count)
+        return index
+    
+    def remove(self, indices):
+        """Verilen satırları sil (kalanların sırası korunur)"""
+        if len(indices) == 0:
+            return
+        keep = np.ones(self.count, bool)
+        keep[indices] = False
+        keep = np.flatnonzero(keep)
+        for name in self.COLUMNS:
+            array = getattr(self, name)
+            array[:len(keep)] = array[keep]
+        self.count = len(keep)
+        self._grid_dirty = True
+    
+    def empty(self):
+        """Tüm nesneleri sil (diziler bir sonraki level için kalır)"""
+        self.count = 0
+        self._grid_dirty = True
+    
+    def topleft(self):
+        """Çarpışma rect'lerinin sol üst köşeleri (int dizileri)"""
+        pos = self.pos[:self.count]
+        return (round_half_away(pos[:, 0]) - self.width // 2,
+                round_half_away(pos[:, 1]) - self.height // 2)
+    
+    def moved(self):
+        """Konumlar değişti - ızgara bir sonraki sorguda yeniden kurulsun"""
+        self._grid_dirty = True
+    
+    def spatial_index(self):
+        """
+        Nesne merkezlerinin ızgarası (satır numaraları bu deponun satırları)
+        
+        Izgara konumlar değiştikten sonraki ilk sorguda bir kez kurulur; aynı adımdaki
+        sorgular bu kurulumu paylaşır.
+        """
+        if self._grid_dirty:
+            pos = self.pos[:self.count]
+            self._grid.update(pos[:, 0], pos[:, 1])
+            self._grid_dirty = False
+        return self._grid
+    
+    def within(self, x, y, radius):
+        """
+        (x, y) noktasına mesafesi <= radius olan satırlar (artan sırada)
+        
+        SPATIAL_GRID_MIN_ENTITIES'ten az nesnede ızgara kurmak taramadan pahalıdır; o zaman
+        aynı mesafe formülüyle düz tarama yapılır (iki yol aynı satırları döndürür).
+        """
+        if self.count >= SPATIAL_GRID_MIN_ENTITIES:
+            return self.spatial_index().query_radius(x, y, radius)
+        pos = self.pos[:self.count]
+        dx = pos[:, 0] - x
+        dy = pos[:, 1] - y
+        return np.flatnonzero(np.sqrt(dx * dx + dy * dy) <= radius)
+    
+    def add_rects_to(self, batch, key):
+        """Çarpışma rect'lerini toplu çarpışma kontrolüne ekle (collision.CollisionBatch)"""
+        if not self.count:
+            return
+        left, top = self.topleft()
+        batch.add_rects(key, left, top, self.width, self.height)
+    
+    def positions(self):
+        """Konumlar [(x, y), ...] - simülasyon checksum'ı için"""
+        return [tuple(p) for p in self.pos[:self.count].tolist()]
+    
+    def _play(self, rows, clip):
+        """Satırlarda klibi baştan başlat"""
+        self.clip[rows] = clip
+        self.anim_start[rows] = clock.ticks
+    
+    def frame_numbers(self):
+        """Satırların şu anki karesi (tüm kliplerin kareleri listesinde) - satır başına O(1)"""
+        n = self.count
+        clip = self.clip[:n]
+        elapsed = (clock.ticks - self.anim_start[:n]) * clock.step_seconds
+        index = (elapsed * self._clip_fps[clip] + FRAME_EPSILON).astype(np.intp)
+        length = self._clip_length[clip]
+        index = np.where(self._clip_loop[clip], index % length, np.minimum(index, length - 1))
+        return self._clip_offset[clip] + index
+    
+    def draw(self, screen, alpha=1.0):
+        """Tüm nesneleri önceki ve mevcut adım arasında interpolasyonla tek blits çağrısında çiz"""
+        n = self.count
+        if not n:
+            return
+        left, top = self.topleft()
+        offset = np.round((self.prev_pos[:n] - self.pos[:n]) * (1.0 - alpha)).astype(np.int64)
+        left += offset[:, 0]
+        top += offset[:, 1]
+        frames = self._frames
+        screen.blits([(frames[frame], (x, y)) for frame, x, y in
+                      zip(self.frame_numbers().tolist(), left.tolist(), top.tolist())])
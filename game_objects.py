@@ -1,12 +1,20 @@
 """
 Bıyık Bey'in Çilesi - Oyun Nesneleri
 Çay, Bomba, Jilet, Terlik ve diğer oyun elementleri
+
+Jilet ve terlikler tek tek sprite değil, NumPy dizili depolardır (entities.py)
+Bomba ve buff'lar nesne havuzlarından alınır ve havuza geri verilir (pool.py)
 """
 
 import pygame
 import random
 import math
-from engine import Assets, Audio
+import numpy as np
+from engine import Assets, Audio, interpolated_rect
+from entities import EntityStore
+from pool import ObjectPool
+from spatial import SpatialGrid
+from animation import clock, load_clip, get_clip
 from settings import *
 
 
@@ -16,9 +24,27 @@ class GameObject(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
         self.spawn_time = pygame.time.get_ticks()
+        
+        # Simülasyon konumu (float) ve interpolasyon için önceki adımın konumu
+        self.pos = pygame.math.Vector2(x, y)
+        self.prev_pos = pygame.math.Vector2(x, y)
+    
+    def _place(self, x, y):
+        """Konumu ve doğma zamanını yenile (havuzdan yeniden kullanımda)"""
+        self.spawn_time = pygame.time.get_ticks()
+        self.pos.update(x, y)
+        self.prev_pos.update(x, y)
     
-    def update(self, screen_w, screen_h, player_rect):
+    def reset(self):
+        """Havuza dönerken - gruplardan çıkar (pool.ObjectPool.release)"""
+        self.kill()
+    
+    def update(self, screen_w, screen_h, player_rect, dt):
         pass
+    
+    def get_draw_rect(self, alpha=1.0):
+        """Önceki ve mevcut adım arasında interpolasyonlu çizim konumu"""
+        return interpolated_rect(self.rect, self.prev_pos, self.pos, alpha)
 
 
 # =============================================================================
@@ -28,23 +54,31 @@ class GameObject(pygame.sprite.Sprite):
 class Tea(GameObject):
     """Çay bardağı - Toplandığında +1 can verir"""
     
-    def __init__(self, x, y, scale=1.0):
+    def __init__(self, x, y, scale=1.0, rng=random):
         super().__init__(x, y)
         self.image = Assets.load_scaled('assets/game/tea.png', scale)
+        
+        # Yaşam süresi
+        self.lifetime = BUFF_LIFETIME
+        
+        # Animasyon
+        self.float_speed = 2.0
+        self.float_amplitude = 5
+        
+        self.activate(x, y, rng)
+    
+    def activate(self, x, y, rng=random):
+        """Yeni çay olarak başlat (oluşturulunca ve havuzdan alınınca)"""
+        self._place(x, y)
         self.rect = self.image.get_rect(center=(x, y))
         
         # Konum
         self.base_x = x
         self.base_y = y
-        
-        # Yaşam süresi
-        self.lifetime = BUFF_LIFETIME
         self.age = 0
         
         # Animasyon
-        self.float_offset = random.uniform(0, math.pi * 2)
-        self.float_speed = 2.0
-        self.float_amplitude = 5
+        self.float_offset = rng.uniform(0, math.pi * 2)
         self.pulse_timer = 0
         self.visible = True
     
@@ -57,8 +91,7 @@ class Tea(GameObject):
             return False  # Silinmeli
         
         # Yukarı aşağı süzülme
-        elapsed = pygame.time.get_ticks() / 1000.0
-        offset = math.sin(elapsed * self.float_speed + self.float_offset) * self.float_amplitude
+        offset = math.sin(self.age * self.float_speed + self.float_offset) * self.float_amplitude
         self.rect.centery = self.base_y + offset
         
         # Son 2 saniyede yanıp sönme
@@ -82,22 +115,50 @@ class Tea(GameObject):
 class Bomb(GameObject):
     """Bomba - Belirli süre sonra patlar ve yakındaki oyuncuya hasar verir"""
     
+    TICK_FRAME_TIME = 1 / (0.1 * BASE_TICK_RATE)       # Fünye başında; sonuna doğru 5 kat hızlanır
+    EXPLOSION_FRAME_TIME = 1 / (0.2 * BASE_TICK_RATE)
+    
     def __init__(self, x, y, scale=0.8, fuse_time=None):
         super().__init__(x, y)
         
-        # Bomba animasyon kareleri (tick tick tick...)
-        self.tick_frames = [
-            Assets.load_scaled(f'assets/game/bomb_tick_{i}.png', scale)
-            for i in range(1, 8)
-        ]
+        # Animasyon klipleri (tick tick tick... ve patlama) - adları, kareler klip kaydında
+        self.clip_ids = self._load_clips(scale)
+        explosion_frame = get_clip(self.clip_ids[1]).frames[0]
         
-        # Patlama animasyon kareleri
-        self.explosion_frames = [
-            Assets.load_scaled(f'assets/game/explosion_{i}.png', scale * 2)
-            for i in range(1, 6)
-        ]
+        # Patlama yarıçapı - patlama görselinin boyutuna göre dinamik hesapla
+        # Patlama görseli bomba görselinden 2 kat daha büyük (scale * 2)
+        # Patlama görselinin genişliği ve yüksekliğinin ortalamasının yarısı = yarıçap
+        explosion_width = explosion_frame.get_width()
+        explosion_height = explosion_frame.get_height()
+        # Patlama görseli genellikle yuvarlak olduğu için genişlik ve yüksekliğin ortalamasının yarısı
+        # Bu, patlama görselinin çapının yarısı = yarıçap
+        self.explosion_radius = min(explosion_width, explosion_height) / 2
         
-        self.image = self.tick_frames[0]
+        # Patlama efekt görseli için
+        self.damage_effect_frames = self.damage_effect_ramp(self.explosion_radius)
+        
+        self.activate(x, y, fuse_time)
+    
+    @classmethod
+    def _load_clips(cls, scale):
+        """Ölçek için (tick, patlama) klip adları - kareler ilk çağrıda bir kez yüklenir"""
+        tick = load_clip(f'bomb_tick@{scale}',
+                         [f'assets/game/bomb_tick_{i}.png' for i in range(1, 8)], scale, cls.TICK_FRAME_TIME)
+        explosion = load_clip(f'bomb_explosion@{scale}',
+                              [f'assets/game/explosion_{i}.png' for i in range(1, 6)], scale * 2,
+                              cls.EXPLOSION_FRAME_TIME, loop=False)
+        return tick.name, explosion.name
+    
+    def _play(self, clip_id):
+        """Klibi şimdiki simülasyon adımından başlat"""
+        self.clip = clip_id
+        self.anim_start = clock.ticks
+        self.image = get_clip(clip_id).frames[0]
+    
+    def activate(self, x, y, fuse_time=None):
+        """Yeni bomba olarak başlat (oluşturulunca ve havuzdan alınınca)"""
+        self._place(x, y)
+        self._play(self.clip_ids[0])
         self.rect = self.image.get_rect(center=(x, y))
         
         # Durum
@@ -108,92 +169,74 @@ class Bomb(GameObject):
         
         # Zamanlama
         self.fuse_time = fuse_time if fuse_time is not None else BOMB_FUSE_TIME  # Patlamaya kadar süre (ms)
-        self.frame_index = 0
-        self.anim_speed = 0.15
-        
-        # Patlama yarıçapı - patlama görselinin boyutuna göre dinamik hesapla
-        # Patlama görseli bomba görselinden 2 kat daha büyük (scale * 2)
-        # Patlama görselinin genişliği ve yüksekliğinin ortalamasının yarısı = yarıçap
-        explosion_width = self.explosion_frames[0].get_width()
-        explosion_height = self.explosion_frames[0].get_height()
-        # Patlama görseli genellikle yuvarlak olduğu için genişlik ve yüksekliğin ortalamasının yarısı
-        # Bu, patlama görselinin çapının yarısı = yarıçap
-        self.explosion_radius = min(explosion_width, explosion_height) / 2
-        
-        # Patlama efekt görseli için
+        self.elapsed = 0  # Oluşturulduğundan beri geçen simülasyon süresi (ms)
         self.damage_effect_alpha = 0  # Başlangıçta görünmez
     
-    def update(self, screen_w, screen_h, player_rect):
+    @staticmethod
+    def damage_effect_ramp(radius):
+        """Hasar alanı dairesinin alfa kademeleri (yarıçap başına bir kez çizilir, Assets'te tutulur)"""
+        return Assets.get_circle_ramp(int(radius), RED, BOMB_EXPLOSION_EFFECT_ALPHA, BOMB_EFFECT_RAMP_STEPS)
+    
+    @classmethod
+    def prerender_effects(cls, scale=BOMB_SCALE):
+        """Hasar dairesini oyun başlamadan çiz (ilk patlamada çizim yapılmasın)"""
+        explosion = get_clip(cls._load_clips(scale)[1]).frames[0]
+        cls.damage_effect_ramp(min(explosion.get_width(), explosion.get_height()) / 2)
+    
+    def update(self, screen_w, screen_h, player_rect, dt):
         """Bomba güncelleme - tick veya patlama animasyonu"""
-        elapsed = pygame.time.get_ticks() - self.spawn_time
+        self.elapsed += dt * 1000
+        elapsed = self.elapsed
+        step = dt * BASE_TICK_RATE  # Kare başına tanımlı sabitleri adım süresine ölçekle
+        
+        clip = get_clip(self.clip)
+        t = clock.elapsed(self.anim_start)
         
         if not self.is_exploding:
-            # Tick animasyonu - giderek hızlanır
-            progress = min(elapsed / self.fuse_time, 1.0)
-            speed = 0.1 + progress * 0.4  # Hızlanarak tick
-            
-            self.frame_index += speed
-            if self.frame_index >= len(self.tick_frames):
-                self.frame_index = 0
-            
-            self.image = self.tick_frames[int(self.frame_index)]
+            # Tick animasyonu - giderek hızlanır: hız fünye boyunca doğrusal olarak 1'den 5 kata çıkar,
+            # klipteki konum hızın integrali t + 2t²/T
+            fuse = self.fuse_time / 1000
+            self.image = clip.frame(t + 2 * t * t / fuse)
             
             # Patlama zamanı geldi mi?
             if elapsed >= self.fuse_time:
                 self.is_exploding = True
-                self.frame_index = 0
                 self.damage_effect_alpha = BOMB_EXPLOSION_EFFECT_ALPHA  # Hasar efektini göster
                 # Patlama için rect'i büyüt
                 center = self.rect.center
-                self.image = self.explosion_frames[0]
+                self._play(self.clip_ids[1])
                 self.rect = self.image.get_rect(center=center)
                 # Patlama sesi çal (bir kez)
                 if not self.explosion_sound_played:
                     Audio.play_sound('bomb_explosion')
                     self.explosion_sound_played = True
         else:
-            # Patlama animasyonu
-            self.frame_index += 0.2
-            if self.frame_index >= len(self.explosion_frames):
+            # Patlama animasyonu (tek seferlik klip bitince bomba kalkar)
+            if clip.finished(t):
                 self.exploded = True
                 self.damage_effect_alpha = 0  # Efekti gizle
                 return
             
-            self.image = self.explosion_frames[int(self.frame_index)]
+            self.image = clip.frame(t)
             
             # Hasar efektinin alpha değerini azalt (fade out)
             if self.damage_effect_alpha > 0:
-                self.damage_effect_alpha = max(0, self.damage_effect_alpha - 5)
+                self.damage_effect_alpha = max(0, self.damage_effect_alpha - 5 * step)
     
-    def check_explosion_hit(self, player_rect):
-        """Patlama oyuncuya isabet etti mi?"""
-        if not self.is_exploding or self.has_dealt_damage:
-            return False
-        
-        # Patlama merkezinden oyuncuya mesafe
-        bomb_center = pygame.math.Vector2(self.rect.center)
-        player_center = pygame.math.Vector2(player_rect.center)
-        distance = bomb_center.distance_to(player_center)
-        
-        if distance <= self.explosion_radius:
-            self.has_dealt_damage = True
-            return True
-        return False
+    @property
+    def can_deal_damage(self):
+        """Patlıyor ve henüz hasar vermedi - çarpışma kontrolüne girer (collision.CollisionBatch)"""
+        return self.is_exploding and not self.has_dealt_damage
     
     def draw(self, screen):
         screen.blit(self.image, self.rect)
         
         # Hasar veren alanı göster (patlama sırasında)
         if self.is_exploding and self.damage_effect_alpha > 0:
-            # Yarı saydam kırmızı çember çiz
-            # Hasar alanını gösteren çember
-            effect_surface = pygame.Surface((int(self.explosion_radius * 2), int(self.explosion_radius * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(
-                effect_surface,
-                (*RED, self.damage_effect_alpha),  # RGBA formatında
-                (int(self.explosion_radius), int(self.explosion_radius)),
-                int(self.explosion_radius)
-            )
+            # Hasar alanını gösteren yarı saydam kırmızı çember (alfaya en yakın hazır kademe)
+            frames = self.damage_effect_frames
+            level = int(self.damage_effect_alpha * len(frames) / BOMB_EXPLOSION_EFFECT_ALPHA + 0.5)
+            effect_surface = frames[min(len(frames), max(1, level)) - 1]
             
             # Çemberi bomba merkezine göre çiz
             center_x, center_y = self.rect.center
@@ -204,169 +247,157 @@ class Bomb(GameObject):
 # SİNSİ JİLET - Hareketli düşman (Sinsi hareket)
 # =============================================================================
 
-class SinsiJilet(GameObject):
-    """Sinsi Jilet - Yavaşça oyuncuya yaklaşır, sonra aniden saldırır"""
-    
-    def __init__(self, x, y, scale=0.7, attack_distance=None, attack_delay=None):
-        super().__init__(x, y)
-        
-        # Animasyon kareleri (8 kare)
-        self.frames = [
-            Assets.load_scaled(f'assets/game/sinsi_jilet_{i}.png', scale)
-            for i in range(1, 9)
-        ]
-        
-        self.image = self.frames[0]
-        self.rect = self.image.get_rect(center=(x, y))
-        
-        # Hareket
-        self.speed_sneak = JILET_SNEAK_SPEED  # Sinsi yürüme hızı
-        self.speed_attack = JILET_ATTACK_SPEED  # Saldırı hızı
-        self.current_speed = self.speed_sneak
-        
-        # Durum
-        self.state = 'sneaking'  # 'sneaking' veya 'attacking'
-        self.attack_distance = attack_distance if attack_distance is not None else JILET_ATTACK_DISTANCE  # Bu mesafede saldırıya geç
-        self.attack_duration = attack_delay if attack_delay is not None else JILET_ATTACK_DELAY_BASE  # Saldırı modunda kalma süresi (kovalama süresi)
-        self.attack_start_time = None  # Saldırı başladığında zamanı kaydet
-        self.direction = pygame.math.Vector2(0, 0)
-        
-        # Animasyon
-        self.frame_index = 0
-        self.anim_speed = 0.05  # Yavaş animasyon
-        
-        # Titreme efekti (sinsi modda)
-        self.shake_offset = 0
-        self.shake_timer = 0
-    
-    def update(self, screen_w, screen_h, player_rect):
-        """Jilet güncelleme - Oyuncuya doğru sinsi hareket"""
-        # Oyuncuya doğru yön hesapla
-        my_pos = pygame.math.Vector2(self.rect.center)
-        player_pos = pygame.math.Vector2(player_rect.center)
-        
-        to_player = player_pos - my_pos
-        distance = to_player.length()
-        
-        if distance > 0:
-            self.direction = to_player.normalize()
-        
-        # Zamanı al (saniye cinsinden)
-        current_time = pygame.time.get_ticks() / 1000.0
-        
-        # Duruma göre davran
-        if self.state == 'sneaking':
-            # Yavaşça yaklaş, hafif titreme
-            self.shake_timer += 0.3
-            self.shake_offset = math.sin(self.shake_timer) * 2
-            
-            # Belirli mesafede hemen saldırıya geç
-            if distance < self.attack_distance:
-                # Hemen saldırıya geç!
-                self.state = 'attacking'
-                self.attack_start_time = current_time
-                self.anim_speed = 0.15  # Saldırıda biraz daha hızlı
-            
-            self.current_speed = self.speed_sneak
-        else:  # attacking
-            # SALDIRI! Hızlıca oyuncuya doğru kovalar
-            self.current_speed = self.speed_attack
-            self.shake_offset = 0
-            
-            # Kovalama süresi doldu mu?
-            if self.attack_start_time is not None:
-                elapsed_attack = current_time - self.attack_start_time
-                if elapsed_attack >= self.attack_duration:
-                    # Kovalama süresi doldu, normal hıza dön
-                    self.state = 'sneaking'
-                    self.attack_start_time = None
-                    self.anim_speed = 0.05  # Normal animasyon hızına dön
+class JiletStore(EntityStore):
+    """
+    Sinsi Jiletler - Yavaşça oyuncuya yaklaşır, sonra aniden saldırır
+    
+    Tüm jiletler tek depoda; hareket, takip, saldırı zamanlayıcısı ve animasyon tek vektörel geçiş.
+    """
+    
+    COLUMNS = {
+        'pos': 2, 'prev_pos': 2, 'clip': 1, 'anim_start': 1,
+        'direction': 2,         # Oyuncuya doğru birim vektör (oyuncunun üstündeyse son yön)
+        'speed_sneak': 1,       # Sinsi yürüme hızı
+        'speed_attack': 1,      # Saldırı hızı
+        'attack_distance': 1,   # Bu mesafede saldırıya geç
+        'attack_duration': 1,   # Saldırı modunda kalma süresi (kovalama süresi)
+        'attack_elapsed': 1,    # Saldırı modunda geçen süre (saniye)
+        'shake_timer': 1,       # Titreme efekti (sinsi modda)
+        'attacking': 1,         # False = sinsi, True = saldırı
+    }
+    DTYPES = {**EntityStore.DTYPES, 'attacking': bool}
+    
+    SNEAK_FRAME_TIME = 1 / (0.05 * BASE_TICK_RATE)   # Yavaş animasyon
+    ATTACK_FRAME_TIME = 1 / (0.15 * BASE_TICK_RATE)  # Saldırıda biraz daha hızlı
+    SNEAK_CLIP, ATTACK_CLIP = 0, 1                  # Satırın klip numarası
+    SCREEN_MARGIN = 50        # Ekran sınırları (biraz dışarı çıkabilir)
+    
+    def __init__(self, screen_w, screen_h, scale=0.7):
+        # Animasyon klipleri (aynı 8 kare, iki hız)
+        paths = [f'assets/game/sinsi_jilet_{i}.png' for i in range(1, 9)]
+        clips = [load_clip(f'jilet_sneak@{scale}', paths, scale, self.SNEAK_FRAME_TIME).name,
+                 load_clip(f'jilet_attack@{scale}', paths, scale, self.ATTACK_FRAME_TIME).name]
+        super().__init__(clips, screen_w, screen_h)
+    
+    def spawn(self, x, y, speed_sneak=JILET_SNEAK_SPEED, speed_attack=JILET_ATTACK_SPEED,
+              attack_distance=JILET_ATTACK_DISTANCE, attack_delay=JILET_ATTACK_DELAY_BASE):
+        return self._add(pos=(x, y), prev_pos=(x, y), clip=self.SNEAK_CLIP, anim_start=clock.ticks,
+                         direction=(0, 0), speed_sneak=speed_sneak, speed_attack=speed_attack,
+                         attack_distance=attack_distance, attack_duration=attack_delay,
+                         attack_elapsed=0.0, shake_timer=0, attacking=False)
+    
+    def update(self, player_center, dt):
+        """Tüm jiletleri bir adım ilerlet - oyuncuya doğru sinsi hareket / saldırı"""
+        n = self.count
+        if not n:
+            return
+        step = dt * BASE_TICK_RATE  # Kare başına tanımlı sabitleri adım süresine ölçekle
+        pos = self.pos[:n]
+        self.prev_pos[:n] = pos
+        
+        # Oyuncuya doğru yön
+        to_player = np.array(player_center, np.float64) - pos
+        distance = np.sqrt(to_player[:, 0] * to_player[:, 0] + to_player[:, 1] * to_player[:, 1])
+        direction = self.direction[:n]
+        np.divide(to_player, distance[:, None], out=direction, where=(distance > 0)[:, None])
+        
+        # Duruma göre davran (geçişler bu adımın hızını değiştirmez)
+        attacking = self.attacking[:n]
+        sneaking = ~attacking
+        was_attacking = attacking.copy()
+        
+        # Sinsi: yavaşça yaklaş, hafif titreme; belirli mesafede hemen saldırıya geç
+        shake_timer = self.shake_timer[:n]
+        np.add(shake_timer, 0.3 * step, out=shake_timer, where=sneaking)
+        shake_offset = np.sin(shake_timer) * 2
+        shake_offset[was_attacking] = 0.0
+        # Saldırı mesafesindeki adaylar konum ızgarasından, kesin eşik satır başına
+        attack_distance = self.attack_distance[:n]
+        near = np.zeros(n, bool)
+        near[self.within(player_center[0], player_center[1], attack_distance.max())] = True
+        start_attack = sneaking & near & (distance < attack_distance)
+        speed = np.where(sneaking, self.speed_sneak[:n], self.speed_attack[:n])
+        
+        # Saldırı: kovalama süresi dolunca normal hıza dön
+        attack_elapsed = self.attack_elapsed[:n]
+        np.add(attack_elapsed, dt, out=attack_elapsed, where=was_attacking)
+        end_attack = was_attacking & (attack_elapsed >= self.attack_duration[:n])
+        switched = np.flatnonzero(start_attack | end_attack)
+        attack_elapsed[switched] = 0.0
+        attacking[switched] ^= True
+        
+        # Animasyon - mod değişen satırlarda yeni modun klibi baştan başlar
+        self._play(switched, np.where(attacking[switched], self.ATTACK_CLIP, self.SNEAK_CLIP))
         
         # Hareket
-        self.rect.x += self.direction.x * self.current_speed + self.shake_offset
-        self.rect.y += self.direction.y * self.current_speed
-        
-        # Animasyon
-        self.frame_index += self.anim_speed
-        if self.frame_index >= len(self.frames):
-            self.frame_index = 0
-        self.image = self.frames[int(self.frame_index)]
-        
-        # Ekran sınırları (biraz dışarı çıkabilir)
-        margin = 50
-        self.rect.left = max(-margin, self.rect.left)
-        self.rect.right = min(screen_w + margin, self.rect.right)
-        self.rect.top = max(-margin, self.rect.top)
-        self.rect.bottom = min(screen_h + margin, self.rect.bottom)
-    
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
+        pos[:, 0] += (direction[:, 0] * speed + shake_offset) * step
+        pos[:, 1] += direction[:, 1] * speed * step
+        self.moved()
+        
+        # Ekran sınırları
+        margin = self.SCREEN_MARGIN
+        half_w = self.width / 2
+        half_h = self.height / 2
+        x, y = pos[:, 0], pos[:, 1]
+        np.maximum(-margin + half_w, np.minimum(self.screen_w + margin - half_w, x), out=x)
+        np.maximum(-margin + half_h, np.minimum(self.screen_h + margin - half_h, y), out=y)
 
 
 # =============================================================================
 # UÇAN TERLİK - Hareketli düşman (Fırlatma hareketi)
 # =============================================================================
 
-class UcanTerlik(GameObject):
-    """Uçan Terlik - Ekranın kenarından fırlatılır, düz çizgide gider"""
-    
-    def __init__(self, screen_w, screen_h, target_pos, scale=0.7):
-        # Rastgele kenardan başla
-        x, y = _get_random_edge_position(screen_w, screen_h, ENEMY_SPAWN_MARGIN)
-        super().__init__(x, y)
-        
-        # Animasyon kareleri (dönen terlik - 8 kare)
-        self.frames = [
-            Assets.load_scaled(f'assets/game/ucan_terlik_{i}.png', scale)
-            for i in range(1, 9)
-        ]
-        
-        self.image = self.frames[0]
-        self.rect = self.image.get_rect(center=(x, y))
-        
-        # Hedef yönünü hesapla (oyuncuya doğru)
-        my_pos = pygame.math.Vector2(x, y)
-        target = pygame.math.Vector2(target_pos)
-        
-        direction = target - my_pos
-        if direction.length() > 0:
-            self.direction = direction.normalize()
-        else:
-            self.direction = pygame.math.Vector2(1, 0)
-        
-        # Hız ve hareket
-        self.speed = TERLIK_SPEED
-        
-        # Animasyon (dönme efekti)
-        self.frame_index = 0
-        self.rotation_speed = 0.12  # Yavaş dönme - daha görünür
+class TerlikStore(EntityStore):
+    """
+    Uçan Terlikler - Ekranın kenarından fırlatılır, düz çizgide gider
+    
+    Hareket, dönme animasyonu ve ekran dışına çıkanların silinmesi tek vektörel geçiş.
+    """
+    
+    COLUMNS = {'pos': 2, 'prev_pos': 2, 'clip': 1, 'anim_start': 1, 'direction': 2, 'speed': 1}
+    
+    ROTATION_FRAME_TIME = 1 / (0.12 * BASE_TICK_RATE)  # Yavaş dönme - daha görünür
+    OFF_SCREEN_MARGIN = 100
+    
+    def __init__(self, screen_w, screen_h, scale=0.7):
+        # Animasyon klibi (dönen terlik - 8 kare)
+        clip = load_clip(f'terlik_spin@{scale}', [f'assets/game/ucan_terlik_{i}.png' for i in range(1, 9)],
+                         scale, self.ROTATION_FRAME_TIME)
+        super().__init__([clip.name], screen_w, screen_h)
+    
+    def spawn(self, x, y, target_pos, speed=TERLIK_SPEED):
+        """Terliği (x, y)'den hedefe doğru fırlat"""
+        dx = target_pos[0] - x
+        dy = target_pos[1] - y
+        length = math.sqrt(dx * dx + dy * dy)
+        direction = (dx / length, dy / length) if length > 0 else (1, 0)
+        return self._add(pos=(x, y), prev_pos=(x, y), clip=0, anim_start=clock.ticks,
+                         direction=direction, speed=speed)
+    
+    def launch(self, target_pos, speed=TERLIK_SPEED, rng=random):
+        """Rastgele kenardan hedefe doğru fırlat"""
+        x, y = _get_random_edge_position(self.screen_w, self.screen_h, ENEMY_SPAWN_MARGIN, rng)
+        return self.spawn(x, y, target_pos, speed)
+    
+    def update(self, dt):
+        """Tüm terlikleri düz çizgide ilerlet, ekran dışına çıkanları sil"""
+        n = self.count
+        if not n:
+            return
+        step = dt * BASE_TICK_RATE  # Kare başına tanımlı sabitleri adım süresine ölçekle
+        pos = self.pos[:n]
+        self.prev_pos[:n] = pos
         
-        # Ekran dışına çıkınca silinecek
-        self.screen_w = screen_w
-        self.screen_h = screen_h
-    
-    def update(self, screen_w, screen_h, player_rect):
-        """Terlik güncelleme - Düz çizgide uç"""
         # Hareket
-        self.rect.x += self.direction.x * self.speed
-        self.rect.y += self.direction.y * self.speed
-        
-        # Dönerek animasyon
-        self.frame_index += self.rotation_speed
-        if self.frame_index >= len(self.frames):
-            self.frame_index = 0
-        self.image = self.frames[int(self.frame_index)]
-    
-    def is_off_screen(self):
-        """Ekran dışında mı?"""
-        margin = 100
-        return (self.rect.right < -margin or 
-                self.rect.left > self.screen_w + margin or
-                self.rect.bottom < -margin or 
-                self.rect.top > self.screen_h + margin)
-    
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
+        pos += self.direction[:n] * (self.speed[:n] * step)[:, None]
+        self.moved()
+        
+        # Ekran dışında mı?
+        margin = self.OFF_SCREEN_MARGIN
+        left, top = self.topleft()
+        off_screen = ((left + self.width < -margin) | (left > self.screen_w + margin) |
+                      (top + self.height < -margin) | (top > self.screen_h + margin))
+        self.remove(np.flatnonzero(off_screen))
 
 
 # =============================================================================
@@ -404,10 +435,10 @@ class HealthUI:
             self.is_shaking = True
             self.shake_timer = 10
     
-    def update(self):
+    def update(self, dt):
         """Animasyonları güncelle"""
         if self.is_shaking:
-            self.shake_timer -= 1
+            self.shake_timer -= dt * BASE_TICK_RATE
             if self.shake_timer <= 0:
                 self.is_shaking = False
     
@@ -434,27 +465,44 @@ class HealthUI:
 # SPAWN MANAGER - Nesne Oluşturucu (Level Sistemi ile)
 # =============================================================================
 
-def _get_random_edge_position(screen_w, screen_h, spawn_margin):
+def _get_random_edge_position(screen_w, screen_h, spawn_margin, rng=random):
     """Rastgele ekran kenarından pozisyon al"""
-    edge = random.choice(['top', 'bottom', 'left', 'right'])
+    edge = rng.choice(['top', 'bottom', 'left', 'right'])
     
     if edge == 'top':
-        return (random.randint(spawn_margin, screen_w - spawn_margin), -spawn_margin)
+        return (rng.randint(spawn_margin, screen_w - spawn_margin), -spawn_margin)
     elif edge == 'bottom':
-        return (random.randint(spawn_margin, screen_w - spawn_margin), screen_h + spawn_margin)
+        return (rng.randint(spawn_margin, screen_w - spawn_margin), screen_h + spawn_margin)
     elif edge == 'left':
-        return (-spawn_margin, random.randint(spawn_margin, screen_h - spawn_margin))
+        return (-spawn_margin, rng.randint(spawn_margin, screen_h - spawn_margin))
     else:  # right
-        return (screen_w + spawn_margin, random.randint(spawn_margin, screen_h - spawn_margin))
+        return (screen_w + spawn_margin, rng.randint(spawn_margin, screen_h - spawn_margin))
 
 
 class SpawnManager:
     """Oyun nesnelerini zamanla oluşturur - Level bazlı zorluk"""
     
-    def __init__(self, screen_w, screen_h):
+    def __init__(self, screen_w, screen_h, seed=None):
         self.screen_w = screen_w
         self.screen_h = screen_h
         
+        # Simülasyona özel rastgele sayı üreteci (aynı seed = aynı spawn dizisi)
+        self.rng = random.Random(seed)
+        
+        # Nesne havuzları - boşta oluşturulan nesneler simülasyon rng'sini kullanmaz
+        idle_rng = random.Random(0)
+        self.bomb_pool = ObjectPool(lambda: Bomb(0, 0, BOMB_SCALE))
+        self.buff_pools = {
+            'tea': ObjectPool(lambda: Tea(0, 0, TEA_SCALE, idle_rng)),
+            'speed_buff': ObjectPool(lambda: SpeedBuff(0, 0, BUFF_SCALE, idle_rng)),
+            'speed_debuff': ObjectPool(lambda: SpeedDebuff(0, 0, BUFF_SCALE, idle_rng)),
+        }
+        
+        # Bomba konulamayacak noktalar (oyuncu merkezi) - mesafe kontrolü ızgaradan yapılır.
+        # Yarıçap eşiğin hemen altındaki sayı: sorgu <= karşılaştırır, kural "mesafe >= eşik"
+        self.spawn_blockers = SpatialGrid(SPATIAL_GRID_CELL_SIZE)
+        self.spawn_clearance = float(np.nextafter(SPAWN_MIN_DISTANCE_FROM_PLAYER, 0))
+        
         # Level sistemi
         self.level = 1
         self.level_timer = 0
@@ -481,7 +529,7 @@ class SpawnManager:
         reduction_factor = max(MIN_SPAWN_TIME / BUFF_SPAWN_MIN_TIME, reduction_factor)
         min_time = max(MIN_SPAWN_TIME, BUFF_SPAWN_MIN_TIME * reduction_factor)
         max_time = max(MIN_SPAWN_TIME * 1.5, BUFF_SPAWN_MAX_TIME * reduction_factor)
-        return random.uniform(min_time, max_time)
+        return self.rng.uniform(min_time, max_time)
     
     def get_max_enemies(self):
         """Level'e göre maksimum düşman sayısı (daha agresif)"""
@@ -548,6 +596,16 @@ class SpawnManager:
         self.bomb_next_spawn = self._random_spawn_time()  # Bomba normal spawn zamanı
         self.buff_next_spawn = self._random_spawn_time() * 0.5  # Buff biraz daha geç
     
+    def prewarm_pools(self):
+        """Havuzları ölçülen en fazla eşzamanlı nesne sayısına hazırla (POOL_PREWARM)"""
+        self.bomb_pool.prewarm(POOL_PREWARM['bomb'])
+        for pool in self.buff_pools.values():
+            pool.prewarm(POOL_PREWARM['buff'])  # Haritada aynı anda tek buff olur
+    
+    def release_buff(self, buff_type, buff):
+        """Toplanan veya süresi dolan buff'ı havuza geri ver"""
+        self.buff_pools[buff_type].release(buff)
+    
     def spawn_initial_enemies(self, bombs, jilets, terliks, player_rect):
         """Level başlangıcında hemen 1 terlik ve 1 sinsi jilet spawn et"""
         # Her level başında kesinlikle 1 terlik ve 1 jilet spawn et
@@ -618,40 +676,35 @@ class SpawnManager:
     
     def _create_random_buff(self):
         """Ağırlıklı random buff oluştur (çay nadir)"""
-        x = random.randint(BUFF_SPAWN_MARGIN, self.screen_w - BUFF_SPAWN_MARGIN)
-        y = random.randint(BUFF_SPAWN_MARGIN, self.screen_h - BUFF_SPAWN_MARGIN)
+        x = self.rng.randint(BUFF_SPAWN_MARGIN, self.screen_w - BUFF_SPAWN_MARGIN)
+        y = self.rng.randint(BUFF_SPAWN_MARGIN, self.screen_h - BUFF_SPAWN_MARGIN)
         
         # Ağırlıklı seçim
         choices = []
         for buff_type, weight in BUFF_WEIGHTS.items():
             choices.extend([buff_type] * weight)
         
-        selected = random.choice(choices)
+        selected = self.rng.choice(choices)
         
-        if selected == 'tea':
-            return ('tea', Tea(x, y, TEA_SCALE))
-        elif selected == 'speed_buff':
-            return ('speed_buff', SpeedBuff(x, y, BUFF_SCALE))
-        else:
-            return ('speed_debuff', SpeedDebuff(x, y, BUFF_SCALE))
+        return (selected, self.buff_pools[selected].acquire(x, y, self.rng))
     
     def _spawn_bomb(self, bombs, player_rect):
         """Bomba oluştur - Oyuncudan uzakta (level bazlı fünye süresi)"""
         fuse_time = self.get_bomb_fuse_time()
+        blockers = self.spawn_blockers
+        blockers.update([player_rect.centerx], [player_rect.centery])
         
         for _ in range(SPAWN_RETRY_ATTEMPTS):
-            x = random.randint(SPAWN_MARGIN, self.screen_w - SPAWN_MARGIN)
-            y = random.randint(SPAWN_MARGIN, self.screen_h - SPAWN_MARGIN)
+            x = self.rng.randint(SPAWN_MARGIN, self.screen_w - SPAWN_MARGIN)
+            y = self.rng.randint(SPAWN_MARGIN, self.screen_h - SPAWN_MARGIN)
             
             # Oyuncudan uzakta mı?
-            dist = pygame.math.Vector2(x - player_rect.centerx, 
-                                       y - player_rect.centery).length()
-            if dist >= SPAWN_MIN_DISTANCE_FROM_PLAYER:
-                bombs.add(Bomb(x, y, BOMB_SCALE, fuse_time))
+            if not len(blockers.query_radius(x, y, self.spawn_clearance)):
+                bombs.add(self.bomb_pool.acquire(x, y, fuse_time))
                 return
         
         # Uygun yer bulunamadıysa yine de oluştur
-        bombs.add(Bomb(x, y, BOMB_SCALE, fuse_time))
+        bombs.add(self.bomb_pool.acquire(x, y, fuse_time))
     
     def _spawn_jilet(self, jilets, player_rect):
         """Jilet oluştur - Ekran kenarından (level bazlı hız, saldırı mesafesi ve gecikme)"""
@@ -659,36 +712,29 @@ class SpawnManager:
         attack_delay = self.get_jilet_attack_delay()
         
         # Jilet için offset kullan (farklı offset değeri)
-        edge = random.choice(['top', 'bottom', 'left', 'right'])
+        edge = self.rng.choice(['top', 'bottom', 'left', 'right'])
         
         if edge == 'top':
-            x = random.randint(ENEMY_SPAWN_MARGIN, self.screen_w - ENEMY_SPAWN_MARGIN)
+            x = self.rng.randint(ENEMY_SPAWN_MARGIN, self.screen_w - ENEMY_SPAWN_MARGIN)
             y = -ENEMY_SPAWN_OFFSET
         elif edge == 'bottom':
-            x = random.randint(ENEMY_SPAWN_MARGIN, self.screen_w - ENEMY_SPAWN_MARGIN)
+            x = self.rng.randint(ENEMY_SPAWN_MARGIN, self.screen_w - ENEMY_SPAWN_MARGIN)
             y = self.screen_h + ENEMY_SPAWN_OFFSET
         elif edge == 'left':
             x = -ENEMY_SPAWN_OFFSET
-            y = random.randint(ENEMY_SPAWN_MARGIN, self.screen_h - ENEMY_SPAWN_MARGIN)
+            y = self.rng.randint(ENEMY_SPAWN_MARGIN, self.screen_h - ENEMY_SPAWN_MARGIN)
         else:  # right
             x = self.screen_w + ENEMY_SPAWN_OFFSET
-            y = random.randint(ENEMY_SPAWN_MARGIN, self.screen_h - ENEMY_SPAWN_MARGIN)
+            y = self.rng.randint(ENEMY_SPAWN_MARGIN, self.screen_h - ENEMY_SPAWN_MARGIN)
         
-        jilet = SinsiJilet(x, y, JILET_SCALE, attack_distance, attack_delay)
-        jilet.speed_sneak *= self.speed_multiplier
-        jilet.speed_attack *= self.speed_multiplier
-        jilets.add(jilet)
+        jilets.spawn(x, y,
+                     JILET_SNEAK_SPEED * self.speed_multiplier,
+                     JILET_ATTACK_SPEED * self.speed_multiplier,
+                     attack_distance, attack_delay)
     
     def _spawn_terlik(self, terliks, player_rect):
         """Terlik oluştur - Oyuncuya doğru fırlat (level bazlı hız)"""
-        terlik = UcanTerlik(
-            self.screen_w, 
-            self.screen_h, 
-            player_rect.center,
-            TERLIK_SCALE
-        )
-        terlik.speed *= self.speed_multiplier
-        terliks.add(terlik)
+        terliks.launch(player_rect.center, TERLIK_SPEED * self.speed_multiplier, self.rng)
 
 
 # =============================================================================
@@ -698,27 +744,35 @@ class SpawnManager:
 class SpeedPowerup(GameObject):
     """Hız Değiştirici - Buff veya Debuff olabilir"""
     
-    def __init__(self, x, y, is_buff=True, scale=1.0):
+    def __init__(self, x, y, is_buff=True, scale=1.0, rng=random):
         super().__init__(x, y)
         self.is_buff = is_buff
         
         # Görsel yükle
         image_name = 'speed_buff.png' if is_buff else 'speed_debuff.png'
         self.image = Assets.load_scaled(f'assets/game/{image_name}', scale)
-        self.rect = self.image.get_rect(center=(x, y))
-        
-        # Konum
-        self.base_x = x
-        self.base_y = y
         
         # Yaşam süresi
         self.lifetime = BUFF_LIFETIME
-        self.age = 0
         
         # Animasyon - buff daha hızlı, debuff daha yavaş
-        self.float_offset = random.uniform(0, math.pi * 2)
         self.float_speed = 3.0 if is_buff else 2.0
         self.float_amplitude = 8 if is_buff else 6
+        
+        self.activate(x, y, rng)
+    
+    def activate(self, x, y, rng=random):
+        """Yeni buff/debuff olarak başlat (oluşturulunca ve havuzdan alınınca)"""
+        self._place(x, y)
+        self.rect = self.image.get_rect(center=(x, y))
+        
+        # Konum
+        self.base_x = x
+        self.base_y = y
+        self.age = 0
+        
+        # Animasyon
+        self.float_offset = rng.uniform(0, math.pi * 2)
         self.pulse_timer = 0
         self.visible = True
     
@@ -731,8 +785,7 @@ class SpeedPowerup(GameObject):
             return False  # Silinmeli
         
         # Yukarı aşağı süzülme
-        elapsed = pygame.time.get_ticks() / 1000.0
-        offset = math.sin(elapsed * self.float_speed + self.float_offset) * self.float_amplitude
+        offset = math.sin(self.age * self.float_speed + self.float_offset) * self.float_amplitude
         self.rect.centery = self.base_y + offset
         
         # Son 2 saniyede yanıp sönme
@@ -750,11 +803,11 @@ class SpeedPowerup(GameObject):
 
 
 # Geriye uyumluluk için alias'lar
-def SpeedBuff(x, y, scale=1.0):
+def SpeedBuff(x, y, scale=1.0, rng=random):
     """Hız Artışı - Toplandığında oyuncuyu hızlandırır"""
-    return SpeedPowerup(x, y, is_buff=True, scale=scale)
+    return SpeedPowerup(x, y, is_buff=True, scale=scale, rng=rng)
 
 
-def SpeedDebuff(x, y, scale=1.0):
+def SpeedDebuff(x, y, scale=1.0, rng=random):
     """Hız Azalması - Toplandığında oyuncuyu yavaşlatır"""
-    return SpeedPowerup(x, y, is_buff=False, scale=scale)
+    return SpeedPowerup(x, y, is_buff=False, scale=scale, rng=rng)
@@ -0,0 +1,195 @@
+"""
+Bıyık Bey'in Çilesi - Headless Simülasyon
+Ekran ve ses olmadan PlayingState'i gerçek zamandan hızlı çalıştırır
+
+Kullanım:
+    python headless.py --start-level 500 --levels 1000
+    python headless.py --start-level 1 --seconds 3600 --draw-every 10
+"""
+
+import os
+
+# SDL sürücüleri pygame import edilmeden önce seçilmeli
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import argparse
+import random
+import tempfile
+import time
+import pygame
+from engine import GameEngine, Audio
+from highscore import highscores
+from settings import HEADLESS_SCREEN_SIZE, HEADLESS_START_LEVEL, HEADLESS_LEVEL_COUNT, HEADLESS_MAX_DEATHS
+
+
+class HeadlessEngine(GameEngine):
+    """Ekransız motor - display.flip ve clock.tick olmadan adım adım ilerler"""
+    
+    def __init__(self, screen_size=HEADLESS_SCREEN_SIZE):
+        super().__init__(screen_size)
+        # Rekor dosyasına dokunma (soak testleri gerçek rekoru değiştirmesin)
+        highscores.set_path(os.path.join(tempfile.gettempdir(), 'biyik_headless_highscore.json'))
+    
+    def run(self):
+        """Headless motorda etkileşimli döngü yok - HeadlessRunner kullanın"""
+        raise RuntimeError("HeadlessEngine.run desteklenmiyor, HeadlessRunner kullanın")
+
+
+class HeadlessRunner:
+    """PlayingState'i CPU'nun izin verdiği hızda, sabit dt ile çalıştırır"""
+    
+    def __init__(self, engine, start_level=HEADLESS_START_LEVEL, draw_every=0, god_mode=True, seed=None):
+        """
+        Parametreler:
+            engine: HeadlessEngine örneği
+            start_level: Başlangıç leveli (LevelSelector'daki gibi)
+            draw_every: Kaç tickte bir draw çağrılacağı (0 = hiç çizme)
+            god_mode: Oyuncu hasar almasın (yüksek levellerde sürekli ölmeyi önler)
+            seed: Tekrarlanabilir çalışma için seed (None = rastgele)
+        """
+        self.engine = engine
+        self.start_level = max(1, start_level)
+        self.draw_every = draw_every
+        self.god_mode = god_mode
+        self.rng = random.Random(seed)
+        
+        # İstatistikler
+        self.ticks = 0
+        self.sim_ticks = 0
+        self.levels_completed = 0
+        self.deaths = 0
+        self.max_entities = 0
+        self.wall_time = 0.0
+        
+        self.state = None
+        self._start_state(self.start_level)
+    
+    def _start_state(self, level):
+        """Verilen levelden yeni bir oyun başlat"""
+        from states import PlayingState
+        self.state = PlayingState(self.engine, level, self.rng.getrandbits(32))
+        self.state.player.god_mode = self.god_mode
+        self.engine.change_state(self.state)
+    
+    def _press_start(self):
+        """Level başlangıç/tamamlanma ekranını SPACE ile geç"""
+        self.state.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=' '))
+    
+    def tick(self):
+        """Tek simülasyon adımı"""
+        state = self.state
+        
+        if state.game_over:
+            # Öldüyse ulaşılan levelden devam et
+            self._start_state(state.spawn_manager.level)
+            state = self.state
+        
+        if state.waiting_for_start:
+            self._press_start()
+        elif state.spawn_manager.level_complete:
+            self.levels_completed += 1
+            self._press_start()
+        
+        state.update(self.engine.sim_dt)
+        if state.game_over:
+            self.deaths += 1
+        self.ticks += 1
+        if state.simulation_active:
+            self.sim_ticks += 1
+        
+        entities = len(state.bombs) + len(state.jilets) + len(state.terliks)
+        if entities > self.max_entities:
+            self.max_entities = entities
+        
+        if self.draw_every and self.ticks % self.draw_every == 0:
+            state.draw(self.engine.screen)
+        
+        # Ses kanalı bitiş olayları GameEngine.run'daki gibi işlenir (kanal sayaçları doğru kalsın)
+        for event in pygame.event.get():
+            Audio.handle_event(event)
+    
+    def run(self, levels=HEADLESS_LEVEL_COUNT, max_sim_seconds=None, max_deaths=HEADLESS_MAX_DEATHS):
+        """
+        Koşul sağlanana kadar çalıştır
+        
+        Parametreler:
+            levels: Tamamlanacak level sayısı
+            max_sim_seconds: Simüle edilecek maksimum süre (saniye, None = sınırsız)
+            max_deaths: Bu kadar ölümde dur (None = sınırsız) - geçilemeyen levelde sonsuz
+                        döngüyü önler
+        
+        Döndürür:
+            Rapor sözlüğü (bkz. report)
+        """
+        max_sim_ticks = None
+        if max_sim_seconds is not None:
+            max_sim_ticks = int(max_sim_seconds / self.engine.sim_dt)
+        
+        start = time.perf_counter()
+        while self.levels_completed < levels:
+            if max_sim_ticks is not None and self.sim_ticks >= max_sim_ticks:
+                break
+            if max_deaths is not None and self.deaths >= max_deaths:
+                break
+            self.tick()
+        self.wall_time += time.perf_counter() - start
+        
+        return self.report()
+    
+    def report(self):
+        """Çalışma istatistikleri"""
+        sim_seconds = self.sim_ticks * self.engine.sim_dt
+        wall = max(self.wall_time, 1e-9)
+        return {
+            'start_level': self.start_level,
+            'final_level': self.state.spawn_manager.level,
+            'levels_completed': self.levels_completed,
+            'deaths': self.deaths,
+            'ticks': self.ticks,
+            'sim_seconds': sim_seconds,
+            'wall_seconds': self.wall_time,
+            'ticks_per_second': self.ticks / wall,
+            'realtime_factor': sim_seconds / wall,
+            'max_entities': self.max_entities,
+            'pools': self.state.pool_stats(),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless (ekransız) simülasyon çalıştırıcı")
+    parser.add_argument('--start-level', type=int, default=HEADLESS_START_LEVEL,
+                        help="Başlangıç leveli")
+    parser.add_argument('--levels', type=int, default=HEADLESS_LEVEL_COUNT,
+                        help="Tamamlanacak level sayısı")
+    parser.add_argument('--seconds', type=float, default=None,
+                        help="Simüle edilecek maksimum süre (saniye)")
+    parser.add_argument('--draw-every', type=int, default=0,
+                        help="Kaç tickte bir draw çağrılsın (0 = çizme)")
+    parser.add_argument('--mortal', action='store_true',
+                        help="Oyuncu hasar alabilsin (ölünce ulaşılan levelden devam edilir)")
+    parser.add_argument('--max-deaths', type=int, default=HEADLESS_MAX_DEATHS,
+                        help="Bu kadar ölümde dur (--mortal ile; 0 = sınırsız)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Tekrarlanabilir çalışma için seed")
+    args = parser.parse_args()
+    
+    engine = HeadlessEngine()
+    runner = HeadlessRunner(engine, args.start_level, args.draw_every, not args.mortal, args.seed)
+    report = runner.run(args.levels, args.seconds, args.max_deaths or None)
+    
+    print(f"Level {report['start_level']} -> {report['final_level']} "
+          f"({report['levels_completed']} level tamamlandı, {report['deaths']} ölüm)")
+    print(f"{report['ticks']} tick, {report['sim_seconds']:.1f} sn simülasyon, "
+          f"{report['wall_seconds']:.2f} sn gerçek süre")
+    print(f"Hız: {report['ticks_per_second']:.0f} tick/sn, "
+          f"gerçek zamanın {report['realtime_factor']:.1f} katı")
+    print(f"Maksimum eşzamanlı düşman: {report['max_entities']}")
+    print("Havuzlar: " + ", ".join(f"{name} {s['live']}/{s['live'] + s['free']} (en fazla {s['high_water']})"
+                                   for name, s in report['pools'].items()))
+    
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Bıyık Bey'in Çilesi - Rekor Deposu
+Rekor dosyası bir kez okunur, sonraki okumalar bellekten yapılır
+
+    - Değişiklikler arka plan thread'inde diske yazılır (write-behind); ana döngü dosya beklemez
+    - Yazma geçici dosya + os.replace ile yapılır, yarım kalan yazma rekor dosyasını bozmaz
+    - Arka arkaya gelen değişikliklerde sadece son değer yazılır
+    - Rekor değişince abone olan fonksiyonlar çağrılır (UI bilgisini günceller)
+
+Kullanım:
+    from highscore import highscores
+    highscores.get()                       # {'level': 12, 'date': '2025-01-01 12:00'}
+    highscores.submit(level, start_level)  # Yeni rekorsa True
+    highscores.subscribe(callback)         # callback(rekor) - değişince çağrılır
+    highscores.flush()                     # Çıkışta bekleyen yazmayı bitir
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from settings import *
+
+
+EMPTY = {'level': 0, 'date': None}
+
+
+def read_file(path):
+    """Rekor dosyasını oku (yoksa veya bozuksa boş rekor)"""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return {'level': int(data['level']), 'date': data.get('date')}
+    except (OSError, ValueError, KeyError, TypeError):
+        return dict(EMPTY)
+
+
+def write_file(path, data):
+    """Rekoru yaz (data None ise dosyayı sil) - geçici dosya + rename"""
+    try:
+        if data is None:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Rekor kaydedilemedi: {path} - {e}")
+
+
+class HighscoreStore:
+    """Bellekteki rekor + arka planda diske yazan thread"""
+    
+    _NOTHING = object()  # Bekleyen yazma yok (None = dosyayı sil)
+    
+    def __init__(self, path):
+        self.path = path
+        self._data = None          # İlk get()'te dosyadan okunur
+        self._listeners = []
+        
+        # Yazıcı thread - bekleyen değer (_NOTHING = yazılacak bir şey yok)
+        self._condition = threading.Condition()
+        self._pending = self._NOTHING
+        self._writing = False
+        self._thread = None
+        self.writes = 0
+    
+    def set_path(self, path):
+        """Başka bir dosya kullan (bekleyen yazma önce eski dosyaya biter)"""
+        self.flush()
+        self.path = path
+        self._data = None
+    
+    def get(self):
+        """Güncel rekor (değiştirilmemeli) - {'level': int, 'date': str veya None}"""
+        if self._data is None:
+            self._data = read_file(self.path)
+        return self._data
+    
+    def submit(self, level, start_level=1):
+        """
+        Oyun sonucunu bildir - sadece level 1'den başlayanların rekoru kaydedilir
+        
+        Döndürür:
+            Yeni rekorsa True
+        """
+        if start_level != 1 or level <= self.get()['level']:
+            return False
+        self._set({'level': level, 'date': datetime.now().strftime('%Y-%m-%d %H:%M')})
+        return True
+    
+    def reset(self):
+        """Rekoru sıfırla (dosya arka planda silinir)"""
+        self._set(dict(EMPTY), persist=None)
+    
+    def _set(self, data, persist=_NOTHING):
+        self._data = data
+        self._schedule(data if persist is self._NOTHING else persist)
+        for callback in list(self._listeners):
+            callback(data)
+    
+    # =========================================================================
+    # ABONELER
+    # =========================================================================
+    
+    def subscribe(self, callback):
+        """Rekor değişince callback(rekor) çağrılsın (ana thread'de)"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+    
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    # =========================================================================
+    # YAZICI THREAD
+    # =========================================================================
+    
+    def _schedule(self, data):
+        """Değeri yazılmak üzere bırak - önceki yazılmamış değerin yerine geçer"""
+        with self._condition:
+            self._pending = data
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='highscore-writer', daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+    
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is self._NOTHING:
+                    self._condition.wait()
+                data, path = self._pending, self.path
+                self._pending = self._NOTHING
+                self._writing = True
+            write_file(path, data)
+            with self._condition:
+                self._writing = False
+                self.writes += 1
+                self._condition.notify_all()
+    
+    def flush(self, timeout=2.0):
+        """
+        Bekleyen yazmanın bitmesini bekle (çıkışta çağrılır)
+        
+        Döndürür:
+            Yazılacak bir şey kalmadıysa True
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is self._NOTHING and not self._writing, timeout)
+
+
+# Oyunun tek rekor deposu
+highscores = HighscoreStore(SAVE_FILE)
@@ -5,18 +5,47 @@ Bıyık Bey'in Çilesi - Ana Giriş Noktası
 Dosya Yapısı:
     main.py      - Oyunu başlatır
     engine.py    - Oyun motoru (GameEngine, Assets, Audio, GameState)
-    states.py    - Oyun durumları (MenuState, PlayingState)
+    states.py    - Oyun durumları (LoadingState, MenuState, PlayingState)
     player.py    - Oyuncu karakteri
     ui.py        - Arayüz bileşenleri (butonlar, ses kontrolü)
     settings.py  - Oyun ayarları ve sabitler
+    headless.py  - Ekransız, gerçek zamandan hızlı simülasyon çalıştırıcı
+    replay.py    - Giriş/seed kaydı ve birebir yeniden oynatma
+    benchmark.py - Update/çarpışma/çizim senaryo benchmark'ı
+    profiler.py  - Oyun içi kare süresi göstergesi (F3)
+    atlas.py     - Sprite atlas oluşturucu (build/atlas)
+    surface_cache.py - Çözülmüş/ölçeklenmiş görsellerin disk önbelleği
+    preloader.py - Paralel asset ön yükleyici (LoadingState)
+    surface_format.py - Görsel başına en hızlı Surface formatının seçimi
+    sound_bank.py - Ses efektlerinin arka planda çözülmesi ve PCM disk önbelleği
+    voices.py    - Ses efekti kanallarının kategori/öncelik ile yönetimi
+    music.py     - Boşluksuz intro/loop ve geçişli müzik çalma
+    audio_latency.py - Buffer boyutu başına ses gecikmesi/underrun ölçümü
+    highscore.py - Bellekteki rekor ve arka planda atomik kaydı
+    entities.py  - Düşman durumlarının NumPy sütunlarında tutulması
+    collision.py - Oyuncuya karşı toplu (vektörel) çarpışma kontrolü
+    spatial.py   - Yakınlık sorguları için eşit hücreli uzamsal ızgara
+    pool.py      - Bomba ve buff nesnelerinin havuzlanması
+    animation.py - Paylaşılan animasyon klipleri ve simülasyon saati
     assets/      - Görseller ve sesler
+
+Kullanım:
+    python main.py
+    python main.py --audio-profile low_latency
 """
 
+import argparse
 from engine import GameEngine
+from settings import AUDIO_PROFILE, AUDIO_PROFILES
 
 
 def main():
-    engine = GameEngine()
+    parser = argparse.ArgumentParser(description="Bıyık Bey'in Çilesi")
+    parser.add_argument('--audio-profile', choices=sorted(AUDIO_PROFILES), default=AUDIO_PROFILE,
+                        help="Ses gecikme profili (settings.AUDIO_PROFILES)")
+    args = parser.parse_args()
+    
+    engine = GameEngine(audio_profile=args.audio_profile)
     engine.run()
 
 
@@ -0,0 +1,129 @@
+"""
+Bıyık Bey'in Çilesi - Müzik Kontrolcüsü
+Müzik parçalarını önceden çözülmüş Sound olarak iki ayrılmış kanalda çalar
+
+    - Intro bitince loop, mixer içinde kuyruktan (Channel.queue) boşluksuz başlar;
+      ana döngüde dosya yüklenmez
+    - Parçalar arası geçişte eski kanal kısılırken yeni kanal açılır (crossfade)
+    - Parçalar ses bankası ile arka planda çözülür ve PCM disk önbelleğine yazılır
+
+Kullanım:
+    music = MusicController(paths, first_channel, end_event)
+    music.play_with_intro('menu_intro', 'menu_loop')
+    music.play('game', fade_ms=800)       # Menü müziği kısılırken oyun müziği açılır
+"""
+
+import pygame
+from sound_bank import SoundBank
+
+
+class MusicController:
+    """İki kanal arasında geçişli, intro + loop destekli müzik çalar"""
+    
+    def __init__(self, paths, first_channel, end_event):
+        """
+        Parametreler:
+            paths: {parça adı: dosya yolu}
+            first_channel: Müziğe ayrılan ilk mixer kanalı (bu ve sonraki kanal kullanılır)
+            end_event: Kanal bitince gönderilecek olay tipi (event.code = kanal numarası)
+        """
+        self.bank = SoundBank(paths)
+        self.bank.start()
+        
+        pygame.mixer.set_num_channels(first_channel + 2)
+        pygame.mixer.set_reserved(first_channel + 2)
+        self.first_channel = first_channel
+        self.channels = [pygame.mixer.Channel(first_channel), pygame.mixer.Channel(first_channel + 1)]
+        for channel in self.channels:
+            channel.set_endevent(end_event)
+        
+        # Kuyruktaki loop'un yerine konan kısa sessizlik (64 örnek)
+        frequency, size, channels = pygame.mixer.get_init()
+        self._silence = pygame.mixer.Sound(buffer=bytes(abs(size) // 8 * channels * 64))
+        
+        self.volume = 1.0
+        self._current = 0                 # Çalan parçanın kanalı (0 veya 1)
+        self._loops = [None, None]        # Kanal başına, bitince tekrar kuyruğa alınacak loop
+        self.track = None                 # Çalan parçanın adı
+    
+    def play(self, name, fade_ms=0):
+        """Parçayı sürekli çal"""
+        return self.play_with_intro(None, name, fade_ms)
+    
+    def play_with_intro(self, intro, loop, fade_ms=0):
+        """
+        Intro bir kez, ardından loop sürekli çalsın
+        
+        Parametreler:
+            intro: Intro parça adı (None ise sadece loop)
+            loop: Loop parça adı
+            fade_ms: Önceki parçadan geçiş süresi (ms)
+        
+        Döndürür:
+            Parça henüz çözülmediyse veya yoksa False
+        """
+        loop_sound = self.bank.get(loop)
+        intro_sound = self.bank.get(intro) if intro else None
+        if loop_sound is None or (intro and intro_sound is None):
+            return False
+        
+        self.fade_out(fade_ms)
+        self._current ^= 1
+        channel = self.channels[self._current]
+        channel.set_volume(self.volume)
+        if intro_sound:
+            channel.play(intro_sound, fade_ms=fade_ms)
+            channel.queue(loop_sound)
+            self._loops[self._current] = loop_sound
+        else:
+            channel.play(loop_sound, loops=-1, fade_ms=fade_ms)
+        self.track = loop
+        return True
+    
+    def fade_out(self, fade_ms=0):
+        """Çalan parçayı kıs (0 ise hemen durdur) - mixer içinde, kareyi bekletmez"""
+        channel = self.channels[self._current]
+        self._drop_queue(self._current)
+        if fade_ms > 0:
+            channel.fadeout(fade_ms)
+        else:
+            channel.stop()
+        self.track = None
+    
+    def stop(self):
+        """İki kanalı da hemen durdur"""
+        for index, channel in enumerate(self.channels):
+            self._drop_queue(index)
+            channel.stop()
+        self.track = None
+    
+    def _drop_queue(self, index):
+        """
+        Kanalın kuyruğundaki loop'u at
+        
+        Channel.queue fadeout() ve stop()'tan sonra da geçerlidir: kanal bitince kuyruktaki ses
+        tam seste başlar. Kuyruk boşaltılamadığı için loop'un yerine sessizlik konur.
+        """
+        self._loops[index] = None
+        channel = self.channels[index]
+        if channel.get_busy():
+            channel.queue(self._silence)
+    
+    def set_volume(self, volume):
+        self.volume = volume
+        self.channels[self._current].set_volume(volume)
+    
+    def handle_end(self, event):
+        """
+        Kanal bitiş olayı: kuyruktaki loop çalmaya başladı, bir sonraki tur için tekrar kuyruğa al
+        
+        Döndürür:
+            Olay müzik kanalına aitse True
+        """
+        index = event.code - self.first_channel
+        if not 0 <= index < len(self.channels):
+            return False
+        loop_sound = self._loops[index]
+        if loop_sound is not None:
+            self.channels[index].queue(loop_sound)
+        return True
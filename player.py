@@ -4,15 +4,22 @@ WASD ile hareket eden ana karakter
 """
 
 import pygame
-from engine import Assets, Audio
+from engine import Audio, interpolated_rect
+from animation import clock, load_clip, get_clip
 from settings import (PLAYER_MAX_HEALTH, PLAYER_START_HEALTH, PLAYER_INVINCIBILITY_TIME,
                       BUFF_EFFECT_DURATION, SPEED_BUFF_MULTIPLIER, SPEED_DEBUFF_MULTIPLIER,
-                      PLAYER_COLLISION_SHRINK)
+                      PLAYER_COLLISION_SHRINK, BASE_TICK_RATE,
+                      INPUT_UP, INPUT_DOWN, INPUT_LEFT, INPUT_RIGHT)
 
 
 class Player(pygame.sprite.Sprite):
     """Ana oyuncu karakteri"""
     
+    # Animasyon klipleri (yön başına yürüme klibinin adı önceden hazır - karede string oluşturulmaz)
+    IDLE_CLIP = 'player_idle'
+    WALK_CLIPS = {facing: f'player_walk_{facing}' for facing in ('down', 'up', 'left', 'right')}
+    WALK_FRAME_TIME = 1 / (0.15 * BASE_TICK_RATE)
+    
     def __init__(self, x, y):
         super().__init__()
         
@@ -32,36 +39,36 @@ class Player(pygame.sprite.Sprite):
         self.invincible_duration = PLAYER_INVINCIBILITY_TIME
         self.blink_timer = 0
         self.visible = True
+        self.god_mode = False  # Hasar almaz (headless soak testleri için)
         
         # Buff/Debuff sistemi
         self.speed_buff_timer = 0
         self.speed_debuff_timer = 0
         self.buff_duration = BUFF_EFFECT_DURATION
         
-        # Animasyon
-        self.anim_speed = 0.15
-        self.frame_index = 0
-        
+        # Animasyon - oynayan klip ve başladığı simülasyon adımı
         self._load_animations()
-        self.image = self.anims['idle']
+        self.clip = self.IDLE_CLIP
+        self.anim_start = clock.ticks
+        self.image = get_clip(self.IDLE_CLIP).frames[0]
         self.rect = self.image.get_rect(center=(x, y))
+        
+        # Simülasyon konumu (float) ve interpolasyon için önceki adımın konumu
+        self.pos = pygame.math.Vector2(x, y)
+        self.prev_pos = pygame.math.Vector2(x, y)
     
     def _load_animations(self):
-        """Animasyonları yükle"""
+        """Animasyon kliplerini kaydet (kareler ilk oyuncuda bir kez yüklenir)"""
         scale = 1.3
-        self.anims = {
-            'idle': Assets.load_scaled('assets/player/idle_stand.png', scale)
-        }
+        load_clip(self.IDLE_CLIP, ['assets/player/idle_stand.png'], scale, 1.0)
         
-        for dir in ['down', 'up', 'left', 'right']:
-            self.anims[f'walk_{dir}'] = [
-                Assets.load_scaled(f'assets/player/walk_{dir}_1.png', scale),
-                Assets.load_scaled(f'assets/player/walk_{dir}_2.png', scale)
-            ]
+        for facing, clip_id in self.WALK_CLIPS.items():
+            load_clip(clip_id, [f'assets/player/walk_{facing}_1.png', f'assets/player/walk_{facing}_2.png'],
+                      scale, self.WALK_FRAME_TIME)
     
     def take_damage(self, amount=1):
         """Hasar al"""
-        if self.invincible:
+        if self.invincible or self.god_mode:
             return False
         
         self.health = max(0, self.health - amount)
@@ -120,10 +127,17 @@ class Player(pygame.sprite.Sprite):
             return self.speed_debuff_timer
         return 0
     
-    def update(self, screen_w, screen_h, dt=1/60):
-        """Her frame güncelle"""
-        self._handle_input()
-        self._move(screen_w, screen_h)
+    def set_position(self, x, y):
+        """Oyuncuyu ışınla (interpolasyon olmadan)"""
+        self.pos.x, self.pos.y = x, y
+        self.prev_pos.x, self.prev_pos.y = x, y
+        self.rect.center = self.pos
+    
+    def update(self, screen_w, screen_h, dt=1/60, input_bits=0):
+        """Bir simülasyon adımı güncelle (input_bits: INPUT_* bitleri)"""
+        step = dt * BASE_TICK_RATE  # Kare başına tanımlı sabitleri adım süresine ölçekle
+        self._handle_input(input_bits)
+        self._move(screen_w, screen_h, step)
         self._animate()
         self._update_invincibility(dt)
         self._update_buffs(dt)
@@ -159,22 +173,21 @@ class Player(pygame.sprite.Sprite):
                 self.invincible = False
                 self.visible = True
     
-    def _handle_input(self):
-        """Klavye girişi"""
-        keys = pygame.key.get_pressed()
+    def _handle_input(self, input_bits):
+        """Giriş bitlerine göre yön belirle (klavye veya replay)"""
         self.direction.x = 0
         self.direction.y = 0
         
-        if keys[pygame.K_w]:
+        if input_bits & INPUT_UP:
             self.direction.y = -1
             self.facing = 'up'
-        if keys[pygame.K_s]:
+        if input_bits & INPUT_DOWN:
             self.direction.y = 1
             self.facing = 'down'
-        if keys[pygame.K_a]:
+        if input_bits & INPUT_LEFT:
             self.direction.x = -1
             self.facing = 'left'
-        if keys[pygame.K_d]:
+        if input_bits & INPUT_RIGHT:
             self.direction.x = 1
             self.facing = 'right'
         
@@ -184,32 +197,31 @@ class Player(pygame.sprite.Sprite):
         else:
             self.is_moving = False
     
-    def _move(self, screen_w, screen_h):
+    def _move(self, screen_w, screen_h, step):
         """Hareket ve sınır kontrolü"""
-        self.rect.x += self.direction.x * self.speed
-        self.rect.y += self.direction.y * self.speed
+        self.prev_pos.x, self.prev_pos.y = self.pos.x, self.pos.y
+        self.pos += self.direction * (self.speed * step)
         
-        self.rect.left = max(0, self.rect.left)
-        self.rect.right = min(screen_w, self.rect.right)
-        self.rect.top = max(0, self.rect.top)
-        self.rect.bottom = min(screen_h, self.rect.bottom)
+        half_w = self.rect.width / 2
+        half_h = self.rect.height / 2
+        self.pos.x = max(half_w, min(screen_w - half_w, self.pos.x))
+        self.pos.y = max(half_h, min(screen_h - half_h, self.pos.y))
+        self.rect.center = self.pos
     
     def _animate(self):
-        """Animasyon güncelle"""
-        if self.is_moving:
-            frames = self.anims[f'walk_{self.facing}']
-            self.frame_index += self.anim_speed
-            if self.frame_index >= len(frames):
-                self.frame_index = 0
-            self.image = frames[int(self.frame_index)]
-        else:
-            self.image = self.anims['idle']
-            self.frame_index = 0
-    
-    def draw(self, screen):
-        """Ekrana çiz"""
+        """Animasyon güncelle - kare simülasyon saatinden seçilir"""
+        clip_id = self.WALK_CLIPS[self.facing] if self.is_moving else self.IDLE_CLIP
+        if clip_id != self.clip:
+            # Yürümeye başlayınca klip baştan başlar; yürürken yön değişince adım ritmi korunur
+            if self.IDLE_CLIP in (clip_id, self.clip):
+                self.anim_start = clock.ticks
+            self.clip = clip_id
+        self.image = get_clip(clip_id).frame(clock.elapsed(self.anim_start))
+    
+    def draw(self, screen, alpha=1.0):
+        """Ekrana çiz (alpha: önceki ve mevcut adım arası interpolasyon oranı)"""
         if self.visible:
-            screen.blit(self.image, self.rect)
+            screen.blit(self.image, interpolated_rect(self.rect, self.prev_pos, self.pos, alpha))
     
     def get_collision_rect(self):
         """Çarpışma için daha küçük bir rect döndür"""
@@ -0,0 +1,64 @@
+"""
+Bıyık Bey'in Çilesi - Nesne Havuzu
+Bomba ve buff gibi sık oluşturulup atılan nesneleri yeniden kullanır
+
+    - acquire(...) boştaki bir nesneyi activate(...) ile yeni nesne gibi başlatır
+    - release(nesne) nesneyi reset() ile temizler ve boşa alır (GC'ye bırakılmaz)
+    - prewarm(n) level başında n nesneyi önceden oluşturur; dalga ortasında yeni nesne oluşturulmaz
+    - İstatistikler: canlı, boşta, aynı anda en fazla canlı (high_water)
+
+Havuzdaki nesneler activate(...) ve reset() metodlarını sağlamalıdır (game_objects.GameObject).
+
+Kullanım:
+    pool = ObjectPool(lambda: Bomb(0, 0, BOMB_SCALE))
+    pool.prewarm(8)
+    bomb = pool.acquire(x, y, fuse_time)
+    pool.release(bomb)
+"""
+
+
+class ObjectPool:
+    """Tek türden nesnelerin havuzu"""
+    
+    def __init__(self, factory):
+        """
+        Parametreler:
+            factory: Argümansız çağrılıp boşta bekleyecek yeni nesne döndüren fonksiyon
+        """
+        self.factory = factory
+        self._free = []
+        self.live = 0
+        self.high_water = 0  # Aynı anda en fazla canlı nesne
+        self.created = 0     # Toplam oluşturulan nesne
+    
+    def _create(self):
+        obj = self.factory()
+        obj._pool_free = True
+        self.created += 1
+        return obj
+    
+    def prewarm(self, count):
+        """Canlı + boştaki nesne sayısını en az `count` yap"""
+        while self.live + len(self._free) < count:
+            self._free.append(self._create())
+    
+    def acquire(self, *args, **kwargs):
+        """Boştaki nesneyi (yoksa yenisini) activate(*args, **kwargs) ile başlatıp döndür"""
+        obj = self._free.pop() if self._free else self._create()
+        obj._pool_free = False
+        obj.activate(*args, **kwargs)
+        self.live += 1
+        self.high_water = max(self.high_water, self.live)
+        return obj
+    
+    def release(self, obj):
+        """Nesneyi havuza geri ver (zaten boştaysa bir şey yapılmaz)"""
+        if obj._pool_free:
+            return
+        obj.reset()
+        obj._pool_free = True
+        self.live -= 1
+        self._free.append(obj)
+    
+    def stats(self):
+        return {'live': self.live, 'free': len(self._free), 'high_water': self.high_water}
@@ -0,0 +1,126 @@
+"""
+Bıyık Bey'in Çilesi - Paralel Asset Ön Yükleyici
+Görselleri thread havuzunda çözer; ekran formatına çevirme, ölçekleme ve önbelleğe yazma ana thread'de yapılır
+
+    - Worker thread'ler sadece dosya çözer (pygame.image.load); Assets durumuna dokunmaz
+    - Her dosya bir kez çözülür (aynı dosyanın farklı boyutları aynı kaynaktan üretilir)
+
+Kullanım:
+    preloader = AssetPreloader(specs)   # specs: [('load_scaled', yol, ölçek), ...]
+    preloader.start()
+    while not preloader.finished:
+        preloader.poll()                # Her karede, süre bütçesi kadar iş
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+import surface_cache
+from engine import Assets
+from settings import *
+
+
+class AssetPreloader:
+    """Assets.load_* tanımlarını arka planda çözüp ana thread'de önbelleğe alır"""
+    
+    def __init__(self, specs, workers=PRELOAD_WORKERS):
+        """
+        Parametreler:
+            specs: Assets.load_spec tanımları [('load_image', yol, boyut), ...]
+            workers: Çözme thread'i sayısı
+        """
+        self.specs = list(dict.fromkeys(specs))  # Aynı tanım iki kez yüklenmesin
+        self.workers = workers
+        
+        # İlerleme
+        self.done = 0
+        self.total = len(self.specs)
+        # Dosya boyutu sadece ilk tanımında sayılır (aynı dosyanın diğer boyutları 0)
+        sizes = {spec[1]: self._file_size(spec[1]) for spec in self.specs}
+        self._sizes = [sizes.pop(spec[1], 0) for spec in self.specs]
+        self.bytes_done = 0
+        self.bytes_total = sum(self._sizes)
+        
+        self._executor = None
+        self._futures = {}  # yol -> Future (sadece çözülmesi gereken dosyalar)
+    
+    @staticmethod
+    def _file_size(path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+    
+    @property
+    def finished(self):
+        return self.done >= self.total
+    
+    @property
+    def progress(self):
+        """0-1 arası ilerleme (bayt üzerinden)"""
+        if self.bytes_total:
+            return self.bytes_done / self.bytes_total
+        return 1.0 if self.finished else self.done / self.total
+    
+    def start(self):
+        """Çözülmesi gereken dosyaları (dosya başına bir iş) thread havuzuna gönder"""
+        # Atlas ekran formatına çevrildiği için ana thread'de yüklenir
+        atlas = Assets._load_atlas()
+        paths = dict.fromkeys(spec[1] for spec in self.specs if self._needs_decode(spec, atlas))
+        if paths:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='preload')
+            # pygame.image.load GIL'i bırakır
+            self._futures = {path: self._executor.submit(pygame.image.load, path) for path in paths}
+    
+    @staticmethod
+    def _needs_decode(spec, atlas):
+        """Bellekte, atlas'ta veya disk önbelleğinde hazır olmayan görsel mi (ana thread)"""
+        key = Assets.cache_key(*spec)
+        if Assets.is_cached(key) or key in atlas:
+            return False
+        if SURFACE_CACHE_ENABLED:
+            cached = surface_cache.cache_path(spec[1], key)
+            if cached and os.path.exists(cached):
+                return False
+        return True
+    
+    def poll(self, budget=PRELOAD_FRAME_BUDGET_MS / 1000.0):
+        """
+        Ana thread: çözülmüş görselleri sırayla işle (ekran formatı, ölçekleme, önbellek)
+        
+        Parametreler:
+            budget: Bu çağrıda harcanabilecek en fazla süre (saniye)
+        """
+        deadline = time.perf_counter() + budget
+        while not self.finished:
+            spec = self.specs[self.done]
+            path = spec[1]
+            future = self._futures.get(path)
+            if future is not None and not future.done():
+                break
+            
+            try:
+                if future is not None:
+                    # Dosyanın ilk tanımı; sonraki tanımlar kaynağı Assets'ten alır
+                    del self._futures[path]
+                    Assets.store_decoded(path, future.result())
+                Assets.load_spec(spec)
+            except (OSError, pygame.error) as e:
+                # Görsel kullanıldığı yerde tekrar denenir
+                print(f"Ön yükleme başarısız: {spec[1]} - {e}")
+            
+            self.bytes_done += self._sizes[self.done]
+            self.done += 1
+            if time.perf_counter() >= deadline:
+                break
+        
+        if self.finished:
+            self._finish()
+    
+    def _finish(self):
+        """Thread havuzunu kapat, çözülmüş kaynakları bırak"""
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        Assets.clear_decoded()
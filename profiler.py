@@ -0,0 +1,217 @@
+"""
+Bıyık Bey'in Çilesi - Kare Süresi Profiler'ı
+Her karenin olay işleme, update, çizim ve display.flip sürelerini ölçer ve ekranda gösterir
+
+Kullanım:
+    Oyun sırasında F3 (settings.PROFILER_TOGGLE_KEY) ile açılıp kapatılır
+"""
+
+from array import array
+import time
+import pygame
+from settings import *
+
+
+# Ölçülen aşamalar (GameEngine.run sırasıyla)
+PHASES = ('events', 'update', 'draw', 'flip')
+PHASE_LABELS = {
+    'events': 'Olaylar',
+    'update': 'Update',
+    'draw': 'Çizim',
+    'flip': 'Flip',
+}
+PHASE_COLORS = {
+    'events': (120, 120, 255),
+    'update': (0, 220, 120),
+    'draw': (255, 200, 0),
+    'flip': (255, 80, 80),
+}
+
+
+def history_frames(fps=FPS, seconds=PROFILER_WINDOW_SECONDS):
+    """
+    `seconds` saniyeyi kapsayan halka tampon boyutu (kare)
+    
+    FPS sınırından %25 pay bırakılır; FPS sınırı yoksa ya da pencere çok büyükse
+    PROFILER_HISTORY_FRAMES kullanılır (göstergede kapsanan gerçek süre yazılır).
+    """
+    if fps <= 0:
+        return PROFILER_HISTORY_FRAMES
+    frames = int(seconds * fps * 1.25) + 1
+    return max(PROFILER_GRAPH_WIDTH, min(PROFILER_HISTORY_FRAMES, frames))
+
+
+def _percentile(ordered, p):
+    """Sıralı listeden yüzdelik değer"""
+    index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class RingBuffer:
+    """Sabit boyutlu float halka tampon - kayıt sırasında bellek ayırmaz"""
+    
+    def __init__(self, size):
+        self.size = size
+        self.data = array('d', bytes(8 * size))
+        self.index = 0  # Bir sonraki yazılacak konum
+        self.count = 0
+    
+    def append(self, value):
+        """En eski değerin üzerine yaz"""
+        self.data[self.index] = value
+        self.index = (self.index + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+    
+    def get(self, age):
+        """age kare önceki değer (0 = en yeni)"""
+        return self.data[(self.index - 1 - age) % self.size]
+    
+    def newest(self, n):
+        """En yeni n değer (yeniden eskiye)"""
+        return [self.get(age) for age in range(min(n, self.count))]
+
+
+class FrameProfiler:
+    """Aşama sürelerini halka tamponlarda tutar ve göstergeyi çizer"""
+    
+    def __init__(self, history=None):
+        if history is None:
+            history = history_frames()
+        self.samples = {phase: RingBuffer(history) for phase in PHASES}
+        self.totals = RingBuffer(history)
+        self.timestamps = RingBuffer(history)
+        self.visible = False
+        
+        # Gösterge (ilk açılışta oluşturulur)
+        self._panel = None
+        self._font = None
+        self._text_surfaces = []
+        self._next_stats_time = 0.0
+    
+    def toggle(self):
+        """Göstergeyi aç/kapat"""
+        self.visible = not self.visible
+        self._next_stats_time = 0.0  # Açılınca yazıları hemen yenile
+    
+    def record(self, events, update, draw, flip):
+        """Bir karenin aşama sürelerini kaydet (saniye)"""
+        self.samples['events'].append(events * 1000)
+        self.samples['update'].append(update * 1000)
+        self.samples['draw'].append(draw * 1000)
+        self.samples['flip'].append(flip * 1000)
+        self.totals.append((events + update + draw + flip) * 1000)
+        self.timestamps.append(time.perf_counter())
+    
+    def window_count(self, seconds=PROFILER_WINDOW_SECONDS):
+        """Son `seconds` saniyede kaydedilen kare sayısı"""
+        if self.timestamps.count == 0:
+            return 0
+        limit = self.timestamps.get(0) - seconds
+        count = 0
+        while count < self.timestamps.count and self.timestamps.get(count) >= limit:
+            count += 1
+        return count
+    
+    def stats(self, seconds=PROFILER_WINDOW_SECONDS):
+        """
+        Son `seconds` saniyenin istatistikleri
+        
+        Döndürür:
+            {'frames': n, 'seconds': s, 'total': {...}, 'events': {...}, ..., 'worst': {aşama: ms}}
+            Her aşama için {'p50', 'p95', 'p99', 'max'} (ms), kayıt yoksa None
+            Tampon pencereden önce dolduysa 's' kayıtların kapsadığı gerçek süredir
+        """
+        n = self.window_count(seconds)
+        if n == 0:
+            return None
+        
+        if n == self.timestamps.size:
+            seconds = self.timestamps.get(0) - self.timestamps.get(n - 1)
+        result = {'frames': n, 'seconds': seconds}
+        for name, buffer in [('total', self.totals)] + [(p, self.samples[p]) for p in PHASES]:
+            ordered = sorted(buffer.newest(n))
+            result[name] = {
+                'p50': _percentile(ordered, 50),
+                'p95': _percentile(ordered, 95),
+                'p99': _percentile(ordered, 99),
+                'max': ordered[-1],
+            }
+        
+        # En kötü karenin aşama dağılımı
+        totals = self.totals.newest(n)
+        worst_age = totals.index(max(totals))
+        result['worst'] = {phase: self.samples[phase].get(worst_age) for phase in PHASES}
+        result['worst']['total'] = totals[worst_age]
+        return result
+    
+    # =========================================================================
+    # GÖSTERGE
+    # =========================================================================
+    
+    def _refresh_text(self):
+        """İstatistik yazılarını yeniden oluştur (her PROFILER_STATS_INTERVAL'de bir)"""
+        stats = self.stats()
+        lines = []
+        if stats is None:
+            lines.append(("Veri yok", WHITE))
+        else:
+            total = stats['total']
+            lines.append((f"Kare (son {stats['seconds']:.3g} sn, {stats['frames']} kare)  "
+                          f"p50 {total['p50']:.1f}  p95 {total['p95']:.1f}  "
+                          f"p99 {total['p99']:.1f}  maks {total['max']:.1f} ms", WHITE))
+            for phase in PHASES:
+                s = stats[phase]
+                lines.append((f"{PHASE_LABELS[phase]:<8} p50 {s['p50']:.2f}  p95 {s['p95']:.2f}  "
+                              f"p99 {s['p99']:.2f}  maks {s['max']:.2f}", PHASE_COLORS[phase]))
+            worst = stats['worst']
+            parts = ", ".join(f"{PHASE_LABELS[p].lower()} {worst[p]:.1f}" for p in PHASES)
+            lines.append((f"En kötü kare: {worst['total']:.1f} ms ({parts})", LIGHT_GRAY))
+        
+        self._text_surfaces = [self._font.render(text, True, color) for text, color in lines]
+    
+    def draw(self, screen):
+        """Göstergeyi ekranın sol altına çiz, çizilen bölgeyi döndür"""
+        if self._panel is None:
+            from engine import Assets
+            self._font = Assets.get_font(22)
+            line_height = self._font.get_linesize()
+            height = PROFILER_GRAPH_HEIGHT + line_height * (len(PHASES) + 2) + 30
+            width = max(PROFILER_GRAPH_WIDTH, 620) + 20
+            self._panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        now = time.perf_counter()
+        if now >= self._next_stats_time:
+            self._refresh_text()
+            self._next_stats_time = now + PROFILER_STATS_INTERVAL
+        
+        panel = self._panel
+        panel.fill((0, 0, 0, 190))
+        
+        # Grafik - her sütun bir kare, aşamalar alttan üste yığılır
+        graph_left = 10
+        graph_bottom = 10 + PROFILER_GRAPH_HEIGHT
+        scale = PROFILER_GRAPH_HEIGHT / PROFILER_GRAPH_MAX_MS
+        columns = min(PROFILER_GRAPH_WIDTH, self.totals.count)
+        for age in range(columns):
+            x = graph_left + PROFILER_GRAPH_WIDTH - 1 - age
+            y = graph_bottom
+            for phase in PHASES:
+                h = self.samples[phase].get(age) * scale
+                if h >= 1:
+                    top = max(graph_bottom - PROFILER_GRAPH_HEIGHT, y - h)
+                    pygame.draw.line(panel, PHASE_COLORS[phase], (x, y - 1), (x, top))
+                    y = top
+        
+        # Kare bütçesi çizgisi (60 FPS)
+        budget_y = graph_bottom - FRAME_BUDGET_MS * scale
+        pygame.draw.line(panel, WHITE, (graph_left, budget_y),
+                         (graph_left + PROFILER_GRAPH_WIDTH - 1, budget_y))
+        
+        # İstatistik yazıları
+        y = graph_bottom + 10
+        for surface in self._text_surfaces:
+            panel.blit(surface, (graph_left, y))
+            y += self._font.get_linesize()
+        
+        return screen.blit(panel, (10, screen.get_height() - panel.get_height() - 10))
@@ -0,0 +1,241 @@
+"""
+Bıyık Bey'in Çilesi - Replay Sistemi
+Seed ve her simülasyon adımının girişini kaydeder, oyunu birebir yeniden oynatır
+
+Dosya formatı (little-endian):
+    Başlık  - magic, versiyon, simülasyon Hz, başlangıç leveli, seed,
+              ekran genişliği/yüksekliği, adım sayısı, son durum checksum'ı
+    Gövde   - zlib ile sıkıştırılmış giriş baytları (adım başına 1 bayt, INPUT_* bitleri)
+
+Kullanım:
+    python replay.py play replays/oyun.bbr          # Normal hızda izle
+    python replay.py play replays/oyun.bbr --fast   # Sınırsız hızda oynat ve doğrula
+"""
+
+import os
+import struct
+import zlib
+from datetime import datetime
+import pygame
+from settings import *
+
+
+REPLAY_MAGIC = b'BBRP'
+REPLAY_VERSION = 1
+REPLAY_EXTENSION = '.bbr'
+
+# magic, versiyon, hz, başlangıç leveli, seed, genişlik, yükseklik, adım sayısı, checksum
+_HEADER = struct.Struct('<4sBHIQHHII')
+
+
+# =============================================================================
+# GİRİŞ KAYNAKLARI - Adım başına giriş bitleri
+# =============================================================================
+
+class KeyboardInput:
+    """Klavyeden adım başına giriş bitlerini okur"""
+    
+    def __init__(self):
+        self._confirm = False
+    
+    def confirm(self):
+        """SPACE/tıklama - bir sonraki adımda INPUT_CONFIRM olarak okunur"""
+        self._confirm = True
+    
+    def poll(self):
+        """Bu adımın giriş bitlerini döndür"""
+        keys = pygame.key.get_pressed()
+        bits = 0
+        if keys[pygame.K_w]:
+            bits |= INPUT_UP
+        if keys[pygame.K_s]:
+            bits |= INPUT_DOWN
+        if keys[pygame.K_a]:
+            bits |= INPUT_LEFT
+        if keys[pygame.K_d]:
+            bits |= INPUT_RIGHT
+        if self._confirm:
+            bits |= INPUT_CONFIRM
+            self._confirm = False
+        return bits
+
+
+class ReplayRecorder:
+    """Başka bir giriş kaynağını sarar ve okunan her adımı kaydeder"""
+    
+    def __init__(self, source, seed, start_level, screen_size, sim_hz=SIMULATION_HZ):
+        self.source = source
+        self.seed = seed
+        self.start_level = start_level
+        self.screen_size = screen_size
+        self.sim_hz = sim_hz
+        self.inputs = bytearray()
+    
+    def confirm(self):
+        self.source.confirm()
+    
+    def poll(self):
+        bits = self.source.poll()
+        self.inputs.append(bits)
+        return bits
+    
+    def to_replay(self, checksum):
+        """Kaydı Replay nesnesine çevir"""
+        return Replay(self.seed, self.start_level, self.screen_size,
+                      self.sim_hz, bytes(self.inputs), checksum)
+    
+    def save_to_dir(self, directory, checksum):
+        """Kaydı klasöre zaman damgalı dosya adıyla yaz, dosya yolunu döndür"""
+        os.makedirs(directory, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        path = os.path.join(directory, f"{stamp}_L{self.start_level}{REPLAY_EXTENSION}")
+        self.to_replay(checksum).save(path)
+        return path
+
+
+class ReplayInput:
+    """Kaydedilmiş girişleri adım adım geri verir"""
+    
+    def __init__(self, inputs):
+        self.inputs = inputs
+        self.index = 0
+    
+    @property
+    def finished(self):
+        """Tüm kayıtlı adımlar okundu mu?"""
+        return self.index >= len(self.inputs)
+    
+    def confirm(self):
+        """Kayıttan oynatılırken gerçek SPACE/tıklama yok sayılır"""
+        pass
+    
+    def poll(self):
+        if self.index >= len(self.inputs):
+            return 0
+        bits = self.inputs[self.index]
+        self.index += 1
+        return bits
+
+
+# =============================================================================
+# REPLAY - Dosya okuma/yazma
+# =============================================================================
+
+class Replay:
+    """Bir oyunun seed'i ve adım başına girişleri"""
+    
+    def __init__(self, seed, start_level, screen_size, sim_hz, inputs, checksum=0):
+        self.seed = seed
+        self.start_level = start_level
+        self.screen_size = tuple(screen_size)
+        self.sim_hz = sim_hz
+        self.inputs = inputs
+        self.checksum = checksum
+    
+    def save(self, path):
+        """Replay'i ikili dosyaya yaz"""
+        header = _HEADER.pack(
+            REPLAY_MAGIC, REPLAY_VERSION, self.sim_hz, self.start_level, self.seed,
+            self.screen_size[0], self.screen_size[1], len(self.inputs), self.checksum
+        )
+        with open(path, 'wb') as f:
+            f.write(header)
+            f.write(zlib.compress(bytes(self.inputs), 9))
+    
+    @classmethod
+    def load(cls, path):
+        """Replay dosyasını oku"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        
+        magic, version, sim_hz, start_level, seed, width, height, tick_count, checksum = \
+            _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError(f"Geçersiz replay dosyası: {path}")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Desteklenmeyen replay versiyonu: {version}")
+        
+        inputs = zlib.decompress(data[_HEADER.size:])
+        if len(inputs) != tick_count:
+            raise ValueError(f"Bozuk replay dosyası: {path}")
+        
+        return cls(seed, start_level, (width, height), sim_hz, inputs, checksum)
+    
+    def create_state(self, engine):
+        """Bu replay'i oynatacak PlayingState oluştur"""
+        from states import PlayingState
+        engine.sim_dt = 1.0 / self.sim_hz
+        return PlayingState(engine, self.start_level, self.seed, ReplayInput(self.inputs))
+
+
+# =============================================================================
+# OYNATMA
+# =============================================================================
+
+def play_fast(path, draw=False):
+    """
+    Replay'i ekransız ve sınırsız hızda oynat
+    
+    Parametreler:
+        path: Replay dosyası
+        draw: Her adımda draw da çağrılsın mı (çizim maliyetini ölçmek için)
+    
+    Döndürür:
+        (checksum eşleşti mi, adım sayısı, toplam süre, adım başına ortalama süre)
+    """
+    import time
+    from headless import HeadlessEngine
+    
+    replay = Replay.load(path)
+    engine = HeadlessEngine(replay.screen_size)
+    state = replay.create_state(engine)
+    engine.change_state(state)
+    source = state.input_source
+    
+    ticks = 0
+    start = time.perf_counter()
+    while not source.finished and not state.game_over:
+        state.update(engine.sim_dt)
+        if draw:
+            state.draw(engine.screen)
+        ticks += 1
+    elapsed = time.perf_counter() - start
+    
+    matched = state.simulation_checksum() == replay.checksum
+    return matched, ticks, elapsed, elapsed / max(ticks, 1)
+
+
+def play_realtime(path):
+    """Replay'i normal hızda, pencerede izle"""
+    from engine import GameEngine
+    
+    replay = Replay.load(path)
+    engine = GameEngine(replay.screen_size)
+    engine.run(replay.create_state(engine))
+
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Replay oynatıcı")
+    sub = parser.add_subparsers(dest='command', required=True)
+    play = sub.add_parser('play', help="Replay dosyasını oynat")
+    play.add_argument('path', help="Replay dosyası (.bbr)")
+    play.add_argument('--fast', action='store_true',
+                      help="Ekransız, sınırsız hızda oynat ve sonucu doğrula")
+    play.add_argument('--draw', action='store_true',
+                      help="--fast ile birlikte her adımda çizim de yap")
+    args = parser.parse_args()
+    
+    if args.fast:
+        matched, ticks, elapsed, per_tick = play_fast(args.path, args.draw)
+        print(f"{ticks} adım, {elapsed:.2f} sn, adım başına {per_tick * 1000:.3f} ms")
+        print("Doğrulama: " + ("BAŞARILI - birebir aynı" if matched else "BAŞARISIZ - durum farklı"))
+        pygame.quit()
+        raise SystemExit(0 if matched else 1)
+    
+    play_realtime(args.path)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,6 @@ Bıyık Bey'in Çilesi - Oyun Ayarları
 Tüm oyun sabitleri ve yapılandırmaları burada tanımlanır
 """
 
-import os
-import json
-from datetime import datetime
-
 # Renk Tanımları (RGB formatında)
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -18,12 +14,111 @@ YELLOW = (255, 255, 0)
 BLUE = (100, 150, 255)
 
 # Oyun Ayarları
-FPS = 60  # Saniyedeki kare sayısı
+FPS = 60  # Saniyedeki kare sayısı (çizim sınırı, 0 = sınırsız)
+
+RENDER_RESOLUTION = (1920, 1080)  # Oyunun çizildiği iç çözünürlük, ekrana ölçeklenir (None = native)
+DIRTY_RECT_RENDERING = True  # Sadece değişen bölgeleri çiz ve güncelle (False = her kare tam ekran)
+# Not: RENDER_RESOLUTION ile açılan pygame.SCALED ekranında SDL her karede tüm dokuyu gönderir;
+# display.update(rects) tam güncellemeden ucuz olmaz. Dirty rect'in kazancı o zaman sadece
+# arka planın değişen bölgelerin altına geri yüklenmesidir (tam ekran blit yerine).
+
+# Simülasyon Ayarları (sabit adımlı döngü)
+SIMULATION_HZ = 60              # Saniyedeki simülasyon adımı sayısı
+MAX_SIMULATION_STEPS = 8        # Bir karede yapılabilecek maksimum telafi adımı
+BASE_TICK_RATE = 60             # Hız ve animasyon sabitlerinin tanımlandığı referans frekans (birim/kare)
+
+# Çarpışma Ayarları (collision.py)
+COLLISION_BATCH_MIN_SHAPES = 80      # Bundan az şekil NumPy yerine tek tek test edilir (NumPy sabit maliyeti)
+
+# Headless Simülasyon Ayarları (headless.py)
+HEADLESS_SCREEN_SIZE = (1920, 1080)  # Ekransız çalışmada kullanılan sanal çözünürlük
+HEADLESS_START_LEVEL = 500           # Varsayılan başlangıç leveli
+HEADLESS_LEVEL_COUNT = 1000          # Varsayılan olarak tamamlanacak level sayısı
+HEADLESS_MAX_DEATHS = 10             # --mortal çalışmada bu kadar ölümde durulur
+
+# Benchmark Ayarları (benchmark.py)
+BENCHMARK_ENTITY_COUNTS = (10, 100, 1000, 10000)  # Senaryo başına toplam nesne sayısı
+BENCHMARK_WARMUP_FRAMES = 30         # Ölçümden önce atılan kare sayısı
+BENCHMARK_FRAMES = 200               # Ölçülen kare sayısı
+BENCHMARK_REGRESSION_TOLERANCE = 0.15  # Baseline'a göre izin verilen yavaşlama (%15)
+FRAME_BUDGET_MS = 1000.0 / 60        # Kare bütçesi (60 FPS = 16.6 ms)
+
+# Sprite Atlas Ayarları (atlas.py)
+ATLAS_DIR = 'build/atlas'            # Atlas sayfalarının ve indeksin yazıldığı klasör
+ATLAS_INDEX_FILE = 'atlas.json'      # Sprite konumlarını tutan indeks dosyası
+ATLAS_PAGE_SIZE = 2048               # Atlas sayfası en fazla bu genişlik/yükseklikte olur
+ATLAS_PADDING = 2                    # Sprite'lar arası boşluk (piksel)
+ATLAS_VERSION = 1                    # İndeks formatı versiyonu
+
+# Asset Önbelleği
+ASSET_CACHE_BUDGET_MB = 256          # Bellekteki görsellerin üst sınırı (MB, None = sınırsız)
+SURFACE_FORMAT_OPTIMIZE = True       # Opak/colorkey görselleri convert() ile hızlı formata çevir
+SURFACE_COLORKEY = (255, 0, 255)     # İkili alfalı görsellerde saydam renk
+SOURCE_CACHE_TTL = 5.0               # Çözülmüş kaynak görselin farklı boyutlar için tutulma süresi (sn)
+TEXT_CACHE_BUDGET_MB = 8             # Render edilmiş yazıların üst sınırı (MB, None = sınırsız)
+
+# Görsel Disk Önbelleği (surface_cache.py)
+SURFACE_CACHE_ENABLED = True         # Çözülmüş/ölçeklenmiş görseller diske yazılsın mı
+SURFACE_CACHE_DIR = 'build/surface_cache'  # Ham RGBA dosyalarının klasörü
+SURFACE_CACHE_VERSION = 1            # Format değişince eski kayıtlar kullanılmaz
+
+# Ses Bankası (sound_bank.py)
+SOUND_CACHE_ENABLED = True           # Çözülmüş sesler (ham PCM) diske yazılsın mı
+SOUND_CACHE_DIR = 'build/sound_cache'  # PCM dosyalarının klasörü
+SOUND_CACHE_VERSION = 1              # Format değişince eski kayıtlar kullanılmaz
+
+# Ön Yükleme Ayarları (preloader.py)
+PRELOAD_WORKERS = 4                  # Görsel çözen thread sayısı
+PRELOAD_FRAME_BUDGET_MS = 8.0        # Yükleme ekranında karede ana thread'e ayrılan süre (ms)
+
+# Profiler Ayarları (profiler.py)
+PROFILER_TOGGLE_KEY = 'f3'           # Kare süresi göstergesini açıp kapatan tuş (pygame tuş adı)
+PROFILER_HISTORY_FRAMES = 4096       # Halka tampon üst sınırı (kare) - FPS sınırı yoksa (0) bu boyut
+PROFILER_WINDOW_SECONDS = 5.0        # İstatistiklerin hesaplandığı son süre (saniye)
+PROFILER_STATS_INTERVAL = 0.5        # İstatistik yazılarının yenilenme aralığı (saniye)
+PROFILER_GRAPH_WIDTH = 360           # Grafik genişliği (piksel = gösterilen kare sayısı)
+PROFILER_GRAPH_HEIGHT = 120          # Grafik yüksekliği (piksel)
+PROFILER_GRAPH_MAX_MS = 50.0         # Grafiğin üst sınırı (ms)
+
+# Giriş Bitleri (her simülasyon adımının girişi tek bayt - replay.py)
+INPUT_UP = 1 << 0               # W
+INPUT_DOWN = 1 << 1             # S
+INPUT_LEFT = 1 << 2             # A
+INPUT_RIGHT = 1 << 3            # D
+INPUT_CONFIRM = 1 << 4          # Level başlat / sonraki level (SPACE veya tıklama)
+
+# Replay Ayarları
+RECORD_REPLAYS = False          # Oyunlar replay dosyasına kaydedilsin mi
+REPLAY_DIR = 'replays'          # Replay dosyalarının klasörü
 
 # Ses Ayarları
 VOLUME_LEVELS = [1.0, 0.5, 0.0]  # 100%, 50%, 0% (sessiz)
 DEFAULT_VOLUME_INDEX = 0              # Başlangıç ses seviyesi (100%)
 
+# Ses Gecikme Profilleri (mixer.pre_init) - python main.py --audio-profile low_latency
+# buffer küçüldükçe gecikme azalır ama makine yetişemezse ses cızırdar; audio_latency.py ile ölçün
+AUDIO_PROFILES = {
+    'default': {'frequency': 44100, 'size': -16, 'channels': 2, 'buffer': 512},
+    'low_latency': {'frequency': 44100, 'size': -16, 'channels': 2, 'buffer': 256},
+    'safe': {'frequency': 44100, 'size': -16, 'channels': 2, 'buffer': 1024},
+}
+AUDIO_PROFILE = 'default'       # Başlangıç profili
+AUDIO_LATENCY_BUFFERS = (128, 256, 512, 1024, 2048)  # audio_latency.py ile denenen buffer boyutları
+AUDIO_LATENCY_SECONDS = 3.0     # Buffer başına ölçüm süresi (saniye)
+
+# Müzik
+GAME_MUSIC = None               # Oyun sırasında çalan parça (Audio.MUSIC_PATHS adı, ör. 'game'; None = müzik yok)
+MUSIC_CROSSFADE_MS = 800        # Menü ve oyun müziği arası geçiş süresi (ms)
+
+# Ses efekti kanalları - kategori başına ayrılmış kanal sayısı (engine.Audio.SOUND_VOICES)
+VOICE_CHANNELS = {
+    'critical': 2,   # Game over, level tamamlandı - diğer sesler bu kanalları alamaz
+    'player': 4,     # Çarpma ve buff sesleri
+    'effects': 6,    # Patlamalar
+    'loop': 2,       # Buff/debuff loop sesleri
+    'ui': 2,         # Buton tıklamaları
+}
+
 # Ses Kontrol UI Ayarları
 VOLUME_ICON_SIZE = 150                 # İkon boyutu (piksel)
 VOLUME_ICON_PADDING = 100              # Ekran kenarından mesafe
@@ -85,6 +180,7 @@ BOMB_MAX_COUNT_PER_LEVEL = 0.3  # Her levelde eklenen bomba sayısı (0.3 = her
 BOMB_SCALE = 2                # Bomba boyutu
 BOMB_FUSE_TIME = 3000           # Patlamaya kadar süre (ms) - base
 BOMB_EXPLOSION_EFFECT_ALPHA = 64  # Patlama efektinin opaklığı (0-255, 0=tamamen şeffaf, 255=tamamen opak)
+BOMB_EFFECT_RAMP_STEPS = 16     # Sönen hasar dairesi için önceden çizilen alfa kademesi sayısı
 
 # =============================================================================
 # SİNSİ JİLET AYARLARI
@@ -131,48 +227,23 @@ BUFF_SPAWN_MARGIN = 150          # Buff spawn için ekran kenarından mesafe
 ENEMY_SPAWN_MARGIN = 50          # Düşman spawn için ekran kenarından mesafe
 ENEMY_SPAWN_OFFSET = 30          # Düşman spawn için ekran dışı offset
 
+# Level başında havuzlarda hazır tutulan nesne sayısı (pool.py, entities.py)
+# Ölçülen en fazla eşzamanlı nesnenin biraz üstü (headless, level 1-500: bomba 3, jilet 52,
+# terlik 2); daha fazlası gerekirse havuz/depo kendiliğinden büyür ve büyüklüğünü korur
+POOL_PREWARM = {'bomb': 4, 'buff': 1, 'jilet': 64, 'terlik': 8}
+
+# =============================================================================
+# UZAMSAL IZGARA (spatial.py)
+# =============================================================================
+SPATIAL_GRID_CELL_SIZE = 128     # Izgara hücre boyutu (piksel) - tipik sorgu yarıçapı civarı
+SPATIAL_GRID_MIN_ENTITIES = 8192 # Bundan az nesnede depo sorguları ızgara kurmadan düz taramayla yapılır
+                                 # (adım başına tek sorguda 4096 jilette bile düz tarama daha hızlı)
+
 # =============================================================================
 # REKOR SİSTEMİ
 # =============================================================================
-SAVE_FILE = 'highscore.json'
-
-def load_highscore():
-    """Kayıtlı rekoru yükle"""
-    if os.path.exists(SAVE_FILE):
-        try:
-            with open(SAVE_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
-    return {'level': 0, 'date': None}
-
-def save_highscore(level, start_level=1):
-    """Yeni rekor kaydet - sadece level 1'den başlayanlar için"""
-    # Sadece level 1'den başlayanlar için rekor kaydet
-    if start_level != 1:
-        return False
-    
-    current = load_highscore()
-    if level > current['level']:
-        data = {
-            'level': level,
-            'date': datetime.now().strftime('%Y-%m-%d %H:%M')
-        }
-        with open(SAVE_FILE, 'w') as f:
-            json.dump(data, f)
-        return True
-    return False
-
-def reset_highscore():
-    """Rekoru sıfırla"""
-    if os.path.exists(SAVE_FILE):
-        try:
-            os.remove(SAVE_FILE)
-            return True
-        except:
-            return False
-    return True
-
-
-# Not: Ekran boyutları (SCREEN_WIDTH, SCREEN_HEIGHT) main.py'de
-# ekran çözünürlüğüne göre dinamik olarak belirlenir
+SAVE_FILE = 'highscore.json'     # Okuma/yazma highscore.py'deki rekor deposu üzerinden
+
+
+# Not: Ekran boyutları RENDER_RESOLUTION ile belirlenir (None ise
+# ekran çözünürlüğüne göre dinamik olarak belirlenir)
@@ -0,0 +1,122 @@
+"""
+Bıyık Bey'in Çilesi - Ses Bankası
+Ses efektlerini açılışta arka plan thread'inde çözer; oyun sırasında hiçbir ses ana thread'de çözülmez
+
+Çözülmüş PCM diske yazılır (settings.SOUND_CACHE_DIR, git'e eklenmez), sonraki açılışlarda
+MP3 çözmeden yüklenir. Anahtar: kaynak dosyanın içeriği (SHA-1) + mixer formatı.
+
+Kullanım:
+    bank = SoundBank(Audio.SOUND_PATHS)
+    bank.start()
+    bank.ready / bank.progress   # Yükleme durumu
+    bank.get('bomb_explosion')   # Hazır değilse veya dosya yoksa None
+"""
+
+import hashlib
+import os
+import threading
+import pygame
+from settings import *
+
+
+def cache_path(source):
+    """
+    PCM önbellek dosyasının yolu
+    
+    Döndürür:
+        Dosya yolu, kaynak okunamıyorsa None
+    """
+    try:
+        with open(source, 'rb') as f:
+            digest = hashlib.sha1(f.read())
+    except OSError:
+        return None
+    # Ham PCM mixer formatına (frekans, örnek boyutu, kanal) bağlı
+    digest.update(f"|{SOUND_CACHE_VERSION}|{pygame.mixer.get_init()}".encode('utf-8'))
+    return os.path.join(SOUND_CACHE_DIR, digest.hexdigest() + '.pcm')
+
+
+def read_pcm(path):
+    """Önbellekten ses oku, kayıt yoksa None"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    if not data:
+        return None
+    return pygame.mixer.Sound(buffer=data)
+
+
+def write_pcm(path, sound):
+    """Sesi önbelleğe yaz (yarım kalan yazma okunmasın diye geçici dosya + rename)"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(sound.get_raw())
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Ses önbelleğe yazılamadı: {path} - {e}")
+
+
+class SoundBank:
+    """Ses efektlerini arka planda çözüp ada göre veren banka"""
+    
+    def __init__(self, paths):
+        """
+        Parametreler:
+            paths: {ses adı: dosya yolu}
+        """
+        self.paths = dict(paths)
+        self.total = len(self.paths)
+        self.done = 0
+        self.cache_hits = 0
+        self._sounds = {}  # Ad -> Sound (dosya yoksa/yüklenemediyse None)
+        self._thread = None
+    
+    @property
+    def ready(self):
+        """Tüm sesler yüklendi mi"""
+        return self.done >= self.total
+    
+    @property
+    def progress(self):
+        """0-1 arası ilerleme"""
+        return self.done / self.total if self.total else 1.0
+    
+    def start(self):
+        """Yüklemeyi arka plan thread'inde başlat"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._load_all, name='sound-bank', daemon=True)
+            self._thread.start()
+    
+    def get(self, name):
+        """Hazır sesi döndür - hiçbir zaman çözme yapmaz"""
+        return self._sounds.get(name)
+    
+    def _load_all(self):
+        """Worker thread: sesleri sırayla yükle"""
+        for name, path in self.paths.items():
+            self._sounds[name] = self._load(name, path)
+            self.done += 1
+    
+    def _load(self, name, path):
+        # Dosya yoksa sessizce atla (opsiyonel loop sesleri için)
+        if not os.path.exists(path):
+            return None
+        try:
+            cached = cache_path(path) if SOUND_CACHE_ENABLED else None
+            if cached:
+                sound = read_pcm(cached)
+                if sound is not None:
+                    self.cache_hits += 1
+                    return sound
+            
+            sound = pygame.mixer.Sound(path)
+            if cached:
+                write_pcm(cached, sound)
+            return sound
+        except (OSError, pygame.error) as e:
+            print(f"Ses yüklenemedi: {name} - {e}")
+            return None
@@ -0,0 +1,119 @@
+"""
+Bıyık Bey'in Çilesi - Uzamsal Izgara
+Nokta kümesini eşit boyutlu hücrelere bölerek yakınlık sorgularını hızlandırır (spatial hash)
+
+    - Noktalar hücre anahtarına göre sıralanır (tek argsort); bir hücre sütunu sıralı dizide
+      ardışık aralıktır, sorgu sadece ilgili hücrelerin satırlarına bakar
+    - Anahtarlar dolu alana göre numaralanır; ekran boyutundaki ızgarada int16'ya sığar ve
+      NumPy doğrusal (radix) sıralama kullanır
+    - Noktalar hareket edince ızgara update() ile yeniden kurulur
+    - Sorgular satır numaralarını artan sırada döndürür (sonuç sırası ızgaraya bağlı değil)
+
+Kullanım:
+    grid = SpatialGrid(128)
+    grid.update(xs, ys)
+    grid.query_radius(x, y, 200)           # Mesafesi <= 200 olan satırlar
+    grid.query_rect(left, top, right, bottom)
+    grid.nearest(x, y, 3)                  # En yakın 3 satır (yakından uzağa)
+"""
+
+import numpy as np
+
+
+class SpatialGrid:
+    """Eşit hücreli ızgara - noktalar satır numarasıyla tutulur"""
+    
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size)
+        self.count = 0
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self._order = np.empty(0, np.intp)     # Hücre anahtarına göre sıralı satırlar
+        self._keys = np.empty(0, np.int64)     # Sıralı hücre anahtarları
+        self._bounds = None
+        self._span = 1
+    
+    def __len__(self):
+        return self.count
+    
+    def _cell(self, value):
+        return np.floor(np.asarray(value, np.float64) / self.cell_size).astype(np.int64)
+    
+    def update(self, x, y):
+        """Izgarayı yeni konumlarla kur (satır i = x[i], y[i])"""
+        self.x = np.array(x, np.float64)
+        self.y = np.array(y, np.float64)
+        self.count = len(self.x)
+        if not self.count:
+            self._order = np.empty(0, np.intp)
+            self._keys = np.empty(0, np.int64)
+            self._bounds = None
+            return
+        cell_x, cell_y = self._cell(self.x), self._cell(self.y)
+        # Dolu hücrelerin sınırları - anahtarlar buna göre, büyük sorgu alanları buna kırpılır
+        min_x, max_x, min_y, max_y = cell_x.min(), cell_x.max(), cell_y.min(), cell_y.max()
+        self._bounds = (min_x, max_x, min_y, max_y)
+        self._span = max_y - min_y + 1
+        keys = (cell_x - min_x) * self._span + (cell_y - min_y)
+        if (max_x - min_x + 1) * self._span <= np.iinfo(np.int16).max:
+            keys = keys.astype(np.int16)
+        self._order = np.argsort(keys, kind='stable')
+        self._keys = keys[self._order]
+    
+    def _candidates(self, left, top, right, bottom):
+        """Alanı kapsayan hücrelerdeki satırlar (sırasız, alan dışındakiler de olabilir)"""
+        if not self.count:
+            return self._order
+        min_x, max_x, min_y, max_y = self._bounds
+        cell_left, cell_right = np.clip(self._cell((left, right)), min_x, max_x) - min_x
+        cell_top, cell_bottom = np.clip(self._cell((top, bottom)), min_y, max_y) - min_y
+        columns = np.arange(cell_left, cell_right + 1, dtype=np.int64) * self._span
+        if not len(columns) or cell_top > cell_bottom:
+            # Boş veya ters alan
+            return self._order[:0]
+        starts = np.searchsorted(self._keys, (columns + cell_top).astype(self._keys.dtype), 'left')
+        ends = np.searchsorted(self._keys, (columns + cell_bottom).astype(self._keys.dtype), 'right')
+        return np.concatenate([self._order[start:end] for start, end in zip(starts.tolist(), ends.tolist())])
+    
+    def query_rect(self, left, top, right, bottom):
+        """Alanın içindeki (kenarlar dahil) noktaların satırları"""
+        rows = self._candidates(left, top, right, bottom)
+        x, y = self.x[rows], self.y[rows]
+        return np.sort(rows[(x >= left) & (x <= right) & (y >= top) & (y <= bottom)])
+    
+    def query_radius(self, x, y, radius):
+        """(x, y) noktasına mesafesi <= radius olan noktaların satırları"""
+        rows = self._candidates(x - radius, y - radius, x + radius, y + radius)
+        return np.sort(rows[self._distance(rows, x, y) <= radius])
+    
+    def _distance(self, rows, x, y):
+        dx = self.x[rows] - x
+        dy = self.y[rows] - y
+        return np.sqrt(dx * dx + dy * dy)
+    
+    def nearest(self, x, y, k=1, max_radius=None):
+        """
+        (x, y) noktasına en yakın k noktanın satırları (yakından uzağa, eşitlikte küçük satır önce)
+        
+        Arama yarıçapı bir hücreden başlar ve k nokta bulunana kadar iki katına çıkar.
+        max_radius verilirse daha uzaktaki noktalar döndürülmez.
+        """
+        if not self.count or k <= 0:
+            return np.empty(0, np.intp)
+        # Tüm noktaları kapsayan yarıçap - buna ulaşınca arama biter
+        dx = max(abs(x - self.x.min()), abs(x - self.x.max()))
+        dy = max(abs(y - self.y.min()), abs(y - self.y.max()))
+        limit = float(np.hypot(dx, dy))
+        if max_radius is not None:
+            limit = min(limit, max_radius)
+        
+        radius = self.cell_size
+        while radius < limit:
+            rows = self.query_radius(x, y, radius)
+            if len(rows) >= k:
+                break
+            radius *= 2
+        else:
+            rows = np.arange(self.count) if max_radius is None else self.query_radius(x, y, max_radius)
+        distance = self._distance(rows, x, y)
+        return rows[np.argsort(distance, kind='stable')[:k]]
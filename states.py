@@ -4,11 +4,76 @@ Menü, oyun ve diğer ekranlar
 """
 
 import pygame
+import random
+import zlib
 from engine import GameState, Assets, Audio
 from ui import ImageButton, VolumeControl, HintButton, HintPopup, PauseMenu, LevelSelector
+from replay import KeyboardInput, ReplayRecorder
+from highscore import highscores
+from preloader import AssetPreloader
+from collision import CollisionBatch
+from spatial import SpatialGrid
+from animation import clock
 from settings import *
 
 
+# =============================================================================
+# LOADING STATE - Yükleme Ekranı
+# =============================================================================
+
+class LoadingState(GameState):
+    """Açılış yükleme ekranı - görseller ve sesler arka planda çözülür, bitince sonraki duruma geçilir"""
+    
+    def __init__(self, engine, next_state_factory=None):
+        """
+        Parametreler:
+            engine: GameEngine
+            next_state_factory: Yükleme bitince oluşturulacak durum (engine -> GameState),
+                                None ise ana menü
+        """
+        super().__init__(engine)
+        self.next_state_factory = next_state_factory or MenuState
+        
+        specs = (MenuState.required_assets(self.screen_width, self.screen_height) +
+                 PlayingState.required_assets(self.screen_width, self.screen_height))
+        Assets.pin_game_sprites()
+        self.preloader = AssetPreloader(specs)
+        
+        self.font = Assets.get_font(36)
+        self.bar_rect = pygame.Rect(0, 0, int(self.screen_width * 0.4), 24)
+        self.bar_rect.center = (self.screen_width // 2, self.screen_height // 2)
+    
+    def enter(self):
+        """Yüklemeyi başlat"""
+        self.preloader.start()
+    
+    def update(self, dt):
+        """Görseller ve sesler bitince sonraki duruma geç"""
+        if self.preloader.finished and Audio.sounds_ready():
+            self.engine.change_state(self.next_state_factory(self.engine))
+    
+    def draw(self, screen):
+        """Hazır olan görselleri işle, ilerleme çubuğunu çiz"""
+        # update karede MAX_SIMULATION_STEPS kez çağrılabilir; poll'un süre bütçesi kare başına
+        # bir kez harcansın diye çizimde çağrılır
+        self.preloader.poll()
+        screen.fill(BLACK)
+        
+        pygame.draw.rect(screen, DARK_GRAY, self.bar_rect)
+        filled = self.bar_rect.copy()
+        filled.width = int(self.bar_rect.width * self.preloader.progress)
+        pygame.draw.rect(screen, WHITE, filled)
+        
+        preloader = self.preloader
+        sounds_done, sounds_total = Audio.sound_progress()
+        text = (f"Yükleniyor... {preloader.done}/{preloader.total} "
+                f"({preloader.bytes_done / 1048576:.1f}/{preloader.bytes_total / 1048576:.1f} MB), "
+                f"ses {sounds_done}/{sounds_total}")
+        text_surf = self.font.render(text, True, LIGHT_GRAY)
+        screen.blit(text_surf, (self.bar_rect.centerx - text_surf.get_width() // 2, self.bar_rect.bottom + 20))
+        return None
+
+
 # =============================================================================
 # MENU STATE - Ana Menü
 # =============================================================================
@@ -20,25 +85,45 @@ class MenuState(GameState):
         super().__init__(engine)
         self._load_assets()
         self._calculate_layout()
+        self._create_static_layer()
         self._create_buttons()
         self._create_volume_control()
         
         # Reset butonu rect'i başlat
         self.reset_btn_rect = None
         
-        # Oyun asset'lerini arka planda önceden yükle (kasma önleme)
-        Assets.preload_game_assets(self.screen_width, self.screen_height)
+        # Rekor bellekten okunur, değişince _on_highscore_changed günceller
+        self.highscore = highscores.get()
+    
+    @staticmethod
+    def required_assets(screen_width, screen_height):
+        """Menünün kullandığı görseller (LoadingState ön yüklemesi için, _load_assets ile aynı boyutlar)"""
+        specs = [
+            ('load_image', 'assets/home_bg.jpg', (screen_width, screen_height)),
+            ('load_to_height', 'assets/biyik_adam/biyik_adam_right.png', int(screen_height * 0.23)),
+            ('load_to_width', 'assets/title.png', int(screen_width * 0.5)),
+            ('load_to_width', 'assets/instruction.png', int(screen_width * 0.35)),
+        ]
+        btn_size = (int(screen_width * 0.25), int(screen_height * 0.08))
+        for name in ['button_start', 'button_start_h', 'button_quit', 'button_quit_h']:
+            specs.append(('load_image', f'assets/{name}.png', btn_size))
+        return specs + VolumeControl.required_assets()
     
     def enter(self):
         """Menüye girildiğinde müziği başlat"""
-        Audio.play_with_intro(
-            'assets/music/menu_music_intro.mp3',
-            'assets/music/menu_music_loop.mp3'
-        )
+        Audio.play_with_intro('menu_intro', 'menu_loop')
+        self.highscore = highscores.get()
+        highscores.subscribe(self._on_highscore_changed)
     
     def exit(self):
-        """Menüden çıkıldığında müziği durdur"""
-        Audio.stop()
+        """Menüden çıkıldığında müziği kısarak durdur (oyun müziği varsa geçişli)"""
+        Audio.fade_out_music()
+        Audio.stop_all_sounds()
+        highscores.unsubscribe(self._on_highscore_changed)
+    
+    def _on_highscore_changed(self, highscore):
+        """Rekor değişti (sıfırlandı) - sonraki karede yeni değer çizilir"""
+        self.highscore = highscore
     
     def _load_assets(self):
         """Görselleri yükle"""
@@ -102,8 +187,6 @@ class MenuState(GameState):
     
     def handle_event(self, event):
         """Olayları işle"""
-        Audio.handle_music_end(event)
-        
         # Level seçim dialogu açıksa önce onu işle
         if self.level_selector.is_open:
             result = self.level_selector.handle_event(event)
@@ -133,69 +216,85 @@ class MenuState(GameState):
             self.engine.quit()
         
         # Rekor sıfırlama butonu
-        highscore = load_highscore()
-        if highscore['level'] > 0 and self.reset_btn_rect:
+        if self.highscore['level'] > 0 and self.reset_btn_rect:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if self.reset_btn_rect.collidepoint(event.pos):
                     Audio.play_sound('button_click')
-                    reset_highscore()
+                    highscores.reset()
                     return  # Menüyü yeniden çizmek için return
         
         # Ses kontrolü (Audio.cycle_volume zaten müzik sesini ayarlıyor)
         self.volume.handle_event(event)
     
-    def draw(self, screen):
-        """Menüyü çiz"""
-        screen.blit(self.background, (0, 0))
+    def _create_static_layer(self):
+        """Hiç değişmeyen elemanları (arka plan, karakter, başlık, talimat) tek yüzeyde birleştir"""
+        layer = self.background.copy()
         
         # Karakter
         x = (self.screen_width - self.character.get_width()) // 2
-        screen.blit(self.character, (x, self.char_y))
+        layer.blit(self.character, (x, self.char_y))
         
         # Başlık
         x = (self.screen_width - self.title.get_width()) // 2
-        screen.blit(self.title, (x, self.title_y))
+        layer.blit(self.title, (x, self.title_y))
         
         # Talimat
         x = (self.screen_width - self.instruction.get_width()) // 2
-        screen.blit(self.instruction, (x, self.instruction_y))
+        layer.blit(self.instruction, (x, self.instruction_y))
+        
+        self.static_layer = layer
+    
+    def draw(self, screen):
+        """Menüyü çiz (dialog kapalıyken sadece değişen bölgeler çizilir)"""
+        tracker = self.engine.dirty_rects
+        if tracker and not self.level_selector.is_open:
+            self._draw_dynamic(tracker.begin(self.static_layer))
+            return tracker.end()
+        
+        screen.blit(self.static_layer, (0, 0))
+        self._draw_dynamic(screen)
+        
+        # Level seçim dialogu (varsa)
+        self.level_selector.draw(screen)
         
+        if tracker:
+            tracker.invalidate()
+        return None
+    
+    def _draw_dynamic(self, screen):
+        """Butonlar, ses kontrolü ve rekor bilgisi"""
         # Butonlar
         self.start_btn.draw(screen)
         self.quit_btn.draw(screen)
         self.volume.draw(screen)
         
-        # Level seçim dialogu (varsa)
-        self.level_selector.draw(screen)
-        
         # Rekor bilgisi (sağ üst köşe)
-        highscore = load_highscore()
+        highscore = self.highscore
         if highscore['level'] > 0:
             font = Assets.get_font(48)
             record_text = f"Rekor: Level {highscore['level']}"
-            record_surf = font.render(record_text, True, YELLOW)
-            record_shadow = font.render(record_text, True, BLACK)
+            record_surf = Assets.render_shadowed(font, record_text, YELLOW, offset=3)
+            record_width = record_surf.get_width() - 3
             
             # Sağ üst köşe
-            record_x = self.screen_width - record_surf.get_width() - 40
+            record_x = self.screen_width - record_width - 40
             record_y = 40
             
-            screen.blit(record_shadow, (record_x + 3, record_y + 3))
             screen.blit(record_surf, (record_x, record_y))
             
             # Tarih
             if highscore['date']:
                 date_text = f"({highscore['date']})"
-                date_surf = Assets.get_font(32).render(date_text, True, LIGHT_GRAY)
-                screen.blit(date_surf, (record_x + (record_surf.get_width() - date_surf.get_width()) // 2, record_y + 55))
+                date_surf = Assets.render_text(Assets.get_font(32), date_text, LIGHT_GRAY)
+                screen.blit(date_surf, (record_x + (record_width - date_surf.get_width()) // 2, record_y + 55))
             
             # Reset butonu (rekorun altında)
             reset_font = Assets.get_font(24)
             reset_text = "[Rekoru Sıfırla]"
-            reset_surf = reset_font.render(reset_text, True, LIGHT_GRAY)
-            reset_hover_surf = reset_font.render(reset_text, True, WHITE)
+            reset_surf = Assets.render_text(reset_font, reset_text, LIGHT_GRAY)
+            reset_hover_surf = Assets.render_text(reset_font, reset_text, WHITE)
             
-            reset_x = record_x + (record_surf.get_width() - reset_surf.get_width()) // 2
+            reset_x = record_x + (record_width - reset_surf.get_width()) // 2
             reset_y = record_y + 90
             self.reset_btn_rect = pygame.Rect(reset_x, reset_y, reset_surf.get_width(), reset_surf.get_height())
             
@@ -210,7 +309,7 @@ class MenuState(GameState):
         # Level seçim ipucu (sol alt köşe)
         hint_font = Assets.get_font(24)
         hint_text = "Ctrl+Start = Level Seç"
-        hint_surf = hint_font.render(hint_text, True, LIGHT_GRAY)
+        hint_surf = Assets.render_text(hint_font, hint_text, LIGHT_GRAY)
         screen.blit(hint_surf, (40, self.screen_height - 60))
 
 
@@ -221,8 +320,16 @@ class MenuState(GameState):
 class PlayingState(GameState):
     """Ana oyun ekranı - Survivor Mode"""
     
-    def __init__(self, engine, start_level=1):
+    def __init__(self, engine, start_level=1, seed=None, input_source=None):
+        """
+        Parametreler:
+            engine: GameEngine
+            start_level: Başlangıç leveli
+            seed: Spawn rastgeleliği için seed (None = rastgele)
+            input_source: Adım başına giriş kaynağı (None = klavye, replay için ReplayInput)
+        """
         super().__init__(engine)
+        self.seed = seed if seed is not None else random.getrandbits(32)
         self._load_assets()
         self._create_player()
         self._init_game_objects()
@@ -232,6 +339,7 @@ class PlayingState(GameState):
         # Level'i direkt başlangıç leveline ayarla
         self.spawn_manager.level = self.start_level
         self.spawn_manager.reset_for_new_level()
+        self._prewarm_pools()
         
         # Level sistemi
         self.waiting_for_start = True  # Level başlangıcında bekle
@@ -244,17 +352,47 @@ class PlayingState(GameState):
         # Ses efektleri için flag'ler
         self.level_complete_sound_played = False
         self.game_over_sound_played = False
+        
+        # Son update'te simülasyon ilerledi mi? (çizimde interpolasyon için)
+        self.simulation_active = False
+        
+        # Giriş kaynağı (ayarlardan açıksa replay kaydı yapılır)
+        if input_source is None:
+            input_source = KeyboardInput()
+            if RECORD_REPLAYS:
+                input_source = ReplayRecorder(
+                    input_source, self.seed, self.start_level,
+                    (self.screen_width, self.screen_height), SIMULATION_HZ
+                )
+        self.input_source = input_source
+        self.replay_saved = False
+    
+    @staticmethod
+    def required_assets(screen_width, screen_height):
+        """Oyun ekranının kullandığı görseller (LoadingState ön yüklemesi için)"""
+        specs = [('load_scaled', path, scale) for path, scale in Assets.game_sprites()]
+        specs.append(('load_image', 'assets/game_bg.png', (screen_width, screen_height)))
+        specs += HintButton.required_assets()
+        specs += HintPopup.required_assets(screen_width, screen_height)
+        # Game over butonları (_init_game_objects ile aynı boyut)
+        btn_size = (int(screen_width * 0.2), int(screen_height * 0.08))
+        for name in ['button_again', 'button_again_h', 'button_quit', 'button_quit_h']:
+            specs.append(('load_image', f'assets/{name}.png', btn_size))
+        return specs
     
     def enter(self):
         """Oyuna girildiğinde müziği başlat ve fareyi gizle"""
-        # Oyun müziği kaldırıldı (kullanıcı isteği)
-        # Audio.play_music('assets/music/game_music.mp3')
+        # Oyun müziği varsayılan olarak kapalı (kullanıcı isteği) - settings.GAME_MUSIC
+        if GAME_MUSIC:
+            Audio.play_music(GAME_MUSIC, MUSIC_CROSSFADE_MS)
         pygame.mouse.set_visible(False)  # Oyun aktifken fareyi gizle
     
     def exit(self):
         """Oyundan çıkıldığında müziği durdur, rekor kaydet ve fareyi göster"""
-        save_highscore(self.spawn_manager.level, self.start_level)
-        Audio.stop()
+        highscores.submit(self.spawn_manager.level, self.start_level)
+        self._save_replay()
+        Audio.fade_out_music()
+        Audio.stop_all_sounds()
         pygame.mouse.set_visible(True)  # Menüye dönünce fareyi göster
     
     def _load_assets(self):
@@ -271,16 +409,21 @@ class PlayingState(GameState):
     
     def _init_game_objects(self):
         """Oyun nesnelerini başlat"""
-        from game_objects import SpawnManager, HealthUI
+        from game_objects import SpawnManager, HealthUI, Bomb, JiletStore, TerlikStore
         import pygame
         
+        # Patlama hasar dairesi kademeleri - ilk patlamada çizilmesin
+        Bomb.prerender_effects()
+        
         # Nesne grupları
         self.bombs = pygame.sprite.Group()
-        self.jilets = pygame.sprite.Group()
-        self.terliks = pygame.sprite.Group()
+        self.jilets = JiletStore(self.screen_width, self.screen_height, JILET_SCALE)
+        self.terliks = TerlikStore(self.screen_width, self.screen_height, TERLIK_SCALE)
+        self.collisions = CollisionBatch()
+        self.bomb_grid = SpatialGrid(SPATIAL_GRID_CELL_SIZE)  # Patlayan bomba merkezleri
         
         # Spawn yöneticisi
-        self.spawn_manager = SpawnManager(self.screen_width, self.screen_height)
+        self.spawn_manager = SpawnManager(self.screen_width, self.screen_height, self.seed)
         
         # Can UI
         self.health_ui = HealthUI(self.screen_width, self.screen_height)
@@ -320,24 +463,76 @@ class PlayingState(GameState):
             'assets/button_quit_h.png'
         )
         
-        # Game over overlay
-        self.game_over_overlay = pygame.Surface((self.screen_width, self.screen_height))
-        self.game_over_overlay.fill((0, 0, 0))
-        self.game_over_overlay.set_alpha(200)
+        # Game over overlay (önbellekten, her oyunda yeniden oluşturulmaz)
+        self.game_over_overlay = Assets.get_overlay((self.screen_width, self.screen_height), 200)
     
     def _clear_enemies(self):
-        """Tüm düşmanları temizle"""
-        self.bombs.empty()
+        """Tüm düşmanları temizle (bomba ve buff havuza döner)"""
+        for bomb in list(self.bombs):
+            self.spawn_manager.bomb_pool.release(bomb)
         self.jilets.empty()
         self.terliks.empty()
+        self._release_buff()
+    
+    def _release_buff(self):
+        """Aktif buff'ı kaldır ve havuza geri ver"""
+        if self.active_buff:
+            self.spawn_manager.release_buff(self.active_buff_type, self.active_buff)
         self.active_buff = None
         self.active_buff_type = None
     
+    def _prewarm_pools(self):
+        """Level başında havuzları hazırla (level sınırına göre değil, ölçülen eşzamanlı sayıya göre)"""
+        self.spawn_manager.prewarm_pools()
+        self.jilets.prewarm(POOL_PREWARM['jilet'])
+        self.terliks.prewarm(POOL_PREWARM['terlik'])
+    
+    def pool_stats(self):
+        """Tür başına havuz istatistikleri (canlı, boşta, en fazla canlı)"""
+        stats = {'bomb': self.spawn_manager.bomb_pool.stats()}
+        for buff_type, pool in self.spawn_manager.buff_pools.items():
+            stats[buff_type] = pool.stats()
+        stats['jilet'] = self.jilets.stats()
+        stats['terlik'] = self.terliks.stats()
+        return stats
+    
+    def _begin_level(self):
+        """Level başlangıç ekranını kapat ve oyunu başlat"""
+        self.waiting_for_start = False
+        # Eğer start_level > 1 ise, initial enemies spawn et
+        if self.start_level > 1:
+            self.spawn_manager.spawn_initial_enemies(
+                self.bombs, self.jilets, self.terliks, self.player.rect
+            )
+    
+    def _save_replay(self):
+        """Replay kaydını dosyaya yaz (kayıt açıksa, bir kez)"""
+        if self.replay_saved or not isinstance(self.input_source, ReplayRecorder):
+            return
+        path = self.input_source.save_to_dir(REPLAY_DIR, self.simulation_checksum())
+        self.replay_saved = True
+        print(f"Replay kaydedildi: {path}")
+    
+    def simulation_checksum(self):
+        """Simülasyon durumunun özeti (replay doğrulaması için)"""
+        parts = [
+            self.spawn_manager.level, self.spawn_manager.level_timer,
+            self.player.pos.x, self.player.pos.y, self.player.health,
+        ]
+        for bomb in self.bombs:
+            parts.append((bomb.pos.x, bomb.pos.y))
+        for store in (self.jilets, self.terliks):
+            parts.extend(store.positions())
+        if self.active_buff:
+            parts.append((self.active_buff_type, self.active_buff.rect.center))
+        return zlib.crc32(repr(parts).encode())
+    
     def _start_next_level(self):
         """Sonraki leveli başlat"""
         self._clear_enemies()
         self.spawn_manager.level += 1
         self.spawn_manager.reset_for_new_level()
+        self._prewarm_pools()
         # Level başlangıcında hemen 1 terlik ve 1 jilet spawn et
         self.spawn_manager.spawn_initial_enemies(
             self.bombs, self.jilets, self.terliks, self.player.rect
@@ -346,7 +541,7 @@ class PlayingState(GameState):
         # Ses flag'ini sıfırla
         self.level_complete_sound_played = False
         # Oyuncuyu merkeze al
-        self.player.rect.center = (self.screen_width // 2, self.screen_height // 2)
+        self.player.set_position(self.screen_width // 2, self.screen_height // 2)
     
     def _restart_game(self):
         """Oyunu yeniden başlat"""
@@ -369,32 +564,22 @@ class PlayingState(GameState):
                 return
             return
         
-        # Level tamamlandı ve başlat bekleniyor
+        # Level tamamlandı ve başlat bekleniyor (onay bir sonraki simülasyon adımında işlenir)
         if self.spawn_manager.level_complete and not self.game_over:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                self._start_next_level()
+                self.input_source.confirm()
                 return
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                self._start_next_level()
+                self.input_source.confirm()
                 return
         
         # Level başlangıcında başlat bekleniyor
         if self.waiting_for_start:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                self.waiting_for_start = False
-                # Eğer start_level > 1 ise, initial enemies spawn et
-                if self.start_level > 1:
-                    self.spawn_manager.spawn_initial_enemies(
-                        self.bombs, self.jilets, self.terliks, self.player.rect
-                    )
+                self.input_source.confirm()
                 return
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                self.waiting_for_start = False
-                # Eğer start_level > 1 ise, initial enemies spawn et
-                if self.start_level > 1:
-                    self.spawn_manager.spawn_initial_enemies(
-                        self.bombs, self.jilets, self.terliks, self.player.rect
-                    )
+                self.input_source.confirm()
                 return
             # ESC ile çıkış
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -436,20 +621,35 @@ class PlayingState(GameState):
             return
     
     def update(self, dt):
-        """Güncelle"""
+        """Bir simülasyon adımı güncelle"""
+        self.simulation_active = False
+        
         # Level tamamlandı sesi (bir kez) - return'den önce kontrol et
         if self.spawn_manager.level_complete and not self.level_complete_sound_played:
             Audio.play_sound('level_complete')
             self.level_complete_sound_played = True
         
-        # Game over, beklemede veya level tamamlandıysa güncelleme yapma
-        if self.game_over or self.waiting_for_start or self.spawn_manager.level_complete:
+        # Game over ise güncelleme yapma
+        if self.game_over:
             return
         
         # Pause menüsü veya hint popup açıksa oyunu durdur
         if self.pause_menu.is_open or self.hint_popup.is_open:
             return
         
+        # Bu adımın girişi (klavye veya replay)
+        input_bits = self.input_source.poll()
+        
+        # Beklemede veya level tamamlandıysa sadece onay bekle
+        if self.waiting_for_start:
+            if input_bits & INPUT_CONFIRM:
+                self._begin_level()
+            return
+        if self.spawn_manager.level_complete:
+            if input_bits & INPUT_CONFIRM:
+                self._start_next_level()
+            return
+        
         # Oyuncu öldüyse game over
         if self.player.is_dead():
             self.game_over = True
@@ -460,12 +660,14 @@ class PlayingState(GameState):
                 Audio.play_sound('game_over')
                 self.game_over_sound_played = True
             # Rekor kaydet (sadece level 1'den başlayanlar için)
-            from settings import save_highscore
-            save_highscore(self.spawn_manager.level, self.start_level)
+            highscores.submit(self.spawn_manager.level, self.start_level)
+            self._save_replay()
             return
         
+        self.simulation_active = True
+        
         # Oyuncuyu güncelle
-        self.player.update(self.screen_width, self.screen_height, dt)
+        self.player.update(self.screen_width, self.screen_height, dt, input_bits)
         
         # Spawn manager güncelle (sadece aktif buff yoksa yeni buff spawn olabilir)
         new_buff = self.spawn_manager.update(
@@ -482,82 +684,126 @@ class PlayingState(GameState):
             self.active_buff_type, self.active_buff = new_buff
         
         # Nesneleri güncelle
+        self._update_objects(dt)
+        
+        # Çarpışma kontrolü
+        self._check_collisions()
+        
+        # UI güncelle
+        self.health_ui.update(dt)
+    
+    def _update_objects(self, dt):
+        """Bomba, düşman ve buff nesnelerini bir adım ilerlet (animasyon saati de bir adım ilerler)"""
         player_rect = self.player.get_collision_rect()
+        clock.advance(dt)
         
         for bomb in list(self.bombs):
-            bomb.update(self.screen_width, self.screen_height, player_rect)
+            bomb.update(self.screen_width, self.screen_height, player_rect, dt)
             if bomb.exploded:
-                self.bombs.remove(bomb)
-        
-        for jilet in self.jilets:
-            jilet.update(self.screen_width, self.screen_height, player_rect)
+                self.spawn_manager.bomb_pool.release(bomb)
         
-        for terlik in list(self.terliks):
-            terlik.update(self.screen_width, self.screen_height, player_rect)
-            if terlik.is_off_screen():
-                self.terliks.remove(terlik)
+        # Jilet ve terlikler tür başına tek vektörel geçiş (terlikler ekran dışına çıkınca silinir)
+        self.jilets.update(player_rect.center, dt)
+        self.terliks.update(dt)
         
         # Aktif buff'ı güncelle
         if self.active_buff:
             if not self.active_buff.update(self.screen_width, self.screen_height, player_rect, dt):
-                self.active_buff = None
-                self.active_buff_type = None
-        
-        # Çarpışma kontrolü
-        self._check_collisions()
-        
-        # UI güncelle
-        self.health_ui.update()
+                self._release_buff()
     
     def _check_collisions(self):
         """Çarpışma kontrolü"""
         player_rect = self.player.get_collision_rect()
         
+        # Tüm şekiller oyuncuya karşı tek seferde test edilir; sonuçlar aşağıda eski sırayla uygulanır
+        batch = self.collisions
+        batch.clear()
+        if self.active_buff:
+            buff_rect = self.active_buff.rect
+            batch.add_rects('buff', (buff_rect.x,), (buff_rect.y,), buff_rect.width, buff_rect.height)
+        bombs = [bomb for bomb in self.bombs if bomb.can_deal_damage]
+        if bombs:
+            # Patlama dairesi oyuncuya yetişebilecek bombalar ızgaradan; kesin daire-rect testi batch'te
+            self.bomb_grid.update([bomb.rect.centerx for bomb in bombs], [bomb.rect.centery for bomb in bombs])
+            reach = max(bomb.explosion_radius for bomb in bombs)
+            near = self.bomb_grid.query_rect(player_rect.left - reach, player_rect.top - reach,
+                                             player_rect.right + reach, player_rect.bottom + reach)
+            bombs = [bombs[index] for index in near.tolist()]
+        if bombs:
+            batch.add_circles('bomb', [bomb.rect.centerx for bomb in bombs], [bomb.rect.centery for bomb in bombs],
+                              [bomb.explosion_radius for bomb in bombs])
+        self.jilets.add_rects_to(batch, 'jilet')
+        self.terliks.add_rects_to(batch, 'terlik')
+        hits = batch.test(player_rect)
+        
         # Aktif buff ile çarpışma kontrolü
-        if self.active_buff and player_rect.colliderect(self.active_buff.rect):
+        if len(hits.get('buff', ())):
             if self.active_buff_type == 'tea':
                 if self.player.heal(1):
                     self.health_ui.set_health(self.player.health)
                     Audio.play_sound('buff_tea')
-                    self.active_buff = None
-                    self.active_buff_type = None
+                    self._release_buff()
             elif self.active_buff_type == 'speed_buff':
                 self.player.apply_speed_buff()
                 Audio.play_sound('buff_speed_apply')
-                self.active_buff = None
-                self.active_buff_type = None
+                self._release_buff()
             elif self.active_buff_type == 'speed_debuff':
                 self.player.apply_speed_debuff()
                 Audio.play_sound('debuff_speed_apply')
-                self.active_buff = None
-                self.active_buff_type = None
+                self._release_buff()
         
         # Bomba patlaması (ses zaten bomb.update() içinde çalıyor)
-        for bomb in self.bombs:
-            if bomb.check_explosion_hit(player_rect):
-                if self.player.take_damage(1):
-                    self.health_ui.set_health(self.player.health)
-        
-        # Jilet çarpışması
-        for jilet in list(self.jilets):
-            if player_rect.colliderect(jilet.rect):
-                if self.player.take_damage(1):
-                    self.health_ui.set_health(self.player.health)
-                    Audio.play_sound('jilet_hit')
-                    self.jilets.remove(jilet)
-        
-        # Terlik çarpışması
-        for terlik in list(self.terliks):
-            if player_rect.colliderect(terlik.rect):
+        for index in hits.get('bomb', ()):
+            bombs[index].has_dealt_damage = True
+            if self.player.take_damage(1):
+                self.health_ui.set_health(self.player.health)
+        
+        # Jilet ve terlik çarpışması
+        for store, key, sound in ((self.jilets, 'jilet', 'jilet_hit'), (self.terliks, 'terlik', 'terlik_hit')):
+            removed = []
+            for index in hits.get(key, ()):
                 if self.player.take_damage(1):
                     self.health_ui.set_health(self.player.health)
-                    Audio.play_sound('terlik_hit')
-                    self.terliks.remove(terlik)
+                    Audio.play_sound(sound)
+                    removed.append(index)
+            store.remove(removed)
     
     def draw(self, screen):
-        """Çiz"""
+        """Çiz (overlay yokken sadece değişen bölgeler çizilir)"""
+        # Simülasyon duruyorsa son adımın konumunda çiz
+        alpha = self.engine.alpha if self.simulation_active else 1.0
+        
+        # Tam ekran overlay'ler (pause, hint, level ekranı, game over) her karede tamamen çizilir
+        tracker = self.engine.dirty_rects
+        overlay_open = (self.pause_menu.is_open or self.hint_popup.is_open or self.game_over or
+                        self.waiting_for_start or self.spawn_manager.level_complete)
+        if tracker and not overlay_open:
+            self._draw_scene(tracker.begin(self.background), alpha)
+            return tracker.end()
+        
         screen.blit(self.background, (0, 0))
+        self._draw_scene(screen, alpha)
+        
+        # Hint popup (en üstte çizilmeli)
+        self.hint_popup.draw(screen)
+        
+        # Pause menüsü (en üstte)
+        self.pause_menu.draw(screen)
+        
+        # Level başlangıcı veya tamamlanma ekranı
+        if self.waiting_for_start or self.spawn_manager.level_complete:
+            self._draw_level_screen(screen)
         
+        # Game Over ekranı (en üstte)
+        if self.game_over:
+            self._draw_game_over(screen)
+        
+        if tracker:
+            tracker.invalidate()
+        return None
+    
+    def _draw_scene(self, screen, alpha):
+        """Arka plan dışındaki oyun sahnesi ve HUD"""
         # Bombaları çiz
         for bomb in self.bombs:
             bomb.draw(screen)
@@ -567,15 +813,13 @@ class PlayingState(GameState):
             self.active_buff.draw(screen)
         
         # Jileti çiz
-        for jilet in self.jilets:
-            jilet.draw(screen)
+        self.jilets.draw(screen, alpha)
         
         # Terlikleri çiz
-        for terlik in self.terliks:
-            terlik.draw(screen)
+        self.terliks.draw(screen, alpha)
         
         # Oyuncuyu çiz
-        self.player.draw(screen)
+        self.player.draw(screen, alpha)
         
         # Can UI
         self.health_ui.draw(screen)
@@ -594,20 +838,6 @@ class PlayingState(GameState):
             # Normal durumda hint butonunu çiz (hover yok)
             self.hint_button.is_hovered = False
             self.hint_button.draw(screen)
-        
-        # Hint popup (en üstte çizilmeli)
-        self.hint_popup.draw(screen)
-        
-        # Pause menüsü (en üstte)
-        self.pause_menu.draw(screen)
-        
-        # Level başlangıcı veya tamamlanma ekranı
-        if self.waiting_for_start or self.spawn_manager.level_complete:
-            self._draw_level_screen(screen)
-        
-        # Game Over ekranı (en üstte)
-        if self.game_over:
-            self._draw_game_over(screen)
     
     def _draw_game_over(self, screen):
         """Game Over ekranı"""
@@ -619,19 +849,16 @@ class PlayingState(GameState):
         
         # GAME OVER başlık
         title = "GAME OVER"
-        title_surf = self.game_over_font.render(title, True, RED)
-        title_shadow = self.game_over_font.render(title, True, BLACK)
-        screen.blit(title_shadow, (center_x - title_surf.get_width() // 2 + 4, center_y - 120 + 4))
-        screen.blit(title_surf, (center_x - title_surf.get_width() // 2, center_y - 120))
+        title_surf = Assets.render_shadowed(self.game_over_font, title, RED, offset=4)
+        screen.blit(title_surf, (center_x - (title_surf.get_width() - 4) // 2, center_y - 120))
         
         # Ulaşılan level
         level_text = f"Level {self.spawn_manager.level}'e ulaştın!"
-        level_surf = self.info_font.render(level_text, True, WHITE)
+        level_surf = Assets.render_text(self.info_font, level_text, WHITE)
         screen.blit(level_surf, (center_x - level_surf.get_width() // 2, center_y - 30))
         
         # Rekor bilgisi
-        from settings import load_highscore
-        highscore = load_highscore()
+        highscore = highscores.get()
         if highscore['level'] > 0:
             if self.spawn_manager.level >= highscore['level']:
                 record_text = "*** YENI REKOR! ***"
@@ -639,7 +866,7 @@ class PlayingState(GameState):
             else:
                 record_text = f"Rekor: Level {highscore['level']}"
                 record_color = LIGHT_GRAY
-            record_surf = self.info_font.render(record_text, True, record_color)
+            record_surf = Assets.render_text(self.info_font, record_text, record_color)
             screen.blit(record_surf, (center_x - record_surf.get_width() // 2, center_y + 10))
         
         # Butonlar
@@ -650,31 +877,23 @@ class PlayingState(GameState):
         """Level ve kalan süre bilgisi (üstte ortalanmış)"""
         # Level
         level_text = f"Level {self.spawn_manager.level}"
-        level_surf = self.info_font.render(level_text, True, WHITE)
-        level_shadow = self.info_font.render(level_text, True, BLACK)
+        level_surf = Assets.render_shadowed(self.info_font, level_text, WHITE)
         
-        # Kalan süre
+        # Kalan süre (yazı saniyede bir değişir, arada önbellekten gelir)
         remaining = max(0, LEVEL_DURATION - self.spawn_manager.level_timer)
         time_text = f"{int(remaining)}s"
-        time_surf = self.info_font.render(time_text, True, YELLOW)
-        time_shadow = self.info_font.render(time_text, True, BLACK)
+        time_surf = Assets.render_shadowed(self.info_font, time_text, YELLOW)
         
-        # Ortalanmış çiz
+        # Ortalanmış çiz (gölge payı 2 px genişlikten düşülür)
         center_x = self.screen_width // 2
         
-        screen.blit(level_shadow, (center_x - level_surf.get_width() // 2 + 2, 22))
-        screen.blit(level_surf, (center_x - level_surf.get_width() // 2, 20))
-        
-        screen.blit(time_shadow, (center_x - time_surf.get_width() // 2 + 2, 62))
-        screen.blit(time_surf, (center_x - time_surf.get_width() // 2, 60))
+        screen.blit(level_surf, (center_x - (level_surf.get_width() - 2) // 2, 20))
+        screen.blit(time_surf, (center_x - (time_surf.get_width() - 2) // 2, 60))
     
     def _draw_level_screen(self, screen):
         """Level başlangıç/bitiş ekranı"""
         # Karartma
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        screen.blit(overlay, (0, 0))
+        screen.blit(Assets.get_overlay((self.screen_width, self.screen_height), 180), (0, 0))
         
         center_x = self.screen_width // 2
         center_y = self.screen_height // 2
@@ -689,21 +908,18 @@ class PlayingState(GameState):
             subtitle = "Sonraki level için tıkla veya SPACE'e bas"
         
         # Başlık
-        title_surf = self.level_font.render(title, True, WHITE)
-        title_shadow = self.level_font.render(title, True, BLACK)
-        screen.blit(title_shadow, (center_x - title_surf.get_width() // 2 + 3, center_y - 50 + 3))
-        screen.blit(title_surf, (center_x - title_surf.get_width() // 2, center_y - 50))
+        title_surf = Assets.render_shadowed(self.level_font, title, WHITE, offset=3)
+        screen.blit(title_surf, (center_x - (title_surf.get_width() - 3) // 2, center_y - 50))
         
         # Alt başlık
-        sub_surf = self.info_font.render(subtitle, True, LIGHT_GRAY)
+        sub_surf = Assets.render_text(self.info_font, subtitle, LIGHT_GRAY)
         screen.blit(sub_surf, (center_x - sub_surf.get_width() // 2, center_y + 30))
         
         # Rekor bilgisi
-        from settings import load_highscore
-        highscore = load_highscore()
+        highscore = highscores.get()
         if highscore['level'] > 0:
             record_text = f"Rekor: Level {highscore['level']} ({highscore['date']})"
-            record_surf = self.info_font.render(record_text, True, YELLOW)
+            record_surf = Assets.render_text(self.info_font, record_text, YELLOW)
             screen.blit(record_surf, (center_x - record_surf.get_width() // 2, center_y + 80))
     
     def _draw_buff_indicator(self, screen):
@@ -724,8 +940,8 @@ class PlayingState(GameState):
             bar_y = indicator_y + icon.get_height() + 3
             
             remaining = self.player.speed_buff_timer / self.player.buff_duration
-            pygame.draw.rect(screen, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
-            pygame.draw.rect(screen, GREEN, (bar_x, bar_y, int(bar_width * remaining), bar_height))
+            screen.fill(DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
+            screen.fill(GREEN, (bar_x, bar_y, int(bar_width * remaining), bar_height))
         
         elif self.player.has_active_debuff():
             # Kırmızı yavaşlık göstergesi
@@ -739,5 +955,5 @@ class PlayingState(GameState):
             bar_y = indicator_y + icon.get_height() + 3
             
             remaining = self.player.speed_debuff_timer / self.player.buff_duration
-            pygame.draw.rect(screen, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
-            pygame.draw.rect(screen, RED, (bar_x, bar_y, int(bar_width * remaining), bar_height))
+            screen.fill(DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
+            screen.fill(RED, (bar_x, bar_y, int(bar_width * remaining), bar_height))
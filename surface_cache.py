@@ -0,0 +1,114 @@
+"""
+Bıyık Bey'in Çilesi - Görsel Disk Önbelleği
+Çözülmüş ve ölçeklenmiş görselleri ham RGBA olarak diske yazar, sonraki açılışlarda
+PNG/JPEG çözmeden ve yeniden ölçeklemeden mmap üzerinden geri yükler
+
+Dosya formatı:
+    Başlık  - magic, genişlik, yükseklik
+    Gövde   - genişlik * yükseklik * 4 bayt RGBA piksel
+
+Anahtar: kaynak yolu + değiştirilme zamanı + dönüşüm (ölçek/boyut) + piksel formatı.
+Kaynak dosya değişince anahtar da değişir, eski kayıt kullanılmaz.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import pygame
+from settings import *
+
+
+_MAGIC = b'BBSC'
+_HEADER = struct.Struct('<4sII')
+_PIXEL_FORMAT = 'RGBA'
+
+
+def cache_path(source, transform):
+    """
+    Önbellek dosyasının yolu
+    
+    Parametreler:
+        source: Kaynak görsel dosyası
+        transform: Dönüşümü tanımlayan anahtar (ör. Assets cache anahtarı)
+    
+    Döndürür:
+        Dosya yolu, kaynak okunamıyorsa None
+    """
+    try:
+        mtime = os.stat(source).st_mtime_ns
+    except OSError:
+        return None
+    text = f"{SURFACE_CACHE_VERSION}|{source}|{mtime}|{transform}|{_PIXEL_FORMAT}"
+    digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+    return os.path.join(SURFACE_CACHE_DIR, digest + '.rgba')
+
+
+def read_surface(path):
+    """
+    Önbellekten görsel oku (ekran formatına çevrilmiş)
+    
+    Döndürür:
+        Surface, kayıt yoksa veya bozuksa None
+    """
+    try:
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    
+    try:
+        if len(mm) < _HEADER.size:
+            return None
+        magic, width, height = _HEADER.unpack_from(mm)
+        if magic != _MAGIC or len(mm) != _HEADER.size + width * height * 4:
+            return None
+        view = memoryview(mm)[_HEADER.size:]
+        try:
+            raw = pygame.image.frombuffer(view, (width, height), _PIXEL_FORMAT)
+            surface = raw.convert_alpha()  # Kopya - mmap kapatılabilir
+            del raw
+        finally:
+            view.release()
+        return surface
+    except (ValueError, pygame.error):
+        return None
+    finally:
+        mm.close()
+
+
+def write_surface(path, surface):
+    """Görseli önbelleğe yaz (yarım kalan yazma okunmasın diye geçici dosya + rename)"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, surface.get_width(), surface.get_height()))
+            f.write(pygame.image.tobytes(surface, _PIXEL_FORMAT))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Görsel önbelleğe yazılamadı: {path} - {e}")
+
+
+def load(source, transform, process):
+    """
+    İşlenmiş görseli önbellekten yükle, yoksa üret ve önbelleğe yaz
+    
+    Parametreler:
+        source: Kaynak görsel dosyası
+        transform: Dönüşümü tanımlayan anahtar
+        process: Görseli kaynaktan üreten fonksiyon (çözme + ölçekleme)
+    """
+    if not SURFACE_CACHE_ENABLED:
+        return process()
+    
+    path = cache_path(source, transform)
+    if path is not None:
+        surface = read_surface(path)
+        if surface is not None:
+            return surface
+    
+    surface = process()
+    if path is not None:
+        write_surface(path, surface)
+    return surface
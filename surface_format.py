@@ -0,0 +1,122 @@
+"""
+Bıyık Bey'in Çilesi - Görsel Format Seçici
+Yüklenen görsellerin alfa kanalına bakıp en hızlı çizilen Surface formatını seçer
+
+Formatlar:
+    opaque   - Tüm pikseller opak: convert() (alfa karıştırması yok, düz kopya)
+    colorkey - Pikseller ya tam opak ya tam saydam: convert() + colorkey + RLEACCEL
+    alpha    - Yarı saydam piksel var: convert_alpha() (piksel başına alfa)
+
+Kullanım:
+    python surface_format.py          # assets/ altındaki görsellerin format raporu
+"""
+
+import os
+import pygame
+from settings import *
+
+
+OPAQUE = 'opaque'
+COLORKEY = 'colorkey'
+ALPHA = 'alpha'
+
+# Seçilen formatlar {anahtar: (format, (genişlik, yükseklik))}
+_report = {}
+
+
+def classify(surface):
+    """
+    Görselin alfa kanalına göre formatını belirle
+    
+    Parametreler:
+        surface: convert_alpha() ile ekran formatına çevrilmiş görsel
+    
+    Döndürür:
+        OPAQUE, COLORKEY veya ALPHA
+    """
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return OPAQUE
+    
+    # Ortalama alfa tam sayıya aşağı yuvarlanır - 255 ise tüm pikseller opak
+    # (büyük arka planlarda maskelerden çok daha hızlı)
+    if pygame.transform.average_color(surface)[3] == 255:
+        return OPAQUE
+    
+    opaque = pygame.mask.from_surface(surface, 254)   # alfa == 255
+    visible = pygame.mask.from_surface(surface, 0)    # alfa > 0
+    if opaque.count() != visible.count():
+        return ALPHA
+    
+    # Colorkey rengi görselin kendi opak piksellerinde kullanılıyorsa o pikseller kaybolur
+    key = pygame.mask.from_threshold(surface, SURFACE_COLORKEY, (1, 1, 1, 255))
+    if key.overlap_area(opaque, (0, 0)):
+        return ALPHA
+    return COLORKEY
+
+
+def optimize(surface, key=None):
+    """
+    Görseli seçilen formata çevir
+    
+    Parametreler:
+        surface: convert_alpha() ile ekran formatına çevrilmiş görsel
+        key: Raporda görünecek ad (ör. Assets önbellek anahtarı)
+    
+    Döndürür:
+        Aynı görüntüyü veren, çizimi daha hızlı Surface (ALPHA ise aynı Surface)
+    """
+    choice = classify(surface)
+    if choice == OPAQUE:
+        result = surface.convert()
+    elif choice == COLORKEY:
+        result = pygame.Surface(surface.get_size()).convert()
+        result.fill(SURFACE_COLORKEY)
+        result.blit(surface, (0, 0))
+        result.set_colorkey(SURFACE_COLORKEY, pygame.RLEACCEL)
+    else:
+        result = surface
+    
+    if key is not None:
+        _report[key] = (choice, surface.get_size())
+    return result
+
+
+def report():
+    """Şimdiye kadar seçilen formatlar [(anahtar, format, boyut), ...]"""
+    return [(key, choice, size) for key, (choice, size) in sorted(_report.items())]
+
+
+def summary(entries):
+    """Format başına görsel sayısı ve piksel toplamı {format: (adet, piksel)}"""
+    totals = {OPAQUE: (0, 0), COLORKEY: (0, 0), ALPHA: (0, 0)}
+    for _, choice, (w, h) in entries:
+        count, pixels = totals[choice]
+        totals[choice] = (count + 1, pixels + w * h)
+    return totals
+
+
+def main():
+    # Ekran açmadan convert kullanabilmek için - sadece komut satırından çalışınca
+    # (modül import edildiğinde oyunun video sürücüsü değişmesin)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    
+    for root, _, files in sorted(os.walk('assets')):
+        for name in sorted(files):
+            if name.lower().endswith(('.png', '.jpg', '.jpeg')):
+                path = os.path.join(root, name)
+                optimize(pygame.image.load(path).convert_alpha(), path)
+    
+    entries = report()
+    for path, choice, (w, h) in entries:
+        print(f"{choice:<9} {w:>5}x{h:<5} {path}")
+    print()
+    for choice, (count, pixels) in summary(entries).items():
+        print(f"{choice:<9} {count:>3} görsel, {pixels / 1e6:.1f} MP")
+    
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""AnimationClip - kare seçimi simülasyon saatinden, klip değiştirilemez"""
+
+import pygame
+import pytest
+from animation import AnimationClip, SimulationClock, register_clip, get_clip
+
+
+@pytest.fixture(scope='module')
+def frames():
+    return [pygame.Surface((4, 4)) for _ in range(4)]
+
+
+def test_loop_clip_wraps(frames):
+    clip = AnimationClip('loop', frames, 0.1)
+    assert [clip.frame_index(t) for t in (0.0, 0.05, 0.1, 0.35, 0.4, 0.95)] == [0, 0, 1, 3, 0, 1]
+    assert clip.frame(0.25) is frames[2]
+    assert not clip.finished(100.0)
+
+
+def test_once_clip_holds_last_frame(frames):
+    clip = AnimationClip('once', frames[:3], 0.05, loop=False)
+    assert clip.frame_index(0.149) == 2
+    assert not clip.finished(0.149)
+    assert clip.finished(0.15)
+    assert clip.frame_index(10.0) == 2
+
+
+def test_frame_boundary_from_clock_steps(frames):
+    # 1/6 sn kare süresi, 60 Hz saat: her 10 adımda bir kare - kayan nokta hatası önceki kareyi seçtirmez
+    clip = AnimationClip('boundary', frames, 1 / 6)
+    clock = SimulationClock(1 / 60)
+    start = clock.ticks
+    indices = []
+    for _ in range(40):
+        indices.append(clip.frame_index(clock.elapsed(start)))
+        clock.advance(1 / 60)
+    assert indices == [i // 10 for i in range(40)]
+
+
+def test_clock_elapsed_uses_step_length():
+    clock = SimulationClock(1 / 60)
+    start = clock.ticks
+    for _ in range(30):
+        clock.advance(1 / 30)                # Replay farklı frekansta
+    assert clock.ticks - start == 30
+    assert clock.elapsed(start) == pytest.approx(1.0)
+
+
+def test_clip_is_immutable(frames):
+    clip = AnimationClip('frozen', frames, 0.1)
+    with pytest.raises(AttributeError):
+        clip.loop = False
+    assert isinstance(clip.frames, tuple)
+
+
+def test_register_returns_existing(frames):
+    clip = register_clip('test_shared', frames, 0.1)
+    assert register_clip('test_shared', frames[:1], 0.5) is clip
+    assert get_clip('test_shared') is clip
@@ -0,0 +1,56 @@
+"""AssetCache - bayt sayımı, LRU atma ve sabitleme"""
+
+import pygame
+from engine import AssetCache
+
+
+def surface(width, height=1):
+    """width * height * 4 bayt yer kaplayan yüzey"""
+    return pygame.Surface((width, height), pygame.SRCALPHA, 32)
+
+
+def test_size_of():
+    page = surface(100, 10)
+    assert AssetCache.size_of(page) == 4000
+    # Subsurface'in belleği sayfaya ait - ayrıca sayılmaz
+    assert AssetCache.size_of(page.subsurface((0, 0, 10, 10))) == 0
+    assert AssetCache.size_of([surface(10), surface(5)]) == 60
+    assert AssetCache.size_of(None) == 0
+
+
+def test_evicts_least_recently_used():
+    cache = AssetCache(budget_bytes=120)
+    for key in 'abc':
+        cache.put(key, surface(10))
+    assert cache.get('a') is not None       # 'a' en yeni kullanılan olur
+    cache.put('d', surface(10))
+    assert 'b' not in cache
+    assert all(key in cache for key in 'acd')
+    assert cache.bytes == 120
+    assert cache.stats()['evictions'] == 1
+
+
+def test_pinned_entries_are_never_evicted():
+    cache = AssetCache(budget_bytes=60)
+    cache.pin('sprite')                     # Yüklenmeden önce sabitlenebilir
+    cache.put('sprite', surface(20))
+    cache.put('other', surface(10))
+    # Sabit kayıt bütçeyi aşsa da kalır, sabit olmayanlar atılır
+    assert 'sprite' in cache
+    assert 'other' not in cache
+    assert cache.bytes == 80
+    assert cache.stats()['pinned_bytes'] == 80
+    # Sabitleme kalkınca bütçeye inilir
+    cache.unpin('sprite')
+    assert 'sprite' not in cache
+    assert cache.bytes == 0
+
+
+def test_replacing_entry_updates_bytes():
+    cache = AssetCache()
+    cache.put('a', surface(10))
+    cache.put('a', surface(20))
+    assert cache.bytes == 80
+    assert len(cache) == 1
+    assert cache.get('missing') is None
+    assert cache.stats()['misses'] == 1
@@ -0,0 +1,56 @@
+"""CollisionBatch - sonuçlar Rect.colliderect ve Vector2.distance_to ile aynı olmalı"""
+
+import numpy as np
+import pygame
+import pytest
+from collision import CollisionBatch
+
+
+def expected_hits(player, rects, circles):
+    """Tek tek pygame ile hesaplanan isabetler"""
+    center = pygame.math.Vector2(player.center)
+    return ([i for i, r in enumerate(rects) if player.colliderect(r)],
+            [i for i, (x, y, radius) in enumerate(circles) if center.distance_to((x, y)) <= radius])
+
+
+def random_shapes(rng, n):
+    rects = [pygame.Rect(*rng.integers(0, 400, 2).tolist(), *rng.integers(0, 60, 2).tolist()) for _ in range(n)]
+    circles = [(*rng.integers(0, 400, 2).tolist(), float(rng.uniform(0, 120))) for _ in range(n)]
+    return rects, circles
+
+
+@pytest.mark.parametrize('min_shapes', [0, 10 ** 9])  # Vektörel ve tek tek yol
+def test_matches_pygame(min_shapes):
+    rng = np.random.default_rng(3)
+    batch = CollisionBatch(capacity=4, min_shapes=min_shapes)
+    for _ in range(50):
+        player = pygame.Rect(*rng.integers(0, 400, 2).tolist(), *rng.integers(0, 80, 2).tolist())
+        rects, circles = random_shapes(rng, int(rng.integers(1, 40)))
+        batch.clear()
+        batch.add_rects('rect', np.array([r.x for r in rects]), np.array([r.y for r in rects]),
+                        np.array([r.w for r in rects]), np.array([r.h for r in rects]))
+        batch.add_circles('circle', [c[0] for c in circles], [c[1] for c in circles], [c[2] for c in circles])
+        hits = batch.test(player)
+        rect_hits, circle_hits = expected_hits(player, rects, circles)
+        assert list(hits.get('rect', ())) == rect_hits
+        assert list(hits.get('circle', ())) == circle_hits
+
+
+@pytest.mark.parametrize('min_shapes', [0, 10 ** 9])
+def test_edge_touch_and_empty_rect(min_shapes):
+    batch = CollisionBatch(min_shapes=min_shapes)
+    player = pygame.Rect(100, 100, 50, 50)
+    # Kenar teması çarpışma değil; tek değerli boyut tüm gruba uygulanır
+    batch.add_rects('touch', (150, 60, 120), (100, 100, 120), 10, 40)
+    hits = batch.test(player)
+    assert list(hits.get('touch', ())) == [2]
+    assert not len(batch.test(pygame.Rect(120, 120, 0, 10)).get('touch', ()))
+
+
+def test_no_hits_result_is_read_only():
+    batch = CollisionBatch()
+    hits = batch.test(pygame.Rect(0, 0, 10, 10))
+    with pytest.raises(TypeError):
+        hits['x'] = [0]
+    batch.add_rects('far', (500,), (500,), 10, 10)
+    assert batch.test(pygame.Rect(0, 0, 10, 10)).get('x') is None
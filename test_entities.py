@@ -0,0 +1,92 @@
+"""EntityStore - satır ekleme/silme, rect yuvarlama ve vektörel kare seçimi"""
+
+import numpy as np
+import pygame
+import pytest
+from animation import clock, register_clip, get_clip
+from entities import EntityStore
+
+
+@pytest.fixture(scope='module')
+def clips():
+    frames = [pygame.Surface((10, 6)) for _ in range(4)]
+    return [register_clip('test_loop', frames, 0.1).name,
+            register_clip('test_once', frames[:3], 0.05, loop=False).name]
+
+
+@pytest.fixture
+def store(clips):
+    return EntityStore(clips, 1920, 1080, capacity=2)
+
+
+def add(store, x, y, clip=0):
+    return store._add(pos=(x, y), prev_pos=(x, y), clip=clip, anim_start=clock.ticks)
+
+
+def test_remove_keeps_insertion_order(store):
+    for i in range(7):                      # Kapasite 2'den büyür
+        add(store, i, 10 * i)
+    assert store.capacity >= 7
+    store.remove([1, 4, 5])
+    assert store.positions() == [(0, 0), (2, 20), (3, 30), (6, 60)]
+    store.remove([])
+    assert len(store) == 4
+    assert store.stats() == {'live': 4, 'free': store.capacity - 4, 'high_water': 7}
+    store.empty()
+    assert len(store) == 0
+
+
+def test_topleft_matches_pygame_rect(store):
+    values = [10.5, 11.5, -2.5, 3.49, 0.0, 7.51]
+    for x in values:
+        add(store, x, -x)
+    left, top = store.topleft()
+    for i, x in enumerate(values):
+        rect = pygame.Rect(0, 0, store.width, store.height)
+        rect.center = (x, -x)
+        assert (left[i], top[i]) == rect.topleft
+
+
+def test_frame_numbers_match_clips(store, clips):
+    loop, once = get_clip(clips[0]), get_clip(clips[1])
+    rows = [(0, 0), (1, 0), (0, 3), (1, 5)]  # (klip, kaç adım önce başladı)
+    for _ in range(10):
+        clock.advance(1 / 60)
+    for clip, age in rows:
+        row = add(store, 0, 0, clip)
+        store.anim_start[row] = clock.ticks - age
+    for _ in range(40):
+        expected = []
+        for clip, age in rows:
+            c = (loop, once)[clip]
+            offset = 0 if clip == 0 else len(loop)
+            expected.append(offset + c.frame_index(clock.elapsed(clock.ticks - age)))
+        np.testing.assert_array_equal(store.frame_numbers(), expected)
+        clock.advance(1 / 60)
+        rows = [(clip, age + 1) for clip, age in rows]
+    # Tek seferlik klip son karede kalır
+    assert store.frame_numbers()[1] == len(loop) + len(once) - 1
+
+
+def test_play_restarts_clip(store):
+    row = add(store, 0, 0, 0)
+    clock.advance(1 / 60)
+    store._play(np.array([row]), 1)
+    assert store.clip[row] == 1
+    assert store.anim_start[row] == clock.ticks
+
+
+def test_within_grid_matches_scan(store, monkeypatch):
+    rng = np.random.default_rng(3)
+    for x, y in rng.uniform(0, 1000, (300, 2)):
+        add(store, x, y)
+    store.remove([5, 17])
+    scan = store.within(400, 300, 250)
+    monkeypatch.setattr('entities.SPATIAL_GRID_MIN_ENTITIES', 0)
+    np.testing.assert_array_equal(store.within(400, 300, 250), scan)
+    # Hareketten sonra ızgara yeniden kurulur
+    store.pos[:store.count] += 100
+    store.moved()
+    pos = store.pos[:store.count]
+    expected = np.flatnonzero(np.hypot(pos[:, 0] - 400, pos[:, 1] - 300) <= 250)
+    np.testing.assert_array_equal(store.within(400, 300, 250), expected)
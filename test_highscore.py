@@ -0,0 +1,66 @@
+"""HighscoreStore - write-behind yazma, flush ve değişiklik bildirimi"""
+
+import json
+import pytest
+from highscore import HighscoreStore, read_file
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HighscoreStore(str(tmp_path / 'highscore.json'))
+    yield store
+    store.flush()
+
+
+def test_submit_writes_in_background(store):
+    assert store.get() == {'level': 0, 'date': None}   # Dosya yok
+    assert store.submit(5)
+    assert store.get()['level'] == 5                   # Bellekten, yazmayı beklemeden
+    assert store.flush()
+    assert read_file(store.path) == store.get()
+
+
+def test_only_new_records_from_level_one_count(store):
+    assert store.submit(5)
+    assert not store.submit(3)
+    assert not store.submit(9, start_level=4)
+    assert store.flush()
+    with open(store.path) as f:
+        assert json.load(f)['level'] == 5
+
+
+def test_last_value_wins(store):
+    for level in range(1, 30):
+        store.submit(level)
+    assert store.flush()
+    assert read_file(store.path)['level'] == 29
+    assert store.writes <= 29
+
+
+def test_reset_removes_file(store):
+    store.submit(7)
+    store.flush()
+    store.reset()
+    assert store.flush()
+    assert read_file(store.path) == {'level': 0, 'date': None}
+    assert store.get()['level'] == 0
+
+
+def test_subscribers_are_notified(store):
+    seen = []
+    store.subscribe(seen.append)
+    store.subscribe(seen.append)                       # İkinci kez eklenmez
+    store.submit(4)
+    store.submit(2)                                    # Rekor değil - bildirim yok
+    store.unsubscribe(seen.append)
+    store.submit(6)
+    assert [data['level'] for data in seen] == [4]
+
+
+def test_set_path_reloads(store, tmp_path):
+    store.submit(8)
+    other = tmp_path / 'other.json'
+    other.write_text(json.dumps({'level': 3, 'date': None}))
+    store.set_path(str(other))
+    assert read_file(str(tmp_path / 'highscore.json'))['level'] == 8  # Bekleyen yazma eski dosyaya bitti
+    assert store.get()['level'] == 3
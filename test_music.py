@@ -0,0 +1,58 @@
+"""MusicController - intro/loop kuyruğu ve geçişler"""
+
+import array
+import time
+import pygame
+import pytest
+from music import MusicController
+
+
+def tone(seconds):
+    """Verilen uzunlukta sabit genlikli ses (mixer formatında)"""
+    frequency, size, channels = pygame.mixer.get_init()
+    return pygame.mixer.Sound(buffer=array.array('h', [1000] * (int(frequency * seconds) * channels)).tobytes())
+
+
+@pytest.fixture
+def music():
+    pygame.mixer.init(44100, -16, 2, 512)
+    controller = MusicController({}, 0, pygame.USEREVENT + 1)
+    controller.bank._sounds.update(intro=tone(0.3), loop=tone(1.0))
+    yield controller
+    controller.stop()
+    pygame.mixer.quit()
+
+
+def test_intro_then_loop(music):
+    assert music.play_with_intro('intro', 'loop')
+    channel = music.channels[music._current]
+    time.sleep(0.45)
+    assert channel.get_sound() is music.bank.get('loop')
+
+
+def test_fade_out_during_intro_drops_queued_loop(music):
+    music.play_with_intro('intro', 'loop')
+    channel = music.channels[music._current]
+    time.sleep(0.05)
+    music.fade_out(100)
+    time.sleep(0.45)
+    assert channel.get_sound() is not music.bank.get('loop')
+    assert not channel.get_busy()
+
+
+def test_stop_during_intro_drops_queued_loop(music):
+    music.play_with_intro('intro', 'loop')
+    time.sleep(0.05)
+    music.stop()
+    time.sleep(0.05)
+    assert not any(channel.get_busy() for channel in music.channels)
+
+
+def test_crossfade_during_intro_leaves_only_new_track(music):
+    music.play_with_intro('intro', 'loop')
+    old = music.channels[music._current]
+    time.sleep(0.05)
+    music.play('loop', fade_ms=100)
+    time.sleep(0.45)
+    assert not old.get_busy()
+    assert music.channels[music._current].get_busy()
@@ -0,0 +1,57 @@
+"""ObjectPool - nesnelerin yeniden kullanımı, reset ve istatistikler"""
+
+from pool import ObjectPool
+
+
+class Item:
+    def __init__(self):
+        self.value = None
+        self.resets = 0
+    
+    def activate(self, value):
+        self.value = value
+    
+    def reset(self):
+        self.value = None
+        self.resets += 1
+
+
+def test_prewarm_then_acquire_creates_nothing():
+    pool = ObjectPool(Item)
+    pool.prewarm(3)
+    assert pool.created == 3
+    items = [pool.acquire(i) for i in range(3)]
+    assert pool.created == 3
+    assert [item.value for item in items] == [0, 1, 2]
+    assert pool.stats() == {'live': 3, 'free': 0, 'high_water': 3}
+
+
+def test_release_resets_and_reuses():
+    pool = ObjectPool(Item)
+    item = pool.acquire('a')
+    pool.release(item)
+    assert item.value is None and item.resets == 1
+    assert pool.acquire('b') is item
+    assert item.value == 'b'
+    assert pool.created == 1
+
+
+def test_double_release_is_ignored():
+    pool = ObjectPool(Item)
+    item = pool.acquire(1)
+    pool.release(item)
+    pool.release(item)
+    assert item.resets == 1
+    assert pool.stats() == {'live': 0, 'free': 1, 'high_water': 1}
+
+
+def test_acquire_grows_past_prewarm():
+    pool = ObjectPool(Item)
+    pool.prewarm(2)
+    items = [pool.acquire(i) for i in range(5)]
+    assert pool.created == 5
+    for item in items:
+        pool.release(item)
+    pool.prewarm(4)                          # Boştakiler sayılır, yeni nesne oluşturulmaz
+    assert pool.created == 5
+    assert pool.stats() == {'live': 0, 'free': 5, 'high_water': 5}
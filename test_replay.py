@@ -0,0 +1,72 @@
+"""Replay - kayıt, dosya formatı ve birebir yeniden oynatma"""
+
+import random
+import pytest
+from settings import *
+from replay import Replay, ReplayRecorder, play_fast
+
+
+class ScriptedInput:
+    """Seed'li, tekrarlanabilir giriş (klavye yerine)"""
+    
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.bits = 0
+        self.ticks = 0
+    
+    def confirm(self):
+        pass
+    
+    def poll(self):
+        self.ticks += 1
+        if self.ticks % 20 == 0:
+            self.bits = self.rng.choice([0, INPUT_UP, INPUT_DOWN, INPUT_LEFT, INPUT_RIGHT,
+                                         INPUT_UP | INPUT_LEFT, INPUT_DOWN | INPUT_RIGHT])
+        return self.bits | (INPUT_CONFIRM if self.ticks % 7 == 0 else 0)
+
+
+@pytest.fixture(scope='module')
+def engine():
+    from headless import HeadlessEngine
+    return HeadlessEngine((1280, 720))
+
+
+def record(engine, seed, level, ticks):
+    """Oyunu kaydederek oynat, (Replay, son checksum) döndür"""
+    from states import PlayingState
+    recorder = ReplayRecorder(ScriptedInput(seed), seed, level, engine.screen.get_size())
+    state = PlayingState(engine, level, seed, recorder)
+    state.replay_saved = True  # Oyuncu ölünce replays/ klasörüne dosya yazılmasın
+    engine.change_state(state)
+    for _ in range(ticks):
+        state.update(engine.sim_dt)
+        if state.game_over:
+            break
+    checksum = state.simulation_checksum()
+    return recorder.to_replay(checksum), checksum
+
+
+def test_file_round_trip(tmp_path):
+    replay = Replay(1234567890123, 42, (1280, 720), SIMULATION_HZ, bytes(range(200)), 0xDEADBEEF)
+    path = tmp_path / 'oyun.bbr'
+    replay.save(path)
+    loaded = Replay.load(path)
+    assert (loaded.seed, loaded.start_level, loaded.screen_size, loaded.sim_hz, loaded.inputs, loaded.checksum) == \
+           (replay.seed, replay.start_level, replay.screen_size, replay.sim_hz, replay.inputs, replay.checksum)
+
+
+def test_corrupt_file_is_rejected(tmp_path):
+    path = tmp_path / 'bozuk.bbr'
+    path.write_bytes(b'XXXX' + bytes(40))
+    with pytest.raises(ValueError):
+        Replay.load(path)
+
+
+@pytest.mark.parametrize('seed, level', [(1, 1), (7, 60)])
+def test_playback_matches_recorded_checksum(engine, tmp_path, seed, level):
+    replay, checksum = record(engine, seed, level, 1500)
+    path = tmp_path / 'oyun.bbr'
+    replay.save(path)
+    matched, ticks, _, _ = play_fast(path)
+    assert matched
+    assert ticks == len(replay.inputs)
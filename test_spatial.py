@@ -0,0 +1,64 @@
+"""SpatialGrid - sorgu sonuçları kaba kuvvet taramayla aynı olmalı"""
+
+import numpy as np
+import pytest
+from spatial import SpatialGrid
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(7)
+    # Negatif koordinatlar ve hücre sınırına denk gelen noktalar da olsun
+    x = np.concatenate([rng.uniform(-300, 2200, 500), [0.0, 128.0, 256.0, -128.0]])
+    y = np.concatenate([rng.uniform(-300, 1400, 500), [0.0, 128.0, 128.0, 0.0]])
+    return x, y
+
+
+@pytest.fixture
+def grid(points):
+    grid = SpatialGrid(128)
+    grid.update(*points)
+    return grid
+
+
+def test_query_radius_matches_brute_force(grid, points):
+    x, y = points
+    for cx, cy, radius in [(100, 100, 50), (0, 0, 128), (1000, 500, 400), (-500, -500, 100), (500, 500, 5000)]:
+        expected = np.flatnonzero(np.sqrt((x - cx) ** 2 + (y - cy) ** 2) <= radius)
+        np.testing.assert_array_equal(grid.query_radius(cx, cy, radius), expected)
+
+
+def test_query_rect_matches_brute_force(grid, points):
+    x, y = points
+    for left, top, right, bottom in [(0, 0, 128, 128), (-1000, -1000, 5000, 5000), (300, 200, 310, 900)]:
+        expected = np.flatnonzero((x >= left) & (x <= right) & (y >= top) & (y <= bottom))
+        np.testing.assert_array_equal(grid.query_rect(left, top, right, bottom), expected)
+
+
+def test_nearest_matches_brute_force(grid, points):
+    x, y = points
+    for cx, cy, k in [(100, 100, 1), (1000, 500, 5), (-900, 3000, 3), (0, 0, len(x) + 10)]:
+        distance = np.sqrt((x - cx) ** 2 + (y - cy) ** 2)
+        expected = np.argsort(distance, kind='stable')[:k]
+        np.testing.assert_array_equal(grid.nearest(cx, cy, k), expected)
+
+
+def test_nearest_respects_max_radius(grid, points):
+    x, y = points
+    distance = np.sqrt((x - 1000) ** 2 + (y - 500) ** 2)
+    expected = np.argsort(distance, kind='stable')
+    expected = expected[distance[expected] <= 150][:50]
+    np.testing.assert_array_equal(grid.nearest(1000, 500, 50, max_radius=150), expected)
+
+
+def test_empty_grid():
+    grid = SpatialGrid(64)
+    grid.update([], [])
+    assert len(grid.query_radius(0, 0, 100)) == 0
+    assert len(grid.query_rect(0, 0, 10, 10)) == 0
+    assert len(grid.nearest(0, 0, 3)) == 0
+
+
+def test_inverted_rect_is_empty(grid):
+    assert len(grid.query_rect(500, 500, 100, 100)) == 0
+    assert len(grid.query_rect(100, 500, 900, 100)) == 0
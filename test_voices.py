@@ -0,0 +1,79 @@
+"""VoiceManager - kanal ataması ve bitiş olaylarının sayımı"""
+
+import array
+import pygame
+import pytest
+from voices import VoiceManager
+
+END_EVENT = pygame.USEREVENT + 2
+
+
+@pytest.fixture
+def sound():
+    pygame.mixer.init(44100, -16, 2, 512)
+    yield pygame.mixer.Sound(buffer=array.array('h', [1000] * 44100 * 2).tobytes())  # 1 sn
+    pygame.mixer.quit()
+
+
+@pytest.fixture
+def voices(sound):
+    manager = VoiceManager({'effects': 2, 'ui': 1}, END_EVENT)
+    yield manager
+    manager.stop_all()
+
+
+def end(manager, index):
+    """Kanalın bitiş olayını gönder (gerçek olay kuyruğu beklenmez)"""
+    manager.handle_end(pygame.event.Event(END_EVENT, code=index))
+
+
+def test_end_event_frees_channel(voices, sound):
+    index = voices.play('hit', sound, 'effects')
+    assert voices.stats()['categories']['effects']['active'] == 1
+    end(voices, index)
+    assert voices.stats()['active'] == 0
+
+
+def test_restart_ignores_end_event_of_stopped_voice(voices, sound):
+    first = voices.play('hit', sound, 'effects', max_voices=1)
+    second = voices.play('hit', sound, 'effects', max_voices=1)
+    assert voices.stats()['restarts'] == 1
+    assert voices.stats()['active'] == 1
+    # Durdurulan ilk sesin bitiş olayı yeni sesi boşaltmamalı (kanal aynı olabilir)
+    end(voices, first)
+    assert voices.stats()['active'] == 1
+    end(voices, second)
+    assert voices.stats()['active'] == 0
+
+
+def test_priority_steal_and_drop(voices, sound):
+    low = voices.play('a', sound, 'effects', priority=0)
+    voices.play('b', sound, 'effects', priority=0)
+    # Dolu kategoride yüksek öncelik en eski düşük öncelikli sesi susturur
+    stolen = voices.play('c', sound, 'effects', priority=1)
+    assert stolen == low
+    assert voices.stats()['steals'] == 1
+    # Daha düşük öncelikli ses çalınamaz
+    voices.play('d', sound, 'effects', priority=1)
+    assert voices.play('e', sound, 'effects', priority=0) is None
+    assert voices.stats()['dropped'] == 1
+    assert voices.stats()['categories']['effects']['peak'] == 2
+
+
+def test_categories_do_not_share_channels(voices, sound):
+    voices.play('a', sound, 'effects')
+    voices.play('b', sound, 'effects')
+    assert voices.play('click', sound, 'ui') is not None
+    assert voices.stats()['categories']['ui']['active'] == 1
+
+
+def test_stop_all_ignores_pending_end_events(voices, sound):
+    indices = [voices.play(name, sound, 'effects') for name in ('a', 'b')]
+    voices.stop_all()
+    assert voices.stats()['active'] == 0
+    index = voices.play('c', sound, 'effects')
+    for stopped in indices:
+        end(voices, stopped)
+    assert voices.stats()['active'] == 1
+    end(voices, index)
+    assert voices.stats()['active'] == 0
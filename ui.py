@@ -4,7 +4,7 @@ Butonlar gibi yeniden kullanılabilir UI elemanları
 """
 
 import pygame
-from engine import Audio
+from engine import Assets, Audio
 from settings import *
 
 
@@ -26,12 +26,9 @@ class ImageButton:
         self.rect = pygame.Rect(x, y, width, height)
         self.is_hovered = False
         
-        # Görselleri yükle ve ölçekle (convert_alpha ile performans artışı)
-        img = pygame.image.load(image_path).convert_alpha()
-        self.image = pygame.transform.scale(img, (width, height))
-        
-        hover_img = pygame.image.load(hover_image_path).convert_alpha()
-        self.hover_image = pygame.transform.scale(hover_img, (width, height))
+        # Görselleri yükle ve ölçekle (Assets önbelleğinden)
+        self.image = Assets.load_image(image_path, (width, height))
+        self.hover_image = Assets.load_image(hover_image_path, (width, height))
         
     def draw(self, screen):
         """
@@ -93,25 +90,28 @@ class VolumeControl:
         
         self.is_hovered = False
     
+    ICON_NAMES = ['volume_full', 'volume_medium', 'volume_mute',
+                  'volume_full_h', 'volume_medium_h', 'volume_mute_h']
+    
+    @classmethod
+    def required_assets(cls):
+        """Kullanılan görseller (ön yükleme için)"""
+        size = (VOLUME_ICON_SIZE, VOLUME_ICON_SIZE)
+        return [('load_image', f'assets/{name}.png', size) for name in cls.ICON_NAMES]
+    
     def _load_icons(self):
         """İkon resimlerini yükle ve ölçekle (normal ve hover versiyonları)"""
         size = (self.size, self.size)
         
         # Normal resimleri yükle ve ölçekle
-        self.icon_full = pygame.transform.scale(
-            pygame.image.load('assets/volume_full.png').convert_alpha(), size)
-        self.icon_medium = pygame.transform.scale(
-            pygame.image.load('assets/volume_medium.png').convert_alpha(), size)
-        self.icon_mute = pygame.transform.scale(
-            pygame.image.load('assets/volume_mute.png').convert_alpha(), size)
+        self.icon_full = Assets.load_image('assets/volume_full.png', size)
+        self.icon_medium = Assets.load_image('assets/volume_medium.png', size)
+        self.icon_mute = Assets.load_image('assets/volume_mute.png', size)
         
         # Hover resimlerini yükle ve ölçekle
-        self.icon_full_h = pygame.transform.scale(
-            pygame.image.load('assets/volume_full_h.png').convert_alpha(), size)
-        self.icon_medium_h = pygame.transform.scale(
-            pygame.image.load('assets/volume_medium_h.png').convert_alpha(), size)
-        self.icon_mute_h = pygame.transform.scale(
-            pygame.image.load('assets/volume_mute_h.png').convert_alpha(), size)
+        self.icon_full_h = Assets.load_image('assets/volume_full_h.png', size)
+        self.icon_medium_h = Assets.load_image('assets/volume_medium_h.png', size)
+        self.icon_mute_h = Assets.load_image('assets/volume_mute_h.png', size)
     
     def _get_current_icon(self):
         """Ses seviyesine ve hover durumuna göre uygun ikonu döndür"""
@@ -176,10 +176,8 @@ class PauseMenu:
         self.screen_height = screen_height
         self.is_open = False
         
-        # Overlay (karartma)
-        self.overlay = pygame.Surface((screen_width, screen_height))
-        self.overlay.fill((0, 0, 0))
-        self.overlay.set_alpha(180)
+        # Overlay (karartma, ekranlar arasında paylaşılır)
+        self.overlay = Assets.get_overlay((screen_width, screen_height), 180)
         
         # Buton boyutları
         btn_width = int(screen_width * 0.2)
@@ -275,23 +273,23 @@ class PauseMenu:
 class HintButton:
     """Oyun ekranında sağ üst köşede hint butonu"""
     
+    ICON_PATH = 'assets/hint/hint_button.png'
+    
+    @classmethod
+    def required_assets(cls):
+        """Kullanılan görseller (ön yükleme için)"""
+        return [
+            ('load_smooth', cls.ICON_PATH, HINT_BUTTON_SIZE),
+            ('load_smooth', cls.ICON_PATH, HINT_BUTTON_SIZE, 10),
+        ]
+    
     def __init__(self, screen_width, screen_height):
-        # İkonu yükle - orijinal oranı koru
-        icon_original = pygame.image.load('assets/hint/hint_button.png').convert_alpha()
-        
-        # Yüksekliğe göre ölçekle, oranı koru
-        target_height = HINT_BUTTON_SIZE
-        original_w = icon_original.get_width()
-        original_h = icon_original.get_height()
-        ratio = original_w / original_h
-        target_width = int(target_height * ratio)
+        # Normal ve hover görselleri - yüksekliğe göre ölçeklenmiş, oran korunmuş (Assets önbelleğinden)
+        self.icon = Assets.load_smooth(self.ICON_PATH, HINT_BUTTON_SIZE)
+        self.icon_hover = Assets.load_smooth(self.ICON_PATH, HINT_BUTTON_SIZE, 10)
         
-        # Normal ve hover görsellerini önceden oluştur (cache)
-        self.icon = pygame.transform.smoothscale(icon_original, (target_width, target_height))
-        self.icon_hover = pygame.transform.smoothscale(icon_original, (target_width + 10, target_height + 10))
-        
-        self.width = target_width
-        self.height = target_height
+        self.width = self.icon.get_width()
+        self.height = self.icon.get_height()
         
         # Sağ üst köşede konumlandır
         self.x = screen_width - self.width - HINT_BUTTON_PADDING_RIGHT
@@ -338,46 +336,44 @@ class HintPopup:
         {'image': 'hint_speed_debuff.png', 'title': 'HIZ AZALIŞ', 'subtitle': 'Dikkat! Yavaşlatır!'},
     ]
     
+    @classmethod
+    def required_assets(cls, screen_width, screen_height):
+        """Kullanılan görseller (ön yükleme için)"""
+        card_height = int(screen_height * HINT_CARD_HEIGHT_RATIO)
+        specs = [('load_to_height', f'assets/hint/{hint["image"]}', card_height) for hint in cls.HINTS]
+        for path in ['assets/hint/button_hint_next.png', 'assets/hint/button_close.png']:
+            specs.append(('load_smooth', path, HINT_POPUP_BTN_SIZE))
+            specs.append(('load_smooth', path, HINT_POPUP_BTN_SIZE, 10))
+        return specs
+    
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.is_open = False
         self.current_index = 0
         
-        # Overlay'i önceden oluştur (performans için cache)
-        self.overlay = pygame.Surface((screen_width, screen_height))
-        self.overlay.fill((0, 0, 0))
-        self.overlay.set_alpha(180)
-        
-        # Hint kartlarını yükle
-        self.hint_images = []
-        for hint in self.HINTS:
-            img = pygame.image.load(f'assets/hint/{hint["image"]}')
-            # Kartı ekrana sığacak şekilde ölçekle
-            card_height = int(screen_height * HINT_CARD_HEIGHT_RATIO)
-            ratio = img.get_width() / img.get_height()
-            card_width = int(card_height * ratio)
-            img = pygame.transform.scale(img, (card_width, card_height))
-            self.hint_images.append(img)
-        
-        # Butonları yükle - orijinal oranlarını koru
+        # Overlay (Assets önbelleğinden, ekranlar arasında paylaşılır)
+        self.overlay = Assets.get_overlay((screen_width, screen_height), 180)
+        
+        # Hint kartlarını yükle (ekrana sığacak şekilde ölçeklenmiş, Assets önbelleğinden)
+        card_height = int(screen_height * HINT_CARD_HEIGHT_RATIO)
+        self.hint_images = [
+            Assets.load_to_height(f'assets/hint/{hint["image"]}', card_height)
+            for hint in self.HINTS
+        ]
+        
+        # Butonları yükle - orijinal oranlarını koru (Assets önbelleğinden)
         target_height = HINT_POPUP_BTN_SIZE
         
-        # Next butonu - normal ve hover cache
-        btn_next_original = pygame.image.load('assets/hint/button_hint_next.png').convert_alpha()
-        next_ratio = btn_next_original.get_width() / btn_next_original.get_height()
-        self.btn_next_width = int(target_height * next_ratio)
-        self.btn_next_height = target_height
-        self.btn_next = pygame.transform.smoothscale(btn_next_original, (self.btn_next_width, self.btn_next_height))
-        self.btn_next_hover = pygame.transform.smoothscale(btn_next_original, (self.btn_next_width + 10, self.btn_next_height + 10))
-        
-        # Close butonu - normal ve hover cache
-        btn_close_original = pygame.image.load('assets/hint/button_close.png').convert_alpha()
-        close_ratio = btn_close_original.get_width() / btn_close_original.get_height()
-        self.btn_close_width = int(target_height * close_ratio)
-        self.btn_close_height = target_height
-        self.btn_close = pygame.transform.smoothscale(btn_close_original, (self.btn_close_width, self.btn_close_height))
-        self.btn_close_hover = pygame.transform.smoothscale(btn_close_original, (self.btn_close_width + 10, self.btn_close_height + 10))
+        # Next butonu - normal ve hover
+        self.btn_next = Assets.load_smooth('assets/hint/button_hint_next.png', target_height)
+        self.btn_next_hover = Assets.load_smooth('assets/hint/button_hint_next.png', target_height, 10)
+        self.btn_next_width, self.btn_next_height = self.btn_next.get_size()
+        
+        # Close butonu - normal ve hover
+        self.btn_close = Assets.load_smooth('assets/hint/button_close.png', target_height)
+        self.btn_close_hover = Assets.load_smooth('assets/hint/button_close.png', target_height, 10)
+        self.btn_close_width, self.btn_close_height = self.btn_close.get_size()
         
         # Hover durumları
         self.next_hovered = False
@@ -458,7 +454,7 @@ class HintPopup:
         
         # Sayfa göstergesi (cache'lenmiş font)
         page_text = f"{self.current_index + 1} / {len(self.HINTS)}"
-        text_surf = self.page_font.render(page_text, True, WHITE)
+        text_surf = Assets.render_text(self.page_font, page_text, WHITE)
         text_x = (self.screen_width - text_surf.get_width()) // 2
         text_y = self.close_rect.y + self.btn_close_height + 20
         screen.blit(text_surf, (text_x, text_y))
@@ -551,10 +547,7 @@ class LevelSelector:
             return
         
         # Karanlık overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(150)
-        screen.blit(overlay, (0, 0))
+        screen.blit(Assets.get_overlay((self.screen_width, self.screen_height), 150), (0, 0))
         
         # Dialog kutusu
         dialog_width = 400
@@ -566,7 +559,7 @@ class LevelSelector:
         pygame.draw.rect(screen, (200, 200, 200), dialog_rect, 3)
         
         # Başlık
-        title = self.label_font.render("Hangi leveldan başlayalım?", True, WHITE)
+        title = Assets.render_text(self.label_font, "Hangi leveldan başlayalım?", WHITE)
         title_rect = title.get_rect(center=(self.screen_width // 2, dialog_rect.top + 30))
         screen.blit(title, title_rect)
         
@@ -575,14 +568,14 @@ class LevelSelector:
         pygame.draw.rect(screen, (0, 0, 0), self.input_rect, 2)
         
         # Boş olduğunda boş göster, değilse girilen değeri göster
-        input_text = self.font.render(self.level_input, True, BLACK)
+        input_text = Assets.render_text(self.font, self.level_input, BLACK)
         screen.blit(input_text, (self.input_rect.x + 10, self.input_rect.y + 8))
         
         # OK butonu
         btn_color = (100, 200, 100) if self.ok_hovered else (70, 170, 70)
         pygame.draw.rect(screen, btn_color, self.ok_rect)
         pygame.draw.rect(screen, WHITE, self.ok_rect, 2)
-        ok_text = self.label_font.render("BAŞLA", True, WHITE)
+        ok_text = Assets.render_text(self.label_font, "BAŞLA", WHITE)
         ok_text_rect = ok_text.get_rect(center=self.ok_rect.center)
         screen.blit(ok_text, ok_text_rect)
         
@@ -590,7 +583,7 @@ class LevelSelector:
         btn_color = (200, 100, 100) if self.cancel_hovered else (170, 70, 70)
         pygame.draw.rect(screen, btn_color, self.cancel_rect)
         pygame.draw.rect(screen, WHITE, self.cancel_rect, 2)
-        cancel_text = self.label_font.render("İPTAL", True, WHITE)
+        cancel_text = Assets.render_text(self.label_font, "İPTAL", WHITE)
         cancel_text_rect = cancel_text.get_rect(center=self.cancel_rect.center)
         screen.blit(cancel_text, cancel_text_rect)
     
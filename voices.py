@@ -0,0 +1,175 @@
+"""
+Bıyık Bey'in Çilesi - Ses Kanalı Yöneticisi
+Mixer kanallarını kategorilere ayırır; her ses kendi kategorisinin kanallarında çalar
+
+Kurallar:
+    - Her kategorinin ayrılmış kanalları vardır (settings.VOICE_CHANNELS)
+    - Her sesin aynı anda en fazla kaç örneği çalabileceği sınırlıdır; sınırdaysa en eski örnek yeniden başlar
+    - Kategorinin kanalları doluysa önceliği en düşük (eşitse en eski) ses susturulur;
+      çalan tüm sesler yeni sesten önemliyse yeni ses çalınmaz
+    - Biten kanallar kanal bitiş olayıyla (Channel.set_endevent) serbest kalır, get_busy() taranmaz
+"""
+
+from collections import deque
+import pygame
+
+
+class VoiceManager:
+    """Kanal ataması, ses başına sınır ve öncelikli kanal çalma"""
+    
+    def __init__(self, categories, end_event):
+        """
+        Parametreler:
+            categories: {kategori: ayrılmış kanal sayısı}
+            end_event: Kanal bitince gönderilecek olay tipi (event.code = kanal numarası)
+        """
+        total = sum(categories.values())
+        pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)  # Sound.play() kanal seçmesin, tüm kanallar burada yönetilir
+        
+        self.channels = [pygame.mixer.Channel(i) for i in range(total)]
+        for channel in self.channels:
+            channel.set_endevent(end_event)
+        
+        # Kategori -> kanal numaraları, boş kanallar
+        self._category_channels = {}
+        self._free = {}
+        self._category_of = []
+        index = 0
+        for category, count in categories.items():
+            indices = list(range(index, index + count))
+            self._category_channels[category] = indices
+            self._free[category] = indices[::-1]  # pop() küçük numaradan başlasın
+            self._category_of += [category] * count
+            index += count
+        
+        # Kanal başına çalan ses
+        self._sound = [None] * total     # Ses adı (boşsa None)
+        self._priority = [0] * total
+        self._started = [0] * total      # Başlama sırası (eski/yeni karşılaştırması)
+        self._ignore_end = [0] * total   # Bizim durdurduğumuz kanalların gelecek bitiş olayları
+        self._sequence = 0
+        
+        # Ses adı -> çalan kanallar (eskiden yeniye)
+        self._voices = {}
+        
+        # İstatistikler
+        self.plays = 0
+        self.restarts = 0
+        self.steals = 0
+        self.dropped = 0
+        self._peak = {category: 0 for category in categories}
+    
+    def play(self, name, sound, category, priority=0, max_voices=1, loops=0, volume=1.0):
+        """
+        Sesi kategorisinin bir kanalında çal
+        
+        Döndürür:
+            Kanal numarası, ses çalınamadıysa None
+        """
+        voices = self._voices.setdefault(name, deque())
+        if len(voices) >= max_voices:
+            # Ses sınırında - en eski örneği yeniden başlat
+            self._stop_voice(voices[0])
+            self.restarts += 1
+        
+        free = self._free[category]
+        if not free:
+            victim = self._victim(category, priority)
+            if victim is None:
+                self.dropped += 1
+                return None
+            self._stop_voice(victim)
+            self.steals += 1
+        
+        index = free.pop()
+        channel = self.channels[index]
+        channel.set_volume(volume)
+        channel.play(sound, loops)
+        
+        self._sequence += 1
+        self._sound[index] = name
+        self._priority[index] = priority
+        self._started[index] = self._sequence
+        voices.append(index)
+        
+        self.plays += 1
+        active = len(self._category_channels[category]) - len(free)
+        if active > self._peak[category]:
+            self._peak[category] = active
+        return index
+    
+    def _victim(self, category, priority):
+        """Kategoride susturulabilecek kanal: önceliği en düşük, eşitse en eski"""
+        victim = None
+        for index in self._category_channels[category]:
+            if self._priority[index] > priority:
+                continue
+            if victim is None or (self._priority[index], self._started[index]) < \
+                    (self._priority[victim], self._started[victim]):
+                victim = index
+        return victim
+    
+    def _stop_voice(self, index):
+        """Kanalı durdur ve boşalt"""
+        if self._sound[index] is None:
+            return
+        # Kanalın tek bir bitiş olayı gelecek: durdurmanın veya kendiliğinden bitip
+        # henüz işlenmemiş olanın - o olay kanala atanacak yeni sesi boşaltmasın
+        self._ignore_end[index] += 1
+        self.channels[index].stop()
+        self._release(index)
+    
+    def _release(self, index):
+        name = self._sound[index]
+        if name is None:
+            return
+        self._voices[name].remove(index)
+        self._sound[index] = None
+        self._free[self._category_of[index]].append(index)
+    
+    def handle_end(self, event):
+        """Kanal bitiş olayını işle"""
+        index = event.code
+        if not 0 <= index < len(self.channels):
+            return
+        if self._ignore_end[index]:
+            self._ignore_end[index] -= 1
+            return
+        self._release(index)
+    
+    def stop_sound(self, name):
+        """Sesin çalan tüm örneklerini durdur"""
+        voices = self._voices.get(name)
+        while voices:
+            self._stop_voice(voices[0])
+    
+    def stop_all(self):
+        """Tüm kanalları durdur"""
+        for index in range(len(self.channels)):
+            self._stop_voice(index)
+    
+    def set_volume(self, volume):
+        """Çalan kanalların ses seviyesini değiştir"""
+        for index, name in enumerate(self._sound):
+            if name is not None:
+                self.channels[index].set_volume(volume)
+    
+    def stats(self):
+        """Kanal kullanım istatistikleri"""
+        categories = {}
+        for category, indices in self._category_channels.items():
+            categories[category] = {
+                'channels': len(indices),
+                'active': len(indices) - len(self._free[category]),
+                'peak': self._peak[category],
+            }
+        return {
+            'channels': len(self.channels),
+            'active': sum(c['active'] for c in categories.values()),
+            'plays': self.plays,
+            'restarts': self.restarts,
+            'steals': self.steals,
+            'dropped': self.dropped,
+            'categories': categories,
+        }